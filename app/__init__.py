@@ -1,9 +1,6 @@
 import os
 import logging
-from flask import Flask, render_template
-from flask_flatpages import FlatPages
-from app.services.config_service import ConfigService
-from app.services.markdown_service import MarkdownService
+from flask import Flask, render_template, url_for
 from app.models.exceptions import PostError, PostNotFoundError, PostMetadataError
 
 # Set up logging
@@ -29,7 +26,7 @@ def create_app(config_name='default'):
         Flask: The configured Flask application
     """
     # Import necessary modules
-    from app.repositories.post_repository import PostRepository
+    from app.services.service_factory import ServiceFactory
     from app.utils.logger import setup_logger
     
     # Create new Flask app instance
@@ -38,37 +35,39 @@ def create_app(config_name='default'):
                 static_folder=os.path.join(app_dir, 'static'),
                 static_url_path='/static')
     
-    # Load configuration
-    app.config.from_object(ConfigService())
-    
     # Set up logging
     setup_logger(app)
     
-    # Create config service
-    config_service = ConfigService()
-    
-    # Create markdown service
-    markdown_service = MarkdownService(config_service)
-    
-    # Configure FlatPages with custom HTML renderer
-    app.config['FLATPAGES_HTML_RENDERER'] = markdown_service._render_markdown
-    app.config['FLATPAGES_ROOT'] = os.path.join(app_dir, 'posts')
-    pages = FlatPages(app)
+    # Services are shared with the static builder and scripts in this process
+    config_service = ServiceFactory.get_config_service()
     
-    # Create post repository
-    post_repository = PostRepository(
-        posts_dir=os.path.join(app_dir, 'posts'),
-        render_markdown_func=markdown_service._render_markdown
-    )
+    # The corpus is loaded once, on the first request that needs it; routes,
+    # the builder and FlatPages-style access (app.pages) all read from the
+    # same repository
+    post_service = ServiceFactory.get_post_service()
+    post_repository = post_service.repository
     
     # Store post_repository in app context
+    app.post_service = post_service
     app.post_repository = post_repository
+    app.pages = post_repository
+    app.config['POSTS_PER_PAGE'] = config_service.posts_per_page
     
-    # Register blueprints and error handlers
+    # Full-text search index, filled from the post corpus on first search
+    app.search_service = ServiceFactory.get_search_service()
+    
+    # Register blueprints, error handlers and the fingerprinted static route
     register_blueprints(app)
     register_error_handlers(app)
+    register_static_route(app)
+    
+    # Link static files by content-hashed name so browsers can cache them for good
+    static_service = ServiceFactory.get_static_service()
     
-    # Add context processor for date formatting
+    def static_url(filename):
+        return url_for('static', filename=static_service.asset_name(filename))
+    
+    # Add context processor for date formatting and static URLs
     @app.context_processor
     def utility_processor():
         def format_date(date):
@@ -79,19 +78,9 @@ def create_app(config_name='default'):
                 except ValueError:
                     return date
             return date.strftime('%B %d, %Y')
-        return dict(format_date=format_date)
-    
-    # Log startup information
-    app.logger.info(f"Posts directory at startup: {app.config['FLATPAGES_ROOT']}")
-    app.logger.info(f"Directory exists at startup: {os.path.exists(app.config['FLATPAGES_ROOT'])}")
+        return dict(format_date=format_date, static_url=static_url)
     
-    try:
-        all_posts = post_repository.get_all_posts()
-        app.logger.info(f"Number of valid posts at startup: {len(all_posts)}")
-        for post in all_posts:
-            app.logger.info(f"Post at startup: {post.path} - {post.title} - {post.date}")
-    except Exception as e:
-        app.logger.error(f"Error loading posts at startup: {e}")
+    app.logger.info(f"Posts directory: {post_service.posts_dir}")
     
     return app
 
@@ -124,5 +113,42 @@ def register_error_handlers(app):
                               title='Post Error', 
                               error=str(error)), 500
 
+def register_static_route(app):
+    """Serve fingerprinted static URLs with far-future cache headers.
+    
+    static_url() links to names like css/style.1a2b3c4d5e.css, whose
+    contents never change, so they are sent as immutable and cached for a
+    year; a stylesheet comes with its url() references fingerprinted too.
+    Clients accepting gzip get a copy compressed once per fingerprint.
+    Other static URLs are served as before.
+    """
+    from flask import request, send_from_directory
+    from app.services.service_factory import ServiceFactory
+    from app.utils.compress import accepts_gzip, is_compressible
+    static_service = ServiceFactory.get_static_service()
+    
+    def static(filename):
+        file_path = static_service.resolve_asset(filename)
+        if file_path is None:
+            return app.send_static_file(filename)
+        compressed = None
+        if accepts_gzip(request.headers.get('Accept-Encoding')):
+            compressed = static_service.compressed_asset(file_path)
+        if compressed is not None:
+            response = app.response_class(compressed)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            content = static_service.asset_content(file_path)
+            if content is None:
+                response = send_from_directory(app.static_folder, file_path)
+            else:
+                response = app.response_class(content)
+        if is_compressible(file_path):
+            response.vary.add('Accept-Encoding')
+        response.headers.update(static_service.get_cache_headers(filename))
+        return response
+    
+    app.view_functions['static'] = static
+
 # Export the create_app function
 __all__ = ['create_app']
@@ -1,42 +1,173 @@
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from datetime import datetime
 import os
 import re
-import yaml
+import sys
 import logging
 from app.models.exceptions import PostError
+from app.utils.front_matter import read_front_matter
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _intern_all(values) -> List[str]:
+    """Intern taxonomy strings so every post shares one copy of each name."""
+    if not isinstance(values, list):
+        return []
+    return [sys.intern(v) if isinstance(v, str) else v for v in values]
+
 class Post:
     """
     Represents a blog post with its metadata and content.
     
+    The HTML content is rendered on first access and then memoized, so
+    listing pages that only use title, date, path and categories never
+    pay for Markdown rendering.
+    
+    Posts use __slots__ and keep only the front matter keys that are not
+    already attributes, which keeps large corpora compact in memory.
+    Category and tag names are interned.
+    
     Attributes:
         path (str): The unique path identifier for the post
         title (str): The title of the post
         date (datetime): The publication date of the post
         categories (List[str]): Categories the post belongs to
-        content (str): The raw markdown content
-        html_content (str): The rendered HTML content
-        metadata (Dict[str, Any]): Additional metadata from front matter
+        tags (List[str]): Tags attached to the post
+        content (Optional[str]): The raw markdown content, or None if it is
+            not held in memory
+        metadata (Dict[str, Any]): All metadata from front matter
+        source_path (Optional[str]): The file the post was loaded from
+        render_markdown_func (callable, optional): Function used to render
+            html_content on first access
+        keep_content (bool): Keep the raw markdown after rendering; when
+            False it is dropped and read back from source_path if needed
     """
-    path: str
-    title: str
-    date: datetime
-    categories: List[str]
-    content: str = ""
-    html_content: str = ""
-    metadata: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        """Initialize default values after dataclass initialization."""
-        if self.metadata is None:
-            self.metadata = {}
-        if not isinstance(self.categories, list):
-            self.categories = []
+    
+    __slots__ = ('path', 'title', 'date', 'categories', 'tags', 'content',
+                 'source_path', 'render_markdown_func', 'keep_content',
+                 '_extra', '_html_content')
+    
+    def __init__(self, path: str, title: str, date: datetime, categories: List[str],
+                 content: Optional[str] = "", metadata: Optional[Dict[str, Any]] = None,
+                 source_path: Optional[str] = None,
+                 render_markdown_func: Optional[Callable[[str], str]] = None,
+                 tags: Optional[List[str]] = None, keep_content: bool = True):
+        self.path = path
+        self.title = title
+        self.date = date
+        self.categories = _intern_all(categories)
+        self.content = content
+        self.source_path = source_path
+        self.render_markdown_func = render_markdown_func
+        self.keep_content = keep_content
+        self._html_content: Optional[str] = None
+        self.metadata = metadata
+        if tags is None:
+            tags = (metadata or {}).get('tags', [])
+        self.tags = _intern_all(tags)
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Return all front matter metadata, rebuilt from the attributes.
+        
+        Returns:
+            Dict[str, Any]: The post metadata
+        """
+        metadata = {'title': self.title, 'date': self.date.strftime('%Y-%m-%d')}
+        metadata.update(self._extra)
+        return metadata
+    
+    @metadata.setter
+    def metadata(self, value: Optional[Dict[str, Any]]) -> None:
+        # Drop keys whose value can be rebuilt exactly from the attributes
+        extra = {}
+        for key, item in (value or {}).items():
+            if key == 'title' and item == self.title:
+                continue
+            if key == 'date' and item == self.date.strftime('%Y-%m-%d'):
+                continue
+            extra[sys.intern(key)] = item
+        self._extra = extra
+    
+    def __repr__(self) -> str:
+        return f"Post(path={self.path!r}, title={self.title!r}, date={self.date!r})"
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Post):
+            return NotImplemented
+        return (self.path, self.title, self.date, self.categories, self.content,
+                self.metadata, self.source_path) == \
+               (other.path, other.title, other.date, other.categories, other.content,
+                other.metadata, other.source_path)
+    
+    __hash__ = None
+    
+    @property
+    def html_content(self) -> Optional[str]:
+        """
+        Return the rendered HTML content, rendering it on first access.
+        
+        Returns:
+            Optional[str]: The rendered HTML, or None if no renderer is set
+        """
+        if self._html_content is None and self.render_markdown_func is not None:
+            self.html_content = self.render_markdown_func(self.load_content())
+        return self._html_content
+    
+    @html_content.setter
+    def html_content(self, value: Optional[str]) -> None:
+        self._html_content = value
+        if value is not None and not self.keep_content and self.source_path:
+            self.content = None
+    
+    @property
+    def rendered(self) -> bool:
+        """
+        Return whether the HTML content has been rendered already.
+        
+        Returns:
+            bool: True if html_content is available without rendering
+        """
+        return self._html_content is not None
+    
+    def load_content(self) -> str:
+        """
+        Return the raw markdown content, reading it from disk if the post
+        was loaded with only its front matter.
+        
+        Returns:
+            str: The raw markdown content
+            
+        Raises:
+            PostError: If the source file cannot be read
+        """
+        if self.content is not None:
+            return self.content
+        if not self.source_path:
+            return ""
+        _, body = self._read_post_file(self.source_path, with_body=True)
+        return body
+    
+    @property
+    def html(self) -> Optional[str]:
+        """
+        Return the rendered HTML content, like a Flask-FlatPages page.
+        
+        Returns:
+            Optional[str]: The rendered HTML
+        """
+        return self.html_content
+    
+    @property
+    def body(self) -> str:
+        """
+        Return the raw markdown content, like a Flask-FlatPages page.
+        
+        Returns:
+            str: The raw markdown content
+        """
+        return self.load_content()
     
     @property
     def meta(self) -> Dict[str, Any]:
@@ -52,14 +183,45 @@ class Post:
             'categories': self.categories
         }
     
+    @staticmethod
+    def _read_post_file(file_path: str, with_body: bool) -> Tuple[str, Optional[str]]:
+        """
+        Read the front matter, and optionally the body, of a post file.
+        
+        Args:
+            file_path (str): Path to the markdown file
+            with_body (bool): Also read the markdown body
+            
+        Returns:
+            Tuple[str, Optional[str]]: The front matter and the body (None
+            unless requested), both stripped
+            
+        Raises:
+            PostError: If the file cannot be read or has no front matter
+        """
+        try:
+            parts = read_front_matter(file_path, with_body=with_body)
+        except (IOError, UnicodeDecodeError) as e:
+            raise PostError(f"Error reading post file: {e}")
+        if parts is None:
+            raise PostError("Invalid post format: missing front matter")
+        body = parts.body.strip() if parts.body is not None else None
+        return parts.header.strip(), body
+    
     @classmethod
-    def from_file(cls, file_path: str, render_markdown_func=None) -> 'Post':
+    def from_file(cls, file_path: str, render_markdown_func=None, metadata_only: bool = False,
+                  keep_content: bool = True) -> 'Post':
         """
         Create a Post object from a markdown file.
         
         Args:
             file_path (str): Path to the markdown file
             render_markdown_func (callable, optional): Function to render markdown to HTML
+                when html_content is first accessed
+            metadata_only (bool): Read only the front matter, stopping at its
+                closing delimiter; the body is read from file_path if the HTML
+                is ever needed
+            keep_content (bool): Keep the markdown body once the HTML is rendered
             
         Returns:
             Post: A Post object
@@ -68,17 +230,8 @@ class Post:
             PostError: If there is an error reading or parsing the file
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Split front matter and content
-            parts = content.split('---', 2)
-            if len(parts) < 3:
-                raise PostError("Invalid post format: missing front matter")
-                
-            # Parse front matter
-            front_matter = parts[1].strip()
-            post_content = parts[2].strip()
+            # Read the front matter; the body is skipped in metadata-only mode
+            front_matter, post_content = cls._read_post_file(file_path, with_body=not metadata_only)
             
             # Parse metadata
             metadata = {}
@@ -120,20 +273,17 @@ class Post:
             except ValueError:
                 raise PostError("Invalid date format in front matter")
             
-            # Render markdown if function provided
-            html_content = None
-            if render_markdown_func:
-                html_content = render_markdown_func(post_content)
-            
-            # Create post object
+            # Create post object; HTML is rendered lazily on first access
             return cls(
                 title=title,
                 date=date,
                 path=path,
                 content=post_content,
-                html_content=html_content,
                 metadata=metadata,
-                categories=metadata.get('categories', [])
+                categories=metadata.get('categories', []),
+                source_path=file_path,
+                render_markdown_func=render_markdown_func,
+                keep_content=keep_content
             )
             
         except IOError as e:
@@ -0,0 +1,271 @@
+import math
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from app.models.post import Post
+
+def normalize_term(name: str) -> str:
+    """
+    Normalize a category or tag name for lookups.
+    
+    Matches the slugs used in category URLs, so "Open Hybrid Cloud",
+    "open hybrid cloud" and "open-hybrid-cloud" all resolve to one term.
+    
+    Args:
+        name (str): The category or tag name
+        
+    Returns:
+        str: The normalized name
+    """
+    return name.strip().lower().replace(' ', '-')
+
+class Pagination(NamedTuple):
+    """
+    One page of a date-sorted post list.
+    
+    Attributes:
+        items (Tuple[Post, ...]): The posts on this page, newest first
+        page (int): The page number, starting at 1
+        per_page (int): The maximum number of posts per page
+        total (int): The number of posts on all pages together
+    """
+    items: Tuple[Post, ...]
+    page: int
+    per_page: int
+    total: int
+    
+    @property
+    def pages(self) -> int:
+        """int: The number of pages, at least 1."""
+        return max(1, math.ceil(self.total / self.per_page))
+    
+    @property
+    def has_prev(self) -> bool:
+        """bool: Whether there is a page of newer posts."""
+        return self.page > 1
+    
+    @property
+    def has_next(self) -> bool:
+        """bool: Whether there is a page of older posts."""
+        return self.page < self.pages
+    
+    @property
+    def prev_num(self) -> Optional[int]:
+        """Optional[int]: The number of the page of newer posts."""
+        return self.page - 1 if self.has_prev else None
+    
+    @property
+    def next_num(self) -> Optional[int]:
+        """Optional[int]: The number of the page of older posts."""
+        return self.page + 1 if self.has_next else None
+
+def paginate(posts: Sequence[Post], page: int, per_page: int) -> Optional[Pagination]:
+    """
+    Slice one page out of a date-sorted post sequence.
+    
+    Only the posts on the requested page are touched, so the cost is
+    proportional to the page size rather than the corpus size.
+    
+    Args:
+        posts (Sequence[Post]): The posts, newest first
+        page (int): The page number, starting at 1
+        per_page (int): The maximum number of posts per page
+        
+    Returns:
+        Optional[Pagination]: The page, or None if the page number is out
+        of range. Page 1 always exists, even for an empty sequence.
+    """
+    per_page = max(1, per_page)
+    start = (page - 1) * per_page
+    if page < 1 or (page > 1 and start >= len(posts)):
+        return None
+    return Pagination(tuple(posts[start:start + per_page]), page, per_page, len(posts))
+
+class Taxonomy:
+    """
+    Inverted index from category or tag names to the posts using them.
+    
+    Each posting list is built in corpus order, so it is already sorted by
+    date (newest first), and its length doubles as the term's post count.
+    """
+    
+    __slots__ = ('_postings', '_names')
+    
+    def __init__(self, posts: Iterable[Post], attribute: str):
+        """
+        Build the taxonomy from date-sorted posts.
+        
+        Args:
+            posts (Iterable[Post]): The posts, newest first
+            attribute (str): The Post attribute holding the names, e.g. 'categories'
+        """
+        postings: Dict[str, List[Post]] = {}
+        self._names: Dict[str, str] = {}
+        for post in posts:
+            seen = set()
+            for name in getattr(post, attribute):
+                if not isinstance(name, str):
+                    continue
+                term = normalize_term(name)
+                if term in seen:
+                    continue
+                seen.add(term)
+                # The first spelling encountered becomes the display name
+                self._names.setdefault(term, name)
+                postings.setdefault(term, []).append(post)
+        self._postings: Dict[str, Tuple[Post, ...]] = {
+            term: tuple(term_posts) for term, term_posts in postings.items()
+        }
+    
+    def __len__(self) -> int:
+        return len(self._postings)
+    
+    def __contains__(self, name: str) -> bool:
+        return normalize_term(name) in self._postings
+    
+    def posts(self, name: str) -> Tuple[Post, ...]:
+        """
+        Get the posts filed under a name, newest first.
+        
+        Args:
+            name (str): The category or tag name, in any spelling
+            
+        Returns:
+            Tuple[Post, ...]: The matching posts
+        """
+        return self._postings.get(normalize_term(name), ())
+    
+    def page(self, name: str, page: int, per_page: int) -> Optional[Pagination]:
+        """
+        Get one page of the posts filed under a name.
+        
+        Args:
+            name (str): The category or tag name, in any spelling
+            page (int): The page number, starting at 1
+            per_page (int): The maximum number of posts per page
+            
+        Returns:
+            Optional[Pagination]: The page, or None if it is out of range
+        """
+        return paginate(self.posts(name), page, per_page)
+    
+    def count(self, name: str) -> int:
+        """
+        Get the number of posts filed under a name.
+        
+        Args:
+            name (str): The category or tag name, in any spelling
+            
+        Returns:
+            int: The number of matching posts
+        """
+        return len(self.posts(name))
+    
+    def names(self) -> List[str]:
+        """
+        Get the display names of all terms, sorted alphabetically.
+        
+        Returns:
+            List[str]: The term names
+        """
+        return sorted(self._names.values())
+    
+    def counts(self) -> Dict[str, int]:
+        """
+        Get the number of posts for every term, keyed by display name.
+        
+        Returns:
+            Dict[str, int]: Post counts, e.g. for a tag cloud
+        """
+        return {self._names[term]: len(term_posts) for term, term_posts in self._postings.items()}
+
+class PostIndex:
+    """
+    Immutable, indexed snapshot of the post corpus.
+
+    Posts are sorted by date (newest first) once at construction time,
+    and path lookups, next/previous links and the category and tag
+    indexes are precomputed so that reading a single post or a taxonomy
+    page never has to touch the rest of the corpus.
+    """
+
+    __slots__ = ('posts', 'by_path', 'categories', 'tags', '_next', '_prev')
+
+    def __init__(self, posts: Iterable[Post] = ()):
+        """
+        Build the index from an iterable of posts.
+
+        Args:
+            posts (Iterable[Post]): The posts making up the corpus
+        """
+        self.posts: Tuple[Post, ...] = tuple(sorted(posts, key=lambda p: p.date, reverse=True))
+
+        self.by_path: Dict[str, Post] = {}
+        for post in self.posts:
+            # Keep the newest post when two files resolve to the same path
+            self.by_path.setdefault(post.path, post)
+
+        # "Next" is the newer neighbour, "previous" the older one
+        self._next: Dict[str, Optional[Post]] = {}
+        self._prev: Dict[str, Optional[Post]] = {}
+        for i, post in enumerate(self.posts):
+            if post.path in self._next:
+                continue
+            self._next[post.path] = self.posts[i - 1] if i > 0 else None
+            self._prev[post.path] = self.posts[i + 1] if i < len(self.posts) - 1 else None
+
+        self.categories = Taxonomy(self.posts, 'categories')
+        self.tags = Taxonomy(self.posts, 'tags')
+
+    def __len__(self) -> int:
+        return len(self.posts)
+
+    def __iter__(self) -> Iterator[Post]:
+        return iter(self.posts)
+
+    def page(self, page: int, per_page: int) -> Optional[Pagination]:
+        """
+        Get one page of the corpus, newest posts first.
+
+        Args:
+            page (int): The page number, starting at 1
+            per_page (int): The maximum number of posts per page
+
+        Returns:
+            Optional[Pagination]: The page, or None if it is out of range
+        """
+        return paginate(self.posts, page, per_page)
+
+    def get(self, path: str) -> Optional[Post]:
+        """
+        Get a post by its path.
+
+        Args:
+            path (str): The path of the post
+
+        Returns:
+            Optional[Post]: The Post object if found, None otherwise
+        """
+        return self.by_path.get(path)
+
+    def next_post(self, path: str) -> Optional[Post]:
+        """
+        Get the post published after the given one.
+
+        Args:
+            path (str): The path of the current post
+
+        Returns:
+            Optional[Post]: The next Post object if found, None otherwise
+        """
+        return self._next.get(path)
+
+    def prev_post(self, path: str) -> Optional[Post]:
+        """
+        Get the post published before the given one.
+
+        Args:
+            path (str): The path of the current post
+
+        Returns:
+            Optional[Post]: The previous Post object if found, None otherwise
+        """
+        return self._prev.get(path)
@@ -1,60 +1,250 @@
 import os
+import time
 import logging
-from typing import List, Optional
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from app.models.post import Post
 from app.models.exceptions import PostError
+from app.repositories.post_index import Pagination, PostIndex
 
 logger = logging.getLogger(__name__)
 
+# (mtime_ns, size, inode) of a post file, used to detect changes without reading it
+FileSignature = Tuple[int, int, int]
+
+# Loads post files in the given order; each result is the Post or the PostError it raised
+PostLoader = Callable[[Sequence[str]], List[Union[Post, PostError]]]
+
 class PostRepository:
     """
     Repository for managing blog posts.
     
     This class handles the retrieval and management of blog posts
-    from the filesystem.
+    from the filesystem. The corpus is loaded once into an in-memory
+    PostIndex, so lookups by path and next/previous navigation do not
+    re-read or re-render any files. refresh() picks up edits on disk by
+    re-parsing only the files whose stat signature changed.
     """
     
-    def __init__(self, posts_dir: str, render_markdown_func=None):
+    def __init__(self, posts_dir: str, render_markdown_func=None,
+                 auto_reload: bool = False, check_interval: float = 1.0,
+                 metadata_only: bool = False, keep_content: bool = True,
+                 loader: Optional[PostLoader] = None):
         """
         Initialize the PostRepository.
         
         Args:
             posts_dir (str): Directory containing the markdown files
             render_markdown_func (callable, optional): Function to render markdown to HTML
+            auto_reload (bool): Check the posts directory for changes on access
+            check_interval (float): Minimum number of seconds between two change checks
+            metadata_only (bool): Keep only front matter in memory; post bodies are
+                read back from disk when their HTML is first rendered
+            keep_content (bool): Keep post bodies in memory after their HTML is rendered
+            loader (callable, optional): Replacement for the serial file loader,
+                e.g. one that spreads the work over several processes
         """
         self.posts_dir = posts_dir
         self.render_markdown_func = render_markdown_func
+        self.auto_reload = auto_reload
+        self.check_interval = check_interval
+        self.metadata_only = metadata_only
+        self.keep_content = keep_content
+        self.loader = loader or self._load_files
+        
+        # Readers only ever look at self._index; everything else is owned by
+        # whichever thread holds self._lock while refreshing.
+        self._index: Optional[PostIndex] = None
+        self._files: Dict[str, Tuple[FileSignature, Optional[Post]]] = {}
+        self._last_check = 0.0
+        self._lock = threading.Lock()
     
-    def get_all_posts(self) -> List[Post]:
+    def _scan(self) -> Dict[str, FileSignature]:
         """
-        Get all posts from the posts directory.
+        Stat every markdown file in the posts directory in a single pass.
         
         Returns:
-            List[Post]: A list of Post objects
+            Dict[str, FileSignature]: Signature of each post file, keyed by filename
         """
-        posts = []
-        
+        signatures = {}
         try:
-            # Get all markdown files in the posts directory
-            for filename in os.listdir(self.posts_dir):
-                if filename.endswith('.markdown'):
-                    file_path = os.path.join(self.posts_dir, filename)
-                    
-                    try:
-                        # Create post from file
-                        post = Post.from_file(file_path, self.render_markdown_func)
-                        if post:
-                            posts.append(post)
-                    except PostError as e:
-                        # Log the error but continue processing other posts
-                        logger.warning(f"Skipping post {filename}: {e}")
-        except Exception as e:
+            with os.scandir(self.posts_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.markdown') and entry.is_file():
+                        st = entry.stat()
+                        signatures[entry.name] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError as e:
             logger.error(f"Error getting posts: {e}")
+        return signatures
+    
+    def _load_files(self, file_paths: Sequence[str]) -> List[Union[Post, PostError]]:
+        """
+        Parse post files one after another.
         
-        # Sort posts by date
-        posts.sort(key=lambda x: x.date, reverse=True)
+        Args:
+            file_paths (Sequence[str]): Paths of the files to parse
+            
+        Returns:
+            List[Union[Post, PostError]]: The post, or the error it raised, for each file
+        """
+        results = []
+        for file_path in file_paths:
+            try:
+                results.append(Post.from_file(file_path, self.render_markdown_func,
+                                              self.metadata_only, self.keep_content))
+            except PostError as e:
+                results.append(e)
+        return results
+    
+    def _load_posts(self, filenames: List[str]) -> Dict[str, Optional[Post]]:
+        """
+        Parse the given post files with the configured loader.
+        
+        Args:
+            filenames (List[str]): Names of the files inside the posts directory
+            
+        Returns:
+            Dict[str, Optional[Post]]: The parsed post for each file, None if it is invalid
+        """
+        filenames = sorted(filenames)
+        results = self.loader([os.path.join(self.posts_dir, name) for name in filenames])
+        
+        posts = {}
+        for filename, result in zip(filenames, results):
+            if isinstance(result, PostError):
+                # Log the error but continue processing other posts
+                logger.warning(f"Skipping post {filename}: {result}")
+                posts[filename] = None
+            else:
+                posts[filename] = result
         return posts
     
+    def _refresh_locked(self) -> bool:
+        """
+        Re-parse added or changed files and publish a new index.
+        
+        Must be called with self._lock held.
+        
+        Returns:
+            bool: True if a new index was published
+        """
+        start = time.perf_counter()
+        self._last_check = time.monotonic()
+        signatures = self._scan()
+        
+        files = {}
+        stale = []
+        for filename, signature in signatures.items():
+            previous = self._files.get(filename)
+            if previous is not None and previous[0] == signature:
+                files[filename] = previous
+            else:
+                stale.append(filename)
+        
+        if self._index is not None and not stale and len(files) == len(self._files):
+            return False
+        
+        for filename, post in self._load_posts(stale).items():
+            files[filename] = (signatures[filename], post)
+        
+        # Build the replacement completely before publishing it, so readers
+        # see either the old index or the new one and never a partial one.
+        index = PostIndex(post for _, post in files.values() if post is not None)
+        self._files = files
+        self._index = index
+        logger.info(f"Loaded {len(stale)} post files in {(time.perf_counter() - start) * 1000:.1f} ms "
+                    f"({len(index)} posts in the index)")
+        return True
+    
+    def refresh(self) -> bool:
+        """
+        Check the posts directory and reload only the files that changed.
+        
+        Returns:
+            bool: True if the corpus changed
+        """
+        with self._lock:
+            return self._refresh_locked()
+    
+    def get_index(self) -> PostIndex:
+        """
+        Get the current post index, loading it on first use.
+        
+        With auto_reload enabled, the posts directory is checked for changes
+        at most once per check_interval. If another thread is already
+        refreshing, the current index is returned without waiting.
+        
+        Returns:
+            PostIndex: The current index of posts
+        """
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    self._refresh_locked()
+                return self._index
+        
+        if self.auto_reload and time.monotonic() - self._last_check >= self.check_interval:
+            if self._lock.acquire(blocking=False):
+                try:
+                    self._refresh_locked()
+                finally:
+                    self._lock.release()
+            return self._index
+        
+        return index
+    
+    def reload(self) -> None:
+        """Forget all loaded posts so the next access reads every file again."""
+        with self._lock:
+            self._files = {}
+            self._index = None
+    
+    def __iter__(self) -> Iterator[Post]:
+        return iter(self.get_index())
+    
+    def __len__(self) -> int:
+        return len(self.get_index())
+    
+    def get(self, path: str, default: Optional[Post] = None) -> Optional[Post]:
+        """
+        Get a post by its path, like ``FlatPages.get``.
+        
+        Args:
+            path (str): The path of the post
+            default (Optional[Post]): Returned when no post has this path
+            
+        Returns:
+            Optional[Post]: The Post object, or default
+        """
+        post = self.get_post_by_path(path)
+        return default if post is None else post
+    
+    def get_or_404(self, path: str) -> Post:
+        """
+        Get a post by its path or abort with a 404, like ``FlatPages.get_or_404``.
+        
+        Args:
+            path (str): The path of the post
+            
+        Returns:
+            Post: The Post object
+        """
+        post = self.get_post_by_path(path)
+        if post is None:
+            from flask import abort
+            abort(404)
+        return post
+    
+    def get_all_posts(self) -> List[Post]:
+        """
+        Get all posts from the posts directory.
+        
+        Returns:
+            List[Post]: A list of Post objects sorted by date, newest first
+        """
+        return list(self.get_index().posts)
+    
     def get_post_by_path(self, path: str) -> Optional[Post]:
         """
         Get a post by its path.
@@ -68,19 +258,7 @@ class PostRepository:
         # Remove any trailing slashes
         path = path.rstrip('/')
         
-        # Try to find the post file
-        for filename in os.listdir(self.posts_dir):
-            if filename.endswith('.markdown'):
-                # Remove date prefix and extension for comparison
-                file_path = os.path.join(self.posts_dir, filename)
-                try:
-                    post = Post.from_file(file_path, self.render_markdown_func)
-                    if post.path == path:
-                        return post
-                except PostError:
-                    continue
-        
-        return None
+        return self.get_index().get(path)
     
     def get_next_post(self, current_path: str) -> Optional[Post]:
         """
@@ -92,19 +270,7 @@ class PostRepository:
         Returns:
             Optional[Post]: The next Post object if found, None otherwise
         """
-        posts = self.get_all_posts()
-        
-        # Find current post index
-        current_index = -1
-        for i, post in enumerate(posts):
-            if post.path == current_path:
-                current_index = i
-                break
-        
-        # Get next post
-        if current_index > 0:
-            return posts[current_index - 1]
-        return None
+        return self.get_index().next_post(current_path)
     
     def get_prev_post(self, current_path: str) -> Optional[Post]:
         """
@@ -116,16 +282,78 @@ class PostRepository:
         Returns:
             Optional[Post]: The previous Post object if found, None otherwise
         """
-        posts = self.get_all_posts()
+        return self.get_index().prev_post(current_path)
+    
+    def get_posts_by_category(self, category: str) -> List[Post]:
+        """
+        Get the posts in a category.
         
-        # Find current post index
-        current_index = -1
-        for i, post in enumerate(posts):
-            if post.path == current_path:
-                current_index = i
-                break
+        Args:
+            category (str): The category name, in any capitalization or slug form
+            
+        Returns:
+            List[Post]: The matching posts sorted by date, newest first
+        """
+        return list(self.get_index().categories.posts(category))
+    
+    def get_page(self, page: int, per_page: int) -> Optional[Pagination]:
+        """
+        Get one page of posts, newest first.
+        
+        Args:
+            page (int): The page number, starting at 1
+            per_page (int): The maximum number of posts per page
+            
+        Returns:
+            Optional[Pagination]: The page, or None if it is out of range
+        """
+        return self.get_index().page(page, per_page)
+    
+    def get_category_page(self, category: str, page: int, per_page: int) -> Optional[Pagination]:
+        """
+        Get one page of the posts in a category, newest first.
+        
+        Args:
+            category (str): The category name, in any capitalization or slug form
+            page (int): The page number, starting at 1
+            per_page (int): The maximum number of posts per page
+            
+        Returns:
+            Optional[Pagination]: The page, or None if it is out of range
+        """
+        return self.get_index().categories.page(category, page, per_page)
+    
+    def render_all(self, render_many_func=None, posts: Optional[Iterable[Post]] = None) -> Dict[str, float]:
+        """
+        Render the HTML of every post that has not been rendered yet.
+        
+        Args:
+            render_many_func (callable, optional): Batch renderer taking an iterable
+                of markdown sources and yielding results with index, html and
+                seconds, such as MarkdownService.render_many. Without it, posts
+                are rendered one by one with render_markdown_func.
+            posts (Optional[Iterable[Post]]): Only render these posts instead of
+                the whole corpus
+                
+        Returns:
+            Dict[str, float]: Seconds spent rendering each post, keyed by path
+        """
+        if posts is None:
+            posts = self.get_index().posts
+        posts = [post for post in posts if not post.rendered]
+        timings = {}
+        if render_many_func is None:
+            for post in posts:
+                start = time.perf_counter()
+                post.html_content
+                timings[post.path] = time.perf_counter() - start
+            return timings
         
-        # Get previous post
-        if current_index < len(posts) - 1:
-            return posts[current_index + 1]
-        return None 
\ No newline at end of file
+        for result in render_many_func(post.load_content() for post in posts):
+            post = posts[result.index]
+            if result.html is None:
+                logger.warning(f"Error rendering post {post.path}: {result.error}")
+                continue
+            post.html_content = result.html
+            timings[post.path] = result.seconds
+        return timings
@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, current_app, abort, send_from_directory, redirect
+from flask import Blueprint, render_template, current_app, abort, send_from_directory, redirect, request, jsonify, url_for
 import os
 
 # Create the main blueprint
@@ -13,7 +13,7 @@ def index():
         str: The rendered home page
     """
     try:
-        posts = current_app.post_repository.get_all_posts()
+        posts = current_app.post_repository.get_page(1, current_app.config['POSTS_PER_PAGE']).items
         return render_template('index.html', title='About Me', posts=posts)
     except Exception as e:
         current_app.logger.error(f"Error in index route: {e}")
@@ -21,16 +21,25 @@ def index():
 
 @main.route('/writings')
 @main.route('/writings/')
-def writings():
+@main.route('/writings/page/<int:page>/')
+def writings(page=1):
     """
-    Render the writings page.
+    Render one page of the writings list.
     
+    Args:
+        page (int): The page number, starting at 1
+        
     Returns:
         str: The rendered writings page
     """
+    if page == 1 and request.view_args.get('page') is not None:
+        return redirect(url_for('main.writings'), code=301)
+    pagination = current_app.post_repository.get_page(page, current_app.config['POSTS_PER_PAGE'])
+    if pagination is None:
+        abort(404)
     try:
-        posts = current_app.post_repository.get_all_posts()
-        return render_template('writings.html', title='Writings', posts=posts)
+        return render_template('writings.html', title='Writings', posts=pagination.items,
+                               pagination=pagination)
     except Exception as e:
         current_app.logger.error(f"Error getting posts: {e}")
         return render_template('error.html', title='Error', error=str(e)), 500
@@ -116,30 +125,93 @@ def survival():
     return render_template('survival.html', title='Survival Game')
 
 @main.route('/category/<name>/')
-def category(name):
+@main.route('/category/<name>/page/<int:page>/')
+def category(name, page=1):
     """
-    Render a category page.
+    Render one page of a category listing.
     
     Args:
         name (str): The name of the category
+        page (int): The page number, starting at 1
         
     Returns:
         str: The rendered category page
     """
+    if page == 1 and request.view_args.get('page') is not None:
+        return redirect(url_for('main.category', name=name), code=301)
+    pagination = current_app.post_repository.get_category_page(name, page, current_app.config['POSTS_PER_PAGE'])
+    if pagination is None:
+        abort(404)
     try:
-        posts = current_app.post_repository.get_all_posts()
-        
-        # Filter posts by category
-        category_posts = [post for post in posts if name.lower() in [cat.lower() for cat in post.categories]]
-        
         return render_template('category.html', 
                              title=f'Posts in {name.title()}', 
                              category=name,
-                             posts=category_posts)
+                             posts=pagination.items,
+                             pagination=pagination)
     except Exception as e:
         current_app.logger.error(f"Error in category route: {e}")
         return render_template('error.html', title='Error', error="An error occurred while loading the category page.")
 
+@main.route('/search')
+def search():
+    """
+    Render ranked full-text search results for the ``q`` query parameter.
+    
+    With ``format=json`` the results are returned as JSON instead.
+    
+    Returns:
+        str: The rendered search page
+    """
+    query = request.args.get('q', '').strip()
+    limit = request.args.get('limit', 20, type=int)
+    try:
+        search_service = current_app.search_service
+        search_service.update(current_app.post_repository.get_index())
+        results = search_service.search(query, limit=max(1, min(limit, 100))) if query else []
+        
+        if request.args.get('format') == 'json':
+            return jsonify(query=query, results=[{
+                'title': hit.post.title,
+                'path': hit.post.path,
+                'date': hit.post.date.strftime('%Y-%m-%d'),
+                'score': round(hit.score, 4),
+                'snippet': hit.snippet
+            } for hit in results])
+        
+        return render_template('search.html', title='Search', query=query, results=results)
+    except Exception as e:
+        current_app.logger.error(f"Error in search route: {e}")
+        return render_template('error.html', title='Error', error="An error occurred while searching."), 500
+
+@main.route('/search/index/<filename>')
+def search_index_file(filename):
+    """
+    Serve a file of the static search index used by the writings search box.
+    
+    The files are the same ones ``build_static.py`` writes to
+    ``_site/search/index/``, so the client-side search works unchanged
+    on the development server.
+    
+    Args:
+        filename (str): The index file name, e.g. manifest.json
+        
+    Returns:
+        Response: The JSON file
+    """
+    search_service = current_app.search_service
+    search_service.update(current_app.post_repository.get_index())
+    files = search_service.export_index()
+    if filename not in files:
+        abort(404)
+    
+    response = current_app.response_class(files[filename], mimetype='application/json')
+    if filename != 'manifest.json':
+        # Every other file is named after a hash of its contents
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+    return response
+
 @main.route('/posts/<path:post_path>/')
 def post(post_path):
     """
@@ -17,7 +17,7 @@ def view(path=None):
         str: The rendered post
     """
     try:
-        from app import post_repository
+        post_repository = current_app.post_repository
         
         # If no path is provided or path is empty, redirect to writings
         if not path or path.strip() == '':
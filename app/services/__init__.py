@@ -1,10 +1,22 @@
-from .config_service import ConfigService
-from .markdown_service import MarkdownService
-from .template_service import TemplateService
-from .static_service import StaticService
-from .logging_service import LoggingService
-from .post_service import PostService
-from .service_factory import ServiceFactory
+import importlib
+
+# Services are imported on first access, so importing one service does not
+# pull in the dependencies of all the others
+_SERVICE_MODULES = {
+    'ConfigService': '.config_service',
+    'MarkdownService': '.markdown_service',
+    'TemplateService': '.template_service',
+    'StaticService': '.static_service',
+    'LoggingService': '.logging_service',
+    'PostService': '.post_service',
+    'SearchService': '.search_service',
+    'ServiceFactory': '.service_factory'
+}
+
+def __getattr__(name):
+    if name in _SERVICE_MODULES:
+        return getattr(importlib.import_module(_SERVICE_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'ConfigService',
@@ -13,5 +25,6 @@ __all__ = [
     'StaticService',
     'LoggingService',
     'PostService',
+    'SearchService',
     'ServiceFactory'
 ]
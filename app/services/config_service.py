@@ -2,7 +2,6 @@ import os
 from typing import Dict, Any
 from dataclasses import dataclass
 from pathlib import Path
-import yaml
 
 @dataclass
 class AppConfig:
@@ -47,6 +46,8 @@ class ConfigService:
         if not self.config_path.exists():
             return self._get_default_config()
             
+        # Only needed when a config file exists, so it is imported here
+        import yaml
         try:
             with open(self.config_path) as f:
                 return yaml.safe_load(f)
@@ -70,7 +71,12 @@ class ConfigService:
             'posts': {
                 'dir': 'app/posts',
                 'per_page': 10,
-                'date_format': '%Y-%m-%d'
+                'date_format': '%Y-%m-%d',
+                'auto_reload': True,
+                'reload_interval': 1.0,
+                'load_workers': 0,
+                'load_chunk_size': 8,
+                'keep_content': True
             },
             'markdown': {
                 'extensions': [
@@ -83,11 +89,66 @@ class ConfigService:
                     'markdown.extensions.codehilite': {
                         'css_class': 'highlight'
                     }
+                },
+                'cache': {
+                    'enabled': True,
+                    'dir': '.cache/render',
+                    'max_bytes': 64 * 1024 * 1024
+                },
+                'batch': {
+                    'thread_threshold': 16,
+                    'process_threshold': 64,
+                    'workers': 0
                 }
             },
+            'search': {
+                'shard_bytes': 16 * 1024
+            },
             'static': {
                 'dir': 'app/static',
-                'cache_timeout': 3600
+                'cache_timeout': 3600,
+                'hardlink': False,
+                'bundles': {
+                    'css/site.bundle.css': [
+                        'css/bootstrap.min.css',
+                        'css/font-awesome.min.css',
+                        'css/style.css',
+                        'css/navigation.css',
+                        'css/syntax.css',
+                        'css/thickbox.css',
+                        'css/projects.css',
+                        'css/super-search.css',
+                        'css/fonts.css'
+                    ],
+                    'js/site.bundle.js': [
+                        'js/jquery-1.11.0.min.js',
+                        'js/bootstrap.min.js',
+                        'js/thickbox-compressed.js',
+                        'js/super-search.js',
+                        'js/projects.js'
+                    ],
+                    'css/sudoku.bundle.css': ['css/sudoku.css'],
+                    'js/sudoku.bundle.js': ['js/sudoku.js'],
+                    'css/strands.bundle.css': ['css/strands.css'],
+                    'js/strands.bundle.js': ['js/strands.js'],
+                    'css/survival.bundle.css': ['css/survival.css'],
+                    'js/survival.bundle.js': ['js/survival.js'],
+                    'css/gem-miner.bundle.css': ['css/gem-miner.css'],
+                    'js/gem-miner.bundle.js': ['js/gem-miner.js'],
+                    'css/bubble-shooter.bundle.css': ['css/bubble-shooter.css'],
+                    'js/bubble-shooter.bundle.js': ['js/bubble-shooter.js'],
+                    'css/maze.bundle.css': ['css/maze.css'],
+                    'js/maze.bundle.js': ['js/maze.js'],
+                    'css/hangman.bundle.css': ['css/hangman.css'],
+                    'js/hangman.bundle.js': ['js/hangman.js']
+                }
+            },
+            'images': {
+                'dir': 'img',
+                'widths': [480, 960, 1440],
+                'quality': 82,
+                'sizes': '(max-width: 1260px) 100vw, 1220px',
+                'cache_dir': '.cache/images'
             }
         }
         
@@ -131,6 +192,7 @@ class ConfigService:
         
     def save(self) -> None:
         """Save configuration to file."""
+        import yaml
         try:
             with open(self.config_path, 'w') as f:
                 yaml.dump(self.config, f)
@@ -172,6 +234,31 @@ class ConfigService:
         """Get number of posts per page."""
         return self.get('posts.per_page', 10)
         
+    @property
+    def posts_auto_reload(self) -> bool:
+        """Get whether post files are checked for changes while serving."""
+        return self.get('posts.auto_reload', True)
+        
+    @property
+    def posts_reload_interval(self) -> float:
+        """Get minimum number of seconds between two post change checks."""
+        return self.get('posts.reload_interval', 1.0)
+        
+    @property
+    def post_load_workers(self) -> int:
+        """Get number of processes used to load posts (0 or 1 loads serially)."""
+        return self.get('posts.load_workers', 0)
+        
+    @property
+    def post_load_chunk_size(self) -> int:
+        """Get number of post files handed to a loader process at a time."""
+        return self.get('posts.load_chunk_size', 8)
+        
+    @property
+    def posts_keep_content(self) -> bool:
+        """Get whether raw markdown is kept in memory after rendering."""
+        return self.get('posts.keep_content', True)
+        
     @property
     def date_format(self) -> str:
         """Get date format string."""
@@ -187,28 +274,100 @@ class ConfigService:
         """Get markdown extension configurations."""
         return self.get('markdown.extension_configs', {})
         
+    @property
+    def markdown_cache_enabled(self) -> bool:
+        """Get whether rendered markdown is cached on disk."""
+        return self.get('markdown.cache.enabled', True)
+        
+    @property
+    def markdown_cache_dir(self) -> str:
+        """Get rendered markdown cache directory path."""
+        return self.get('markdown.cache.dir', '.cache/render')
+        
+    @property
+    def markdown_cache_max_bytes(self) -> int:
+        """Get size budget of the rendered markdown cache."""
+        return self.get('markdown.cache.max_bytes', 64 * 1024 * 1024)
+        
+    @property
+    def markdown_batch_thread_threshold(self) -> int:
+        """Get smallest batch rendered on a thread pool."""
+        return self.get('markdown.batch.thread_threshold', 16)
+        
+    @property
+    def markdown_batch_process_threshold(self) -> int:
+        """Get smallest batch rendered on a process pool."""
+        return self.get('markdown.batch.process_threshold', 64)
+        
+    @property
+    def markdown_batch_workers(self) -> int:
+        """Get number of batch render workers (0 uses the CPU count)."""
+        return self.get('markdown.batch.workers', 0)
+        
+    @property
+    def search_shard_bytes(self) -> int:
+        """Get size budget of one static search index shard."""
+        return self.get('search.shard_bytes', 16 * 1024)
+        
     @property
     def static_cache_timeout(self) -> int:
         """Get static files cache timeout."""
         return self.get('static.cache_timeout', 3600)
+        
+    @property
+    def static_hardlink(self) -> bool:
+        """Get whether static files are hardlinked into the output instead of copied."""
+        return self.get('static.hardlink', False)
+        
+    @property
+    def static_bundles(self) -> dict:
+        """Get the files of each static bundle, by the bundle's path in the static directory."""
+        return self.get('static.bundles', {})
+        
+    @property
+    def image_dir(self) -> str:
+        """Get directory of the images resized for srcset, relative to the static directory."""
+        return self.get('images.dir', 'img')
+        
+    @property
+    def image_widths(self) -> list:
+        """Get widths in pixels images are resized to."""
+        return self.get('images.widths', [480, 960, 1440])
+        
+    @property
+    def image_quality(self) -> int:
+        """Get JPEG quality of resized images."""
+        return self.get('images.quality', 82)
+        
+    @property
+    def image_sizes(self) -> str:
+        """Get sizes attribute of images without a width of their own."""
+        return self.get('images.sizes', '(max-width: 1260px) 100vw, 1220px')
+        
+    @property
+    def image_cache_dir(self) -> str:
+        """Get directory where resized images are cached."""
+        return self.get('images.cache_dir', '.cache/images')
     
     def load_from_env(self):
         """Load configuration from environment variables."""
         # Directory paths
         if 'POSTS_DIR' in os.environ:
-            self.config['posts']['dir'] = os.environ['POSTS_DIR']
+            self.config.setdefault('posts', {})['dir'] = os.environ['POSTS_DIR']
+        if 'POST_LOAD_WORKERS' in os.environ:
+            self.config.setdefault('posts', {})['load_workers'] = int(os.environ['POST_LOAD_WORKERS'])
         if 'STATIC_DIR' in os.environ:
-            self.config['static']['dir'] = os.environ['STATIC_DIR']
+            self.config.setdefault('static', {})['dir'] = os.environ['STATIC_DIR']
         if 'TEMPLATES_DIR' in os.environ:
             self.config['templates_dir'] = os.environ['TEMPLATES_DIR']
             
         # Site settings
         if 'SITE_TITLE' in os.environ:
-            self.config['site']['title'] = os.environ['SITE_TITLE']
+            self.config.setdefault('site', {})['title'] = os.environ['SITE_TITLE']
         if 'SITE_DESCRIPTION' in os.environ:
-            self.config['site']['description'] = os.environ['SITE_DESCRIPTION']
+            self.config.setdefault('site', {})['description'] = os.environ['SITE_DESCRIPTION']
         if 'SITE_URL' in os.environ:
-            self.config['site']['url'] = os.environ['SITE_URL']
+            self.config.setdefault('site', {})['url'] = os.environ['SITE_URL']
             
         # Development settings
         if 'DEBUG' in os.environ:
@@ -1,11 +1,55 @@
-from typing import Dict, Any, Tuple
-import markdown
+from typing import TYPE_CHECKING, Dict, Any, Tuple, Iterable, Iterator, NamedTuple, Optional
 from pathlib import Path
-import yaml
+import json
+import os
 import re
+import threading
+import time
+from .render_cache import RenderCache
+from app.utils.front_matter import read_front_matter
+
+if TYPE_CHECKING:
+    import markdown
+
+class RenderResult(NamedTuple):
+    """Outcome of rendering one document of a batch.
+    
+    Attributes:
+        index: Position of the source in the batch
+        html: Rendered HTML, or None if rendering failed
+        seconds: Time spent rendering (or fetching from the cache)
+        error: Error message if rendering failed
+    """
+    index: int
+    html: Optional[str]
+    seconds: float
+    error: Optional[str] = None
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Markdown service of a batch render process, created once by _init_render_worker
+_worker_service = None
+
+def _init_render_worker(config_service) -> None:
+    """Set up the markdown service used by a batch render process.
+    
+    Args:
+        config_service: Configuration service instance of the parent process
+    """
+    global _worker_service
+    _worker_service = MarkdownService(config_service)
+
+def _render_in_worker(source: str) -> Tuple[Optional[str], float, Optional[str]]:
+    """Render one document inside a batch render process."""
+    return _worker_service.timed_render(source)
 
 class MarkdownService:
-    """Service for processing markdown content."""
+    """Service for processing markdown content.
+    
+    markdown.Markdown instances keep per-document state between reset() and
+    convert(), so each thread renders with its own converter and the service
+    can be shared by a threaded WSGI server.
+    """
     
     def __init__(self, config_service):
         """Initialize the markdown service.
@@ -14,10 +58,65 @@ class MarkdownService:
             config_service: Configuration service instance
         """
         self.config = config_service
-        self.md = markdown.Markdown(
-            extensions=self.config.markdown_extensions,
-            extension_configs=self.config.markdown_extension_configs
-        )
+        self._local = threading.local()
+        self._cache = None
+        self._cache_ready = False
+        self._cache_lock = threading.Lock()
+        
+    @property
+    def cache(self) -> Optional[RenderCache]:
+        """Get the render cache, creating it on first use.
+        
+        Returns:
+            RenderCache instance, or None if markdown.cache.enabled is off
+        """
+        if not self._cache_ready:
+            # Threads rendering at once must all get the same cache
+            with self._cache_lock:
+                if not self._cache_ready:
+                    if self.config.markdown_cache_enabled:
+                        cache_dir = Path(self.config.markdown_cache_dir)
+                        if not cache_dir.is_absolute():
+                            # Relative to the project root, so the Flask app and the builder share it
+                            cache_dir = PROJECT_ROOT / cache_dir
+                        self._cache = RenderCache(
+                            str(cache_dir),
+                            fingerprint=self._settings_fingerprint(),
+                            max_bytes=self.config.markdown_cache_max_bytes
+                        )
+                    self._cache_ready = True
+        return self._cache
+        
+    @property
+    def md(self) -> 'markdown.Markdown':
+        """Get the calling thread's markdown converter, creating it on first use.
+        
+        Returns:
+            markdown.Markdown instance owned by the current thread
+        """
+        md = getattr(self._local, 'md', None)
+        if md is None:
+            # Imported on first render; the markdown package is slow to import
+            import markdown
+            md = markdown.Markdown(
+                extensions=self.config.markdown_extensions,
+                extension_configs=self.config.markdown_extension_configs
+            )
+            self._local.md = md
+        return md
+        
+    def _settings_fingerprint(self) -> str:
+        """Describe everything besides the source that affects rendered output.
+        
+        Returns:
+            Stable string covering the markdown version, extensions and their configs
+        """
+        import markdown
+        return json.dumps({
+            'markdown': markdown.__version__,
+            'extensions': self.config.markdown_extensions,
+            'extension_configs': self.config.markdown_extension_configs
+        }, sort_keys=True, default=repr)
         
     def process_file(self, file_path: str) -> Tuple[Dict[str, Any], str]:
         """Process a markdown file.
@@ -62,6 +161,7 @@ class MarkdownService:
         if not match:
             return {}, content
             
+        import yaml
         try:
             metadata = yaml.safe_load(match.group(1))
             content = content[match.end():]
@@ -79,23 +179,121 @@ class MarkdownService:
         Returns:
             HTML content string
         """
-        self.md.reset()
-        return self.md.convert(content)
+        if self.cache is not None:
+            html = self.cache.get(content)
+            if html is not None:
+                return html
+        
+        md = self.md
+        md.reset()
+        html = md.convert(content)
+        
+        if self.cache is not None:
+            self.cache.put(content, html)
+        return html
+        
+    def timed_render(self, content: str) -> Tuple[Optional[str], float, Optional[str]]:
+        """Render markdown and measure how long it took.
+        
+        Rendering errors are returned rather than raised, so a batch or a
+        pool of loader processes can report them per document.
+        
+        Args:
+            content: Markdown content string
+            
+        Returns:
+            Tuple of (HTML or None, seconds, error message or None)
+        """
+        start = time.perf_counter()
+        try:
+            html, error = self._render_markdown(content), None
+        except Exception as e:
+            html, error = None, str(e)
+        return html, time.perf_counter() - start, error
+        
+    def _batch_mode(self, count: int) -> str:
+        """Pick how to execute a batch of the given size.
+        
+        Args:
+            count: Number of documents in the batch
+            
+        Returns:
+            'serial', 'thread' or 'process'
+        """
+        if count >= self.config.markdown_batch_process_threshold:
+            return 'process'
+        if count >= self.config.markdown_batch_thread_threshold:
+            return 'thread'
+        return 'serial'
+        
+    def render_many(self, sources: Iterable[str], mode: str = 'auto',
+                    workers: Optional[int] = None,
+                    chunk_size: int = 1) -> Iterator[RenderResult]:
+        """Render a batch of markdown documents.
+        
+        Results are yielded as a stream, in the order of the sources, each
+        with the time spent on that document. Small batches are rendered in
+        this thread; larger ones go to a thread pool (cheap to start, and
+        useful when most documents are render cache hits) or a process pool
+        whose workers share the on-disk render cache.
+        
+        Args:
+            sources: Markdown content strings
+            mode: 'serial', 'thread', 'process' or 'auto' to pick by batch size
+            workers: Number of threads or processes (defaults to the CPU count)
+            chunk_size: Number of documents sent to a process at a time
+            
+        Returns:
+            Iterator of RenderResult
+        """
+        sources = list(sources)
+        if mode == 'auto':
+            mode = self._batch_mode(len(sources))
+        workers = workers or self.config.markdown_batch_workers or os.cpu_count() or 1
+        
+        if mode == 'serial' or workers <= 1 or len(sources) <= 1:
+            outcomes = map(self.timed_render, sources)
+            for index, (html, seconds, error) in enumerate(outcomes):
+                yield RenderResult(index, html, seconds, error)
+        elif mode == 'thread':
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = executor.map(self.timed_render, sources)
+                for index, (html, seconds, error) in enumerate(outcomes):
+                    yield RenderResult(index, html, seconds, error)
+        elif mode == 'process':
+            # concurrent.futures.process pulls in multiprocessing; only import it when used
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=min(workers, len(sources)),
+                                     initializer=_init_render_worker,
+                                     initargs=(self.config,)) as executor:
+                outcomes = executor.map(_render_in_worker, sources, chunksize=max(1, chunk_size))
+                for index, (html, seconds, error) in enumerate(outcomes):
+                    yield RenderResult(index, html, seconds, error)
+        else:
+            raise ValueError(f"Unknown render mode: {mode}")
         
     def get_metadata(self, file_path: str) -> Dict[str, Any]:
         """Get metadata from markdown file.
         
+        Only the front matter is read; the rest of the file is never loaded.
+        
         Args:
             file_path: Path to markdown file
             
         Returns:
             Dictionary of metadata
         """
-        with open(file_path, 'r') as f:
-            content = f.read()
+        parts = read_front_matter(file_path)
+        if parts is None or parts.preamble:
+            return {}
             
-        metadata, _ = self._extract_front_matter(content)
-        return metadata
+        import yaml
+        try:
+            return yaml.safe_load(parts.header) or {}
+        except yaml.YAMLError as e:
+            print(f"Error parsing front matter: {e}")
+            return {}
         
     def get_content(self, file_path: str) -> str:
         """Get rendered HTML content from markdown file.
@@ -1,37 +1,142 @@
 import os
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
 from pathlib import Path
 from .markdown_service import MarkdownService
 from .config_service import ConfigService
 from app.models.post import Post
+from app.models.exceptions import PostError, MarkdownRenderingError
+from app.repositories.post_repository import PostRepository
+from app.repositories.post_index import Pagination
 import re
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Markdown service of a post loader process, created once by _init_load_worker;
+# None when the pool only parses front matter
+_worker_markdown = None
+
+def _init_load_worker(config_service, render: bool) -> None:
+    """Set up a post loader process.
+    
+    Args:
+        config_service: Configuration service instance of the parent process
+        render: Render post bodies in this process, not just parse them
+    """
+    global _worker_markdown
+    _worker_markdown = MarkdownService(config_service) if render else None
+
+def _load_in_worker(task: Tuple[str, bool, bool]) -> Union[Post, PostError]:
+    """Parse one post file inside a loader process, rendering it unless only metadata is loaded."""
+    file_path, metadata_only, keep_content = task
+    try:
+        post = Post.from_file(file_path, metadata_only=metadata_only, keep_content=keep_content)
+    except PostError as e:
+        return e
+    if _worker_markdown is not None:
+        html, _, error = _worker_markdown.timed_render(post.content)
+        if html is None:
+            return MarkdownRenderingError(error)
+        post.html_content = html
+    return post
+
 class PostService:
     """Service for managing blog posts."""
     
-    def __init__(self, config_service: ConfigService, markdown_service: MarkdownService):
+    def __init__(self, config_service: ConfigService, markdown_service: MarkdownService,
+                 metadata_only: bool = False):
         """Initialize the post service.
         
         Args:
             config_service: ConfigService instance
             markdown_service: MarkdownService instance
+            metadata_only: Load only front matter; bodies are read and rendered
+                when a post's HTML is first needed
+                
+        Posts are loaded on first access rather than here, so creating the
+        service is cheap.
         """
         self.config = config_service
         self.markdown = markdown_service
         self.posts_dir = Path(self.config.posts_dir)
-        self._posts: Dict[str, Post] = {}
-        self._load_posts()
+        if not self.posts_dir.is_absolute():
+            # Relative to the project root, so the working directory does not matter
+            self.posts_dir = PROJECT_ROOT / self.posts_dir
+        self.metadata_only = metadata_only
+        self._repository = PostRepository(
+            str(self.posts_dir),
+            self.markdown._render_markdown,
+            auto_reload=self.config.posts_auto_reload,
+            check_interval=self.config.posts_reload_interval,
+            metadata_only=metadata_only,
+            keep_content=self.config.posts_keep_content,
+            loader=self._load_files if self.config.post_load_workers > 1 else None
+        )
+    
+    @property
+    def repository(self) -> PostRepository:
+        """The repository holding the loaded corpus, for routes and FlatPages-style access."""
+        return self._repository
+    
+    @property
+    def _posts(self) -> Dict[str, Post]:
+        """Posts of the current corpus snapshot, keyed by path."""
+        return self._repository.get_index().by_path
     
     def _load_posts(self) -> None:
         """Load all posts from the posts directory."""
-        for file_path in self.posts_dir.glob("*.markdown"):
-            try:
-                post = Post.from_file(str(file_path), self.markdown._render_markdown)
-                if post:
-                    self._posts[post.path] = post
-            except Exception as e:
-                print(f"Error loading post {file_path}: {str(e)}")
+        self._repository.refresh()
+    
+    def _load_files(self, file_paths: Sequence[str]) -> List[Union[Post, PostError]]:
+        """Load post files in a pool of worker processes.
+        
+        Post.from_file runs in the workers on chunks of posts.load_chunk_size
+        files. Full loads also render each body there; metadata-only loads
+        just parse the front matter and leave rendering to first access.
+        Results come back in submission order, so the outcome does not
+        depend on scheduling. Batches too small to fill more than one chunk
+        are loaded in this process instead.
+        
+        Args:
+            file_paths: Paths of the files to load
+            
+        Returns:
+            The post, or the error it raised, for each file
+        """
+        chunk_size = max(1, self.config.post_load_chunk_size)
+        if len(file_paths) <= chunk_size:
+            return self._repository._load_files(file_paths)
+        
+        # concurrent.futures.process pulls in multiprocessing; only import it when used
+        from concurrent.futures import ProcessPoolExecutor
+        workers = min(self.config.post_load_workers, -(-len(file_paths) // chunk_size))
+        tasks = [(file_path, self.metadata_only, self.config.posts_keep_content) for file_path in file_paths]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_load_worker,
+                                 initargs=(self.config, not self.metadata_only)) as executor:
+            results = list(executor.map(_load_in_worker, tasks, chunksize=chunk_size))
+        for result in results:
+            if isinstance(result, Post):
+                result.render_markdown_func = self.markdown._render_markdown
+        return results
+    
+    def render_all(self, posts: Optional[Iterable[Post]] = None) -> Dict[str, float]:
+        """Render every post that has not been rendered yet as one batch.
+        
+        Args:
+            posts: Only render these posts instead of the whole corpus
+            
+        Returns:
+            Seconds spent rendering each post, keyed by path
+        """
+        return self._repository.render_all(self.markdown.render_many, posts)
+    
+    def refresh(self) -> bool:
+        """Re-parse posts whose files were added, changed or removed.
+        
+        Returns:
+            True if the corpus changed
+        """
+        return self._repository.refresh()
     
     def get_post(self, path: str) -> Optional[Post]:
         """Get a post by path.
@@ -50,11 +155,32 @@ class PostService:
         Returns:
             List of Post instances
         """
-        return sorted(
-            self._posts.values(),
-            key=lambda p: p.date,
-            reverse=True
-        )
+        return list(self._repository.get_index().posts)
+    
+    def get_page(self, page: int, per_page: Optional[int] = None) -> Optional[Pagination]:
+        """Get one page of posts.
+        
+        Args:
+            page: Page number, starting at 1
+            per_page: Posts per page, posts.per_page by default
+            
+        Returns:
+            The page, or None if it is out of range
+        """
+        return self._repository.get_page(page, per_page or self.config.posts_per_page)
+    
+    def get_category_page(self, category: str, page: int, per_page: Optional[int] = None) -> Optional[Pagination]:
+        """Get one page of the posts in a category.
+        
+        Args:
+            category: Category name
+            page: Page number, starting at 1
+            per_page: Posts per page, posts.per_page by default
+            
+        Returns:
+            The page, or None if it is out of range
+        """
+        return self._repository.get_category_page(category, page, per_page or self.config.posts_per_page)
     
     def get_posts_by_category(self, category: str) -> List[Post]:
         """Get posts by category.
@@ -63,13 +189,9 @@ class PostService:
             category: Category name
             
         Returns:
-            List of Post instances
+            List of Post instances, newest first
         """
-        return sorted(
-            [p for p in self._posts.values() if category in p.categories],
-            key=lambda p: p.date,
-            reverse=True
-        )
+        return list(self._repository.get_index().categories.posts(category))
     
     def get_posts_by_tag(self, tag: str) -> List[Post]:
         """Get posts by tag.
@@ -78,13 +200,9 @@ class PostService:
             tag: Tag name
             
         Returns:
-            List of Post instances
+            List of Post instances, newest first
         """
-        return sorted(
-            [p for p in self._posts.values() if tag in p.metadata.get('tags', [])],
-            key=lambda p: p.date,
-            reverse=True
-        )
+        return list(self._repository.get_index().tags.posts(tag))
     
     def get_categories(self) -> List[str]:
         """Get all categories.
@@ -92,10 +210,7 @@ class PostService:
         Returns:
             List of category names
         """
-        categories = set()
-        for post in self._posts.values():
-            categories.update(post.categories)
-        return sorted(list(categories))
+        return self._repository.get_index().categories.names()
     
     def get_tags(self) -> List[str]:
         """Get all tags.
@@ -103,7 +218,20 @@ class PostService:
         Returns:
             List of tag names
         """
-        tags = set()
-        for post in self._posts.values():
-            tags.update(post.metadata.get('tags', []))
-        return sorted(list(tags)) 
\ No newline at end of file
+        return self._repository.get_index().tags.names()
+    
+    def get_category_counts(self) -> Dict[str, int]:
+        """Get the number of posts in each category.
+        
+        Returns:
+            Dictionary of post counts keyed by category name
+        """
+        return self._repository.get_index().categories.counts()
+    
+    def get_tag_counts(self) -> Dict[str, int]:
+        """Get the number of posts with each tag.
+        
+        Returns:
+            Dictionary of post counts keyed by tag name
+        """
+        return self._repository.get_index().tags.counts()
@@ -0,0 +1,166 @@
+import os
+import hashlib
+import logging
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+class RenderCache:
+    """On-disk, content-addressed cache of rendered markdown.
+
+    Entries are keyed by a hash of the source text plus a fingerprint of the
+    renderer settings, so a change to either simply produces a new key.
+    Entries are written to a temporary file and moved into place with
+    os.replace, which makes the cache safe to share between the Flask
+    process and the static builder. The total size is kept under max_bytes
+    by evicting the least recently used entries.
+    """
+
+    SUFFIX = '.html'
+
+    # A hit only bumps an entry's mtime once it is this many seconds old, so
+    # hot entries are read without a filesystem write; eviction order only
+    # needs to be right to within this interval
+    TOUCH_INTERVAL = 3600
+
+    def __init__(self, cache_dir: str, fingerprint: str = '', max_bytes: int = 64 * 1024 * 1024):
+        """Initialize the render cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries
+            fingerprint: String identifying the renderer settings
+            max_bytes: Size budget for all entries together
+        """
+        self.cache_dir = Path(cache_dir)
+        self.fingerprint = fingerprint
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def key(self, source: str) -> str:
+        """Get the cache key for a markdown source.
+
+        Args:
+            source: Markdown source text
+
+        Returns:
+            Hex digest identifying the source under the current settings
+        """
+        digest = hashlib.sha256(self.fingerprint.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(source.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Get the file path of a cache entry."""
+        return self.cache_dir / key[:2] / (key + self.SUFFIX)
+
+    def get(self, source: str) -> Optional[str]:
+        """Look up the rendered HTML for a markdown source.
+
+        Args:
+            source: Markdown source text
+
+        Returns:
+            The cached HTML, or None on a miss
+        """
+        path = self._path(self.key(source))
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                html = f.read()
+                mtime = os.fstat(f.fileno()).st_mtime
+        except OSError:
+            return None
+        if time.time() - mtime > self.TOUCH_INTERVAL:
+            # Bump the mtime so eviction sees this entry as recently used
+            try:
+                os.utime(path)
+            except OSError:
+                # Evicted by another process in the meantime
+                pass
+        return html
+
+    def put(self, source: str, html: str) -> None:
+        """Store the rendered HTML for a markdown source.
+
+        Args:
+            source: Markdown source text
+            html: Rendered HTML
+        """
+        path = self._path(self.key(source))
+        data = html.encode('utf-8')
+        try:
+            # A rewritten entry replaces the old one in the size budget
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Error writing render cache entry: {e}")
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._total_size()
+            else:
+                self._size += len(data) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        """Yield (mtime, size, path) for every cache entry."""
+        if not self.cache_dir.exists():
+            return
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(self.SUFFIX):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    yield st.st_mtime, st.st_size, entry.path
+
+    def _total_size(self) -> int:
+        """Get the combined size of all cache entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache is at 90% of its budget."""
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                # Another process may have evicted it already
+                pass
+            size -= entry_size
+        self._size = size
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        with self._lock:
+            for _, _, path in list(self._entries()):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            self._size = 0
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+# Bump when the file layout changes so clients can refuse an index they cannot read
+FORMAT_VERSION = 1
+
+MANIFEST_NAME = 'manifest.json'
+
+# Prefixes are never split beyond this length; a larger shard is emitted as is
+MAX_PREFIX_LENGTH = 6
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to compact, deterministic JSON."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _file_name(kind: str, data: bytes) -> str:
+    """Name a file after a hash of its contents, so unchanged files keep their name."""
+    return f"{kind}-{hashlib.sha256(data).hexdigest()[:12]}.json"
+
+def _partition(entries: List[Tuple[str, int]], prefix: str, shard_bytes: int) -> List[Tuple[str, List[Tuple[str, int]]]]:
+    """Split sorted (term, size) entries into shards keyed by a common prefix.
+
+    A prefix whose terms fit the budget becomes one shard; otherwise it is
+    split by the next character. Shard boundaries therefore depend only on
+    the terms under each prefix, so adding a post leaves the shards of
+    unrelated prefixes untouched.
+    """
+    if sum(size for _, size in entries) <= shard_bytes or len(prefix) >= MAX_PREFIX_LENGTH:
+        return [(prefix, entries)]
+
+    depth = len(prefix) + 1
+    groups: Dict[str, List[Tuple[str, int]]] = {}
+    for entry in entries:
+        # A term equal to the prefix keeps the prefix as its key
+        groups.setdefault(entry[0][:depth], []).append(entry)
+
+    shards = []
+    for key in sorted(groups):
+        group = groups[key]
+        if len(key) < depth:
+            shards.append((key, group))
+        else:
+            shards.extend(_partition(group, key, shard_bytes))
+    return shards
+
+def build_search_index(documents: Sequence[Tuple[str, str, str, int]],
+                       postings: Mapping[str, Mapping[str, int]],
+                       ranking: Dict[str, Any],
+                       shard_bytes: int = 16 * 1024) -> Dict[str, bytes]:
+    """Build a sharded, static search index.
+
+    The index consists of a documents file, term shards split by prefix
+    and a manifest pointing at both. Each term maps to a flat list of
+    (document number gap, term frequency) pairs. Documents are numbered
+    oldest first, so a new post only changes the shards of its own terms,
+    and relevance weights that depend on the whole corpus are computed by
+    the client. A single term whose postings exceed the budget gets a
+    shard of its own.
+
+    Args:
+        documents: (path, title, date, length) of every document
+        postings: Mapping of terms to {path: term frequency}
+        ranking: Ranking parameters passed on to the client
+        shard_bytes: Size budget of one term shard
+
+    Returns:
+        Mapping of file names to file contents, including the manifest
+    """
+    numbers = {document[0]: number for number, document in enumerate(documents)}
+
+    encoded = []
+    for term in sorted(postings):
+        flat: List[int] = []
+        previous = 0
+        for number, frequency in sorted((numbers[path], frequency) for path, frequency in postings[term].items()):
+            # Gaps between document numbers are shorter to write than the numbers
+            flat.extend((number - previous, frequency))
+            previous = number
+        encoded.append((term, _dumps(flat)))
+
+    files: Dict[str, bytes] = {}
+    docs_data = _dumps([list(document) for document in documents])
+    docs_name = _file_name('docs', docs_data)
+    files[docs_name] = docs_data
+
+    sizes = {term: len(data) + len(term.encode('utf-8')) + 4 for term, data in encoded}
+    data_by_term = dict(encoded)
+    shards = []
+    for prefix, entries in _partition([(term, sizes[term]) for term, _ in encoded], '', shard_bytes):
+        shard_data = b'{' + b','.join(
+            _dumps(term) + b':' + data_by_term[term] for term, _ in entries
+        ) + b'}'
+        shard_name = _file_name('terms', shard_data)
+        files[shard_name] = shard_data
+        shards.append([prefix, shard_name])
+
+    files[MANIFEST_NAME] = _dumps({
+        'version': FORMAT_VERSION,
+        'ranking': ranking,
+        'documents': docs_name,
+        'shards': shards
+    })
+    return files
+
+def write_search_index(files: Mapping[str, bytes], output_dir: str) -> Tuple[int, int, int]:
+    """Write an exported search index, touching only files that changed.
+
+    Unchanged files keep their modification time, so their cache
+    validators stay valid, and files from earlier builds that are no
+    longer referenced are removed.
+
+    Args:
+        files: Mapping of file names to file contents
+        output_dir: Directory to write the index to
+
+    Returns:
+        Number of files written, left unchanged and removed
+    """
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    written = unchanged = removed = 0
+    for name, data in files.items():
+        path = directory / name
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                unchanged += 1
+                continue
+        except OSError:
+            pass
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        written += 1
+
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.endswith('.json') and entry.name not in files:
+            os.unlink(entry.path)
+            removed += 1
+    return written, unchanged, removed
@@ -0,0 +1,389 @@
+import bisect
+import heapq
+import math
+import re
+import threading
+from operator import itemgetter
+from html import escape
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from app.models.post import Post
+from app.services.search_index import build_search_index
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# Markdown and HTML syntax removed before indexing a post body
+MARKUP_PATTERNS = [
+    (re.compile(r'<[^>]+>'), ' '),
+    (re.compile(r'!\[([^\]]*)\]\([^)]*\)'), r'\1'),
+    (re.compile(r'\[([^\]]+)\]\([^)]*\)'), r'\1'),
+    (re.compile(r'[*_~`#>|]+'), ' '),
+    (re.compile(r'\s+'), ' '),
+]
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in order of appearance
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+def plain_text(markdown_text: str) -> str:
+    """Strip markdown and HTML syntax, leaving readable text.
+
+    Args:
+        markdown_text: Markdown source
+
+    Returns:
+        Plain text on a single line
+    """
+    text = markdown_text
+    for pattern, replacement in MARKUP_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return text.strip()
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character is part of a token, like \\w in TOKEN_PATTERN."""
+    return char.isalnum() or char == '_'
+
+def _first_word(text: str, terms: set) -> Optional[int]:
+    """Find where the first whole-word occurrence of any of the terms starts.
+
+    Args:
+        text: Text to search
+        terms: Lowercase tokens, as produced by tokenize()
+
+    Returns:
+        Offset of the first occurrence, or None if there is none
+    """
+    lower = text.lower()
+    if len(lower) != len(text):
+        # Lowercasing changed offsets; walk the tokens instead
+        for match in TOKEN_PATTERN.finditer(text):
+            if match.group().lower() in terms:
+                return match.start()
+        return None
+    first = None
+    for term in terms:
+        position = lower.find(term)
+        while position >= 0 and (first is None or position < first):
+            end = position + len(term)
+            if ((position == 0 or not _is_word_char(lower[position - 1]))
+                    and (end == len(lower) or not _is_word_char(lower[end]))):
+                first = position
+                break
+            position = lower.find(term, position + 1)
+    return first
+
+class SearchHit(NamedTuple):
+    """A ranked search result.
+
+    Attributes:
+        post: The matching post
+        score: BM25 relevance score
+        snippet: HTML-escaped excerpt with matches wrapped in <mark>
+    """
+    post: Post
+    score: float
+    snippet: str
+
+class _Document(NamedTuple):
+    """Indexed form of a post."""
+    post: Post
+    text: str
+    length: int
+    term_counts: Dict[str, int]
+
+class SearchService:
+    """Service for ranked full-text search over the post corpus.
+
+    Keeps an in-memory inverted index from terms to the posts containing
+    them and ranks matches with BM25. The last query word also matches as a
+    prefix, so results update while typing. The index follows corpus
+    snapshots incrementally: posts that are the same objects as in the
+    previous snapshot are left alone and only added, changed or removed
+    posts are re-indexed.
+    """
+
+    # BM25 parameters
+    K1 = 1.2
+    B = 0.75
+
+    # Title words count as if they appeared this many times in the body
+    TITLE_WEIGHT = 3
+
+    # Weight of a term matched only by prefix, how many terms a prefix may expand
+    # to, and how many of each expanded term's best-scoring postings are walked
+    PREFIX_WEIGHT = 0.5
+    MAX_PREFIX_EXPANSIONS = 32
+    MAX_PREFIX_POSTINGS = 64
+
+    # Terms whose scored postings are kept between queries of one snapshot
+    MAX_CACHED_TERMS = 4096
+
+    def __init__(self, config_service=None):
+        """Initialize the search service.
+
+        Args:
+            config_service: Configuration service instance
+        """
+        self.config = config_service
+        self._documents: Dict[str, _Document] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._terms: List[str] = []
+        self._terms_dirty = False
+        self._total_length = 0
+        self._norms: Dict[str, float] = {}
+        self._impacts: Dict[str, Tuple[float, List[str], List[float]]] = {}
+        self._ranked: Dict[str, Tuple[List[str], List[float]]] = {}
+        self._snapshot = None
+        self._export = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _add(self, post: Post) -> None:
+        """Index a post."""
+        text = plain_text(post.load_content())
+        tokens = tokenize(text)
+        term_counts: Dict[str, int] = {}
+        for token in tokens:
+            term_counts[token] = term_counts.get(token, 0) + 1
+        title_tokens = tokenize(post.title)
+        for token in title_tokens:
+            term_counts[token] = term_counts.get(token, 0) + self.TITLE_WEIGHT
+        length = len(tokens) + self.TITLE_WEIGHT * len(title_tokens)
+
+        for term, count in term_counts.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._terms_dirty = True
+            postings[post.path] = count
+        self._documents[post.path] = _Document(post, text, length, term_counts)
+        self._total_length += length
+
+    def _remove(self, path: str) -> None:
+        """Drop a post from the index."""
+        document = self._documents.pop(path, None)
+        if document is None:
+            return
+        for term in document.term_counts:
+            postings = self._postings[term]
+            del postings[path]
+            if not postings:
+                del self._postings[term]
+                self._terms_dirty = True
+        self._total_length -= document.length
+
+    def update(self, posts: Iterable[Post]) -> None:
+        """Bring the index in line with a corpus snapshot.
+
+        Calling this again with the same snapshot object is free, so it can
+        be called on every request.
+
+        Args:
+            posts: The current posts, e.g. a PostIndex
+        """
+        if posts is self._snapshot:
+            return
+        with self._lock:
+            if posts is self._snapshot:
+                return
+            current = {}
+            for post in posts:
+                current.setdefault(post.path, post)
+            for path in list(self._documents):
+                if current.get(path) is not self._documents[path].post:
+                    self._remove(path)
+            for path, post in current.items():
+                if path not in self._documents:
+                    self._add(post)
+            self._update_norms()
+            self._snapshot = posts
+
+    def _update_norms(self) -> None:
+        """Precompute the BM25 length normalization of every document."""
+        self._impacts = {}
+        self._ranked = {}
+        if not self._documents:
+            self._norms = {}
+            return
+        average_length = self._total_length / len(self._documents) or 1
+        self._norms = {
+            path: self.K1 * (1 - self.B + self.B * document.length / average_length)
+            for path, document in self._documents.items()
+        }
+
+    def _expand(self, token: str, prefix: bool) -> List[Tuple[str, float]]:
+        """Find the indexed terms a query token matches, with their weights."""
+        matches = []
+        if token in self._postings:
+            matches.append((token, 1.0))
+        if not prefix:
+            return matches
+        if self._terms_dirty:
+            self._terms = sorted(self._postings)
+            self._terms_dirty = False
+        start = bisect.bisect_left(self._terms, token)
+        for term in self._terms[start:start + self.MAX_PREFIX_EXPANSIONS + 1]:
+            if not term.startswith(token):
+                break
+            if term != token:
+                matches.append((term, self.PREFIX_WEIGHT))
+        return matches
+
+    def _term_impacts(self, term: str) -> Tuple[float, List[str], List[float]]:
+        """Get a term's idf, and its postings scored without idf.
+        
+        Both only change with the corpus, so they are computed on a term's
+        first query and kept until the next snapshot. Paths and scores are
+        kept in parallel lists rather than pairs, so caching them does not
+        create objects for the garbage collector to track.
+        """
+        cached = self._impacts.get(term)
+        if cached is None:
+            postings = self._postings[term]
+            idf = math.log(1 + (len(self._documents) - len(postings) + 0.5) / (len(postings) + 0.5))
+            norms = self._norms
+            paths = list(postings)
+            impacts = [frequency / (frequency + norms[path]) for path, frequency in postings.items()]
+            if len(self._impacts) >= self.MAX_CACHED_TERMS:
+                self._impacts.clear()
+                self._ranked.clear()
+            self._impacts[term] = cached = (idf, paths, impacts)
+        return cached
+
+    def _best_impacts(self, term: str) -> Tuple[float, List[str], List[float]]:
+        """Get a term's idf and the MAX_PREFIX_POSTINGS best of its scored postings."""
+        idf, paths, impacts = self._term_impacts(term)
+        if len(paths) <= self.MAX_PREFIX_POSTINGS:
+            return idf, paths, impacts
+        best = self._ranked.get(term)
+        if best is None:
+            order = heapq.nlargest(self.MAX_PREFIX_POSTINGS, range(len(impacts)), key=impacts.__getitem__)
+            best = self._ranked[term] = ([paths[i] for i in order], [impacts[i] for i in order])
+        return (idf,) + best
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> List[SearchHit]:
+        """Find the posts best matching a query.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            prefix: Let the last query word match as a prefix
+
+        Returns:
+            Matching posts, best first
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        with self._lock:
+            if not self._documents:
+                return []
+
+            scores: Dict[str, float] = {}
+            matched_terms = []
+            for i, token in enumerate(tokens):
+                is_last = i == len(tokens) - 1
+                for term, weight in self._expand(token, prefix and is_last):
+                    matched_terms.append(term)
+                    if weight == 1.0:
+                        idf, paths, impacts = self._term_impacts(term)
+                    else:
+                        # Prefix matches only add their best postings
+                        idf, paths, impacts = self._best_impacts(term)
+                    factor = weight * idf * (self.K1 + 1)
+                    if not scores:
+                        scores = {path: factor * impact for path, impact in zip(paths, impacts)}
+                        continue
+                    get = scores.get
+                    for path, impact in zip(paths, impacts):
+                        scores[path] = get(path, 0.0) + factor * impact
+
+            hits = []
+            for path, score in heapq.nlargest(limit, scores.items(), key=itemgetter(1)):
+                document = self._documents[path]
+                # Highlighting only the terms the post contains keeps the pattern short
+                terms = [term for term in matched_terms if term in document.term_counts]
+                hits.append(SearchHit(document.post, score, self.snippet(document.text, terms)))
+            return hits
+
+    def export_index(self, shard_bytes: Optional[int] = None) -> Dict[str, bytes]:
+        """Export the index as static, sharded JSON files for client-side search.
+
+        The export is cached until the next corpus snapshot.
+
+        Args:
+            shard_bytes: Size budget of one term shard, search.shard_bytes by default
+
+        Returns:
+            Mapping of file names to file contents, including manifest.json
+        """
+        if shard_bytes is None:
+            shard_bytes = self.config.search_shard_bytes if self.config else 16 * 1024
+        with self._lock:
+            cached = self._export
+            if cached is not None and cached[0] is self._snapshot and cached[1] == shard_bytes:
+                return cached[2]
+            documents = sorted(self._documents.values(), key=lambda d: (d.post.date, d.post.path))
+            files = build_search_index(
+                [(d.post.path, d.post.title, d.post.date.strftime('%Y-%m-%d'), d.length) for d in documents],
+                self._postings,
+                {'k1': self.K1, 'b': self.B, 'prefix_weight': self.PREFIX_WEIGHT,
+                 'max_prefix_expansions': self.MAX_PREFIX_EXPANSIONS,
+                 'max_prefix_postings': self.MAX_PREFIX_POSTINGS},
+                shard_bytes
+            )
+            self._export = (self._snapshot, shard_bytes, files)
+            return files
+
+    @staticmethod
+    def snippet(text: str, terms: List[str], width: int = 160) -> str:
+        """Cut an excerpt around the first match and highlight matched words.
+
+        Args:
+            text: Plain text of the document
+            terms: Indexed terms to highlight
+            width: Approximate length of the excerpt
+
+        Returns:
+            HTML-escaped excerpt with matches wrapped in <mark>
+        """
+        terms = set(terms)
+        first = _first_word(text, terms) if terms else None
+
+        start = 0
+        if first is not None and first > width // 3:
+            # Begin on a word boundary shortly before the first match
+            start = text.find(' ', first - width // 3, first) + 1
+        end = min(len(text), start + width)
+        if end < len(text):
+            space = text.rfind(' ', start, end)
+            end = space if space > start else end
+
+        excerpt = text[start:end]
+        if not terms:
+            excerpt = escape(excerpt)
+        else:
+            parts = []
+            position = 0
+            for match in TOKEN_PATTERN.finditer(excerpt):
+                if match.group().lower() in terms:
+                    parts.append(escape(excerpt[position:match.start()]))
+                    parts.append(f'<mark>{escape(match.group())}</mark>')
+                    position = match.end()
+            parts.append(escape(excerpt[position:]))
+            excerpt = ''.join(parts)
+
+        if start > 0:
+            excerpt = '&hellip;' + excerpt
+        if end < len(text):
+            excerpt += '&hellip;'
+        return excerpt
@@ -1,13 +1,20 @@
-from typing import Dict, Type, Any
+from typing import TYPE_CHECKING, Dict, Type, Any
 from .config_service import ConfigService
-from .markdown_service import MarkdownService
-from .template_service import TemplateService
-from .static_service import StaticService
-from .logging_service import LoggingService
-from .post_service import PostService
+
+if TYPE_CHECKING:
+    from .markdown_service import MarkdownService
+    from .template_service import TemplateService
+    from .static_service import StaticService
+    from .logging_service import LoggingService
+    from .post_service import PostService
+    from .search_service import SearchService
 
 class ServiceFactory:
-    """Factory for creating and managing service instances."""
+    """Factory for creating and managing service instances.
+    
+    Service modules are imported when their service is first requested,
+    so a process only pays for the services it uses.
+    """
     
     _instances: Dict[Type, Any] = {}
     
@@ -15,74 +22,101 @@ class ServiceFactory:
     def get_config_service(cls) -> ConfigService:
         """Get or create ConfigService instance.
         
+        Settings from config.yml are overridden by environment variables
+        such as POST_LOAD_WORKERS, see ConfigService.load_from_env().
+        
         Returns:
             ConfigService instance
         """
         if ConfigService not in cls._instances:
-            cls._instances[ConfigService] = ConfigService()
+            config = ConfigService()
+            config.load_from_env()
+            cls._instances[ConfigService] = config
         return cls._instances[ConfigService]
         
     @classmethod
-    def get_markdown_service(cls) -> MarkdownService:
+    def get_markdown_service(cls) -> 'MarkdownService':
         """Get or create MarkdownService instance.
         
         Returns:
             MarkdownService instance
         """
+        from .markdown_service import MarkdownService
         if MarkdownService not in cls._instances:
             config = cls.get_config_service()
             cls._instances[MarkdownService] = MarkdownService(config)
         return cls._instances[MarkdownService]
         
     @classmethod
-    def get_template_service(cls) -> TemplateService:
+    def get_template_service(cls) -> 'TemplateService':
         """Get or create TemplateService instance.
         
         Returns:
             TemplateService instance
         """
+        from .template_service import TemplateService
         if TemplateService not in cls._instances:
             config = cls.get_config_service()
             cls._instances[TemplateService] = TemplateService(config)
         return cls._instances[TemplateService]
         
     @classmethod
-    def get_static_service(cls) -> StaticService:
+    def get_static_service(cls) -> 'StaticService':
         """Get or create StaticService instance.
         
         Returns:
             StaticService instance
         """
+        from .static_service import StaticService
         if StaticService not in cls._instances:
             config = cls.get_config_service()
             cls._instances[StaticService] = StaticService(config)
         return cls._instances[StaticService]
         
     @classmethod
-    def get_logging_service(cls) -> LoggingService:
+    def get_logging_service(cls) -> 'LoggingService':
         """Get or create LoggingService instance.
         
         Returns:
             LoggingService instance
         """
+        from .logging_service import LoggingService
         if LoggingService not in cls._instances:
             config = cls.get_config_service()
             cls._instances[LoggingService] = LoggingService(config)
         return cls._instances[LoggingService]
         
     @classmethod
-    def get_post_service(cls) -> PostService:
+    def get_post_service(cls) -> 'PostService':
         """Get or create PostService instance.
         
+        This is the one corpus loader of the process: the Flask app, the
+        static builder and scripts all share it, so every post is parsed
+        once and its HTML rendered at most once.
+        
         Returns:
             PostService instance
         """
+        from .post_service import PostService
         if PostService not in cls._instances:
             config = cls.get_config_service()
             markdown = cls.get_markdown_service()
-            cls._instances[PostService] = PostService(config, markdown)
+            cls._instances[PostService] = PostService(config, markdown, metadata_only=True)
         return cls._instances[PostService]
         
+    @classmethod
+    def get_search_service(cls) -> 'SearchService':
+        """Get or create SearchService instance.
+        
+        Returns:
+            SearchService instance
+        """
+        from .search_service import SearchService
+        if SearchService not in cls._instances:
+            config = cls.get_config_service()
+            cls._instances[SearchService] = SearchService(config)
+        return cls._instances[SearchService]
+        
     @classmethod
     def reset(cls):
         """Reset all service instances."""
@@ -101,6 +135,13 @@ class ServiceFactory:
         Raises:
             ValueError: If service class is not supported
         """
+        from .markdown_service import MarkdownService
+        from .template_service import TemplateService
+        from .static_service import StaticService
+        from .logging_service import LoggingService
+        from .post_service import PostService
+        from .search_service import SearchService
+        
         if service_class == ConfigService:
             return cls.get_config_service()
         elif service_class == MarkdownService:
@@ -113,6 +154,8 @@ class ServiceFactory:
             return cls.get_logging_service()
         elif service_class == PostService:
             return cls.get_post_service()
+        elif service_class == SearchService:
+            return cls.get_search_service()
         else:
             raise ValueError(f"Unsupported service class: {service_class}")
             
@@ -1,9 +1,31 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, NamedTuple, Optional, Tuple
 from pathlib import Path
 import shutil
 import os
+import hashlib
+import logging
 import mimetypes
+import threading
 from datetime import datetime
+from werkzeug.security import safe_join
+from app.utils.build_manifest import hash_file
+from app.utils.compress import MIN_SIZE, gzip_bytes, is_compressible
+from app.utils.minify import MINIFY_VERSION, minify_css, minify_js
+from app.utils.static import SyncStats, fingerprint_name, rewrite_css_urls, split_fingerprint, sync_tree
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Fingerprinted files never change, so browsers may keep them for a year
+IMMUTABLE_MAX_AGE = 31536000
+
+class _Asset(NamedTuple):
+    """A static file or bundle with its fingerprinted name."""
+    key: Tuple
+    name: str
+    dependencies: Tuple[Tuple[str, str], ...]
+    content: Optional[bytes]
 
 class StaticService:
     """Service for handling static files."""
@@ -16,33 +38,237 @@ class StaticService:
         """
         self.config = config_service
         self.static_dir = Path(self.config.static_dir)
+        if not self.static_dir.is_absolute():
+            # Relative to the project root, so the working directory does not matter
+            self.static_dir = PROJECT_ROOT / self.static_dir
         self.cache_timeout = self.config.static_cache_timeout
+        self._assets: Dict[str, _Asset] = {}
+        self._assets_lock = threading.RLock()
+        self._resolving = set()
+        # Fingerprinted name and gzip stream of each static file, by path
+        self._compressed: Dict[str, Tuple[str, Optional[bytes]]] = {}
+        self._bundles: Dict[str, Tuple[str, bytes]] = {}
+        
+    def copy_static_files(self, output_dir: str, transforms: Optional[Dict[str, Callable[[str, bytes], bytes]]] = None,
+                          keep: Optional[Callable[[str], bool]] = None) -> SyncStats:
+        """Sync static files to output directory.
         
-    def copy_static_files(self, output_dir: str) -> None:
-        """Copy static files to output directory.
+        Only files whose size, modification time or contents changed are
+        copied, and files deleted from the static directory are removed
+        from the output. Files are hardlinked instead of copied if
+        static.hardlink is set.
         
         Args:
             output_dir: Output directory path
+            transforms: Functions rewriting files by suffix on the way, see sync_tree()
+            keep: Tells which output files missing from the static directory stay
+            
+        Returns:
+            What was copied, linked, kept and removed
         """
-        output_path = Path(output_dir)
-        static_output = output_path / 'static'
+        static_output = Path(output_dir) / 'static'
+        return sync_tree(str(self.static_dir), str(static_output), transforms=transforms,
+                         link=self.config.static_hardlink, keep=keep)
         
-        # Create output directory if it doesn't exist
-        static_output.mkdir(parents=True, exist_ok=True)
+    def asset_name(self, file_path: str) -> str:
+        """Get the fingerprinted name of a static file.
+        
+        The name carries a hash of the file's contents, e.g.
+        css/style.1a2b3c4d5e.css, so it changes whenever the file does.
+        Hashes are kept until the file's size or modification time changes;
+        a stylesheet's hash also covers the files its url() references
+        point at, since its published contents link to their names.
+        
+        Args:
+            file_path: Path to static file
+            
+        Returns:
+            Fingerprinted path, or file_path itself if there is no such file
+        """
+        asset = self._get_asset(file_path)
+        return asset.name if asset else file_path
+        
+    def asset_content(self, file_path: str) -> Optional[bytes]:
+        """Get the published contents of a static file if they differ from the file.
+        
+        Args:
+            file_path: Path to static file or bundle
+            
+        Returns:
+            The stylesheet with fingerprinted url() references, the minified
+            bundle, or None if the file is published as is
+        """
+        asset = self._get_asset(file_path)
+        if asset is None:
+            return None
+        if file_path in self.config.static_bundles:
+            return self._get_bundle_content(file_path, asset)
+        return asset.content
+        
+    def compressed_asset(self, file_path: str) -> Optional[bytes]:
+        """Get the published contents of a static file compressed with gzip.
+        
+        The compressed contents are made once per fingerprint, at the
+        highest compression level. Only the current fingerprint of each
+        file is kept.
+        
+        Args:
+            file_path: Path to static file
+            
+        Returns:
+            The gzip stream, or None if the file does not get smaller
+        """
+        asset = self._get_asset(file_path)
+        if asset is None or not is_compressible(file_path):
+            return None
+        with self._assets_lock:
+            cached = self._compressed.get(file_path)
+        if cached is not None and cached[0] == asset.name:
+            return cached[1]
+        
+        # Compressed outside the lock, so other requests are not held up;
+        # two threads may compress the same file once
+        content = self.asset_content(file_path)
+        if content is None:
+            with open(safe_join(str(self.static_dir), file_path), 'rb') as f:
+                content = f.read()
+        compressed = gzip_bytes(content) if len(content) >= MIN_SIZE else None
+        if compressed is not None and len(compressed) >= len(content):
+            compressed = None
+        with self._assets_lock:
+            self._compressed[file_path] = (asset.name, compressed)
+        return compressed
+        
+    def asset_dependencies(self, file_path: str) -> List[str]:
+        """Get the static files a stylesheet or bundle links to by fingerprinted name.
+        
+        Args:
+            file_path: Path to static file
+            
+        Returns:
+            Paths of the referenced static files
+        """
+        asset = self._get_asset(file_path)
+        return [dependency for dependency, _ in asset.dependencies] if asset else []
+        
+    def resolve_asset(self, name: str) -> Optional[str]:
+        """Get the static file a fingerprinted name stands for.
+        
+        Args:
+            name: Fingerprinted path, as made by asset_name()
+            
+        Returns:
+            Path to static file, or None if name is not the current
+            fingerprint of a file
+        """
+        split = split_fingerprint(name)
+        if split is None:
+            return None
+        file_path = split[0]
+        return file_path if self.asset_name(file_path) == name else None
+        
+    def _get_asset(self, file_path: str) -> Optional[_Asset]:
+        """Get the fingerprint of a static file, hashing it if it changed."""
+        bundles = self.config.static_bundles
+        if file_path in bundles:
+            return self._get_bundle(file_path, bundles[file_path])
+        path = safe_join(str(self.static_dir), file_path)
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if not os.path.isfile(path):
+            return None
+        key = (stat.st_size, stat.st_mtime_ns)
+        
+        with self._assets_lock:
+            cached = self._assets.get(file_path)
+            if cached is not None and cached.key == key and all(
+                    self.asset_name(dependency) == name for dependency, name in cached.dependencies):
+                return cached
+            if file_path in self._resolving:
+                # Stylesheets referencing each other
+                return None
+            
+            self._resolving.add(file_path)
+            try:
+                dependencies = []
+                content = None
+                if file_path.endswith('.css'):
+                    def asset_name(dependency):
+                        name = self.asset_name(dependency)
+                        if name != dependency:
+                            dependencies.append((dependency, name))
+                        return name
+                    with open(path, 'rb') as f:
+                        css = f.read().decode('utf-8', 'surrogateescape')
+                    content = rewrite_css_urls(css, file_path, asset_name).encode('utf-8', 'surrogateescape')
+                    digest = hashlib.sha256(content).hexdigest()
+                else:
+                    digest = hash_file(path)
+            finally:
+                self._resolving.discard(file_path)
+            
+            asset = _Asset(key, fingerprint_name(file_path, digest), tuple(dependencies), content)
+            self._assets[file_path] = asset
+            return asset
+        
+    def _get_bundle(self, file_path: str, members: List[str]) -> Optional[_Asset]:
+        """Get the fingerprint of a bundle from the fingerprints of its files.
+        
+        The bundle is named after a hash of its inputs, so nothing is
+        concatenated or minified until its contents are asked for.
+        """
+        assets = []
+        for member in members:
+            asset = self._get_asset(member)
+            if asset is None or member in self.config.static_bundles:
+                logger.warning(f"Static bundle {file_path} lists {member}, which is not a static file")
+                return None
+            assets.append(asset)
+        key = tuple(asset.name for asset in assets)
+        
+        with self._assets_lock:
+            cached = self._assets.get(file_path)
+            if cached is not None and cached.key == key:
+                return cached
+            inputs = '\n'.join((str(MINIFY_VERSION), file_path) + key)
+            digest = hashlib.sha256(inputs.encode('utf-8')).hexdigest()
+            dependencies = tuple(dict.fromkeys(dependency for asset in assets for dependency in asset.dependencies))
+            asset = _Asset(key, fingerprint_name(file_path, digest), dependencies, None)
+            self._assets[file_path] = asset
+            return asset
+        
+    def _get_bundle_content(self, file_path: str, asset: _Asset) -> bytes:
+        """Concatenate and minify the files of a bundle, once per fingerprint.
+        
+        Stylesheets get their url() references fingerprinted and rebased on
+        the bundle's directory. Files already minified, named *.min.css or
+        *.min.js, are taken as they are.
+        """
+        with self._assets_lock:
+            cached = self._bundles.get(file_path)
+            if cached is not None and cached[0] == asset.name:
+                return cached[1]
+            
+            parts = []
+            for member in self.config.static_bundles[file_path]:
+                with open(safe_join(str(self.static_dir), member), 'rb') as f:
+                    text = f.read().decode('utf-8', 'surrogateescape')
+                minified = member.endswith(('.min.css', '.min.js'))
+                if member.endswith('.css'):
+                    text = rewrite_css_urls(text, member, self.asset_name, published_path=file_path)
+                    parts.append(text.strip() if minified else minify_css(text))
+                else:
+                    parts.append(text.strip() if minified else minify_js(text).strip())
+            # A script without a final semicolon must not run into the next one
+            separator = '\n' if file_path.endswith('.css') else '\n;\n'
+            content = (separator.join(parts) + '\n').encode('utf-8', 'surrogateescape')
+            self._bundles[file_path] = (asset.name, content)
+            return content
         
-        # Copy all files from static directory
-        for item in self.static_dir.glob('**/*'):
-            if item.is_file():
-                # Get relative path from static directory
-                rel_path = item.relative_to(self.static_dir)
-                target_path = static_output / rel_path
-                
-                # Create parent directories if needed
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Copy file
-                shutil.copy2(item, target_path)
-                
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """Get information about a static file.
         
@@ -101,12 +327,23 @@ class StaticService:
     def get_cache_headers(self, file_path: str) -> Dict[str, str]:
         """Get cache headers for a static file.
         
+        Fingerprinted names are cached for good, other files for
+        static.cache_timeout seconds.
+        
         Args:
             file_path: Path to static file
             
         Returns:
             Dictionary of cache headers
         """
+        original = self.resolve_asset(file_path)
+        if original is not None:
+            mime_type, _ = mimetypes.guess_type(original)
+            return {
+                'Cache-Control': f'public, max-age={IMMUTABLE_MAX_AGE}, immutable',
+                'Content-Type': mime_type or 'application/octet-stream'
+            }
+            
         info = self.get_file_info(file_path)
         if not info:
             return {}
@@ -0,0 +1,427 @@
+const words = [
+    // Kid-friendly words
+    'APPLE', 'BANANA', 'ORANGE', 'GRAPE', 'STRAWBERRY', 'WATERMELON', 'PINEAPPLE', 'BLUEBERRY',
+    'CHERRY', 'LEMON', 'PEACH', 'PLUM', 'MANGO', 'KIWI', 'MELON', 'RASPBERRY',
+    'PENGUIN', 'DOLPHIN', 'ELEPHANT', 'GIRAFFE', 'LION', 'TIGER', 'ZEBRA', 'MONKEY',
+    'KANGAROO', 'KOALA', 'PANDA', 'RABBIT', 'SQUIRREL', 'HEDGEHOG', 'HORSE', 'COW',
+    'SUN', 'MOON', 'STAR', 'CLOUD', 'RAIN', 'SNOW', 'WIND', 'STORM',
+    'TREE', 'FLOWER', 'GRASS', 'BUSH', 'LEAF', 'ROSE', 'TULIP', 'DAISY',
+    'HOUSE', 'CAR', 'BUS', 'TRAIN', 'PLANE', 'SHIP', 'BOAT', 'BIKE',
+    'BALL', 'DOLL', 'BLOCK', 'PUZZLE', 'GAME', 'TOY', 'BOOK', 'CRAYON',
+    'PENCIL', 'PAPER', 'DESK', 'CHAIR', 'TABLE', 'BED', 'SOFA', 'LAMP',
+    'DOOR', 'WINDOW', 'WALL', 'FLOOR', 'CEILING', 'ROOF', 'GARDEN', 'PARK',
+    'SCHOOL', 'LIBRARY', 'STORE', 'HOSPITAL', 'ZOO', 'BEACH', 'POOL', 'PLAYGROUND',
+    'PIZZA', 'HAMBURGER', 'HOTDOG', 'SANDWICH', 'COOKIE', 'CAKE', 'ICE CREAM', 'CANDY',
+    'MILK', 'JUICE', 'WATER', 'SODA', 'TEA', 'COFFEE', 'CHOCOLATE', 'CEREAL',
+    'SHIRT', 'PANTS', 'DRESS', 'SHOES', 'SOCKS', 'HAT', 'GLOVES', 'SCARF',
+    'RED', 'BLUE', 'GREEN', 'YELLOW', 'PURPLE', 'ORANGE', 'PINK', 'BROWN',
+    'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN', 'EIGHT',
+    'NINE', 'TEN', 'ZERO', 'PLUS', 'MINUS', 'EQUAL', 'CIRCLE', 'SQUARE',
+    'TRIANGLE', 'HEART', 'DIAMOND', 'STAR', 'MOON', 'SUN', 'CLOUD', 'RAINBOW',
+    'MUSIC', 'SONG', 'DANCE', 'SING', 'DRUM', 'PIANO', 'GUITAR', 'VIOLIN',
+    'FRIEND', 'FAMILY', 'MOTHER', 'FATHER', 'SISTER', 'BROTHER', 'BABY', 'GRANDPA',
+    'GRANDMA', 'AUNT', 'UNCLE', 'COUSIN', 'TEACHER', 'DOCTOR', 'NURSE', 'POLICE',
+    'FIREFIGHTER', 'MAILMAN', 'CHEF', 'ARTIST', 'DENTIST', 'VET', 'FARMER', 'BUILDER',
+    'SPRING', 'SUMMER', 'FALL', 'WINTER', 'MORNING', 'AFTERNOON', 'EVENING', 'NIGHT',
+    'MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY', 'TODAY',
+    'TOMORROW', 'YESTERDAY', 'BIRTHDAY', 'CHRISTMAS', 'HALLOWEEN', 'EASTER', 'THANKSGIVING', 'NEW YEAR',
+    // Existing programming-related words
+    'PYTHON', 'JAVASCRIPT', 'PROGRAMMING', 'DEVELOPER', 'COMPUTER',
+    'ALGORITHM', 'DATABASE', 'NETWORK', 'SECURITY', 'INTERNET'
+];
+
+const hangmanStages = [
+    `
+     +---+
+     |   |
+         |
+         |
+         |
+         |
+    =========`,
+    `
+     +---+
+     |   |
+     O   |
+         |
+         |
+         |
+    =========`,
+    `
+     +---+
+     |   |
+     O   |
+     |   |
+         |
+         |
+    =========`,
+    `
+     +---+
+     |   |
+     O   |
+    /|   |
+         |
+         |
+    =========`,
+    `
+     +---+
+     |   |
+     O   |
+    /|\\  |
+         |
+         |
+    =========`,
+    `
+     +---+
+     |   |
+     O   |
+    /|\\  |
+    /    |
+         |
+    =========`,
+    `
+     +---+
+     |   |
+     O   |
+    /|\\  |
+    / \\  |
+         |
+    =========`
+];
+
+let currentWord = '';
+let guessedLetters = new Set();
+let wrongGuesses = 0;
+let gameOver = false;
+
+// Create fireworks container
+const fireworksContainer = document.createElement('div');
+fireworksContainer.className = 'fireworks-container';
+document.querySelector('.game-info').appendChild(fireworksContainer);
+
+// Create board for fireworks
+const board = document.createElement('div');
+board.id = 'board';
+fireworksContainer.appendChild(board);
+
+// Arrays to store fireworks elements
+let particles = [];
+let seeds = [];
+
+// Physics constants
+const fwkPtcIniV = 0.5; // Initial velocity for particles
+const fwkPtcIniT = 2500; // Time particles will survive (ms)
+const fwkSedIniV = 0.8; // Initial velocity for seeds (rockets)
+const fwkSedIniT = 1000; // Time seeds will survive (ms)
+const a = 0.0005; // Air resistance
+const g = 0.0005; // Gravity
+const v = 0.3; // Randomness factor for velocity
+
+// Create a new firework particle
+function newFireworkParticle(x, y, angle) {
+    const fwkPtc = document.createElement('div');
+    fwkPtc.setAttribute('class', 'firework-particle');
+    board.appendChild(fwkPtc);
+    
+    // Set initial position
+    fwkPtc.style.left = x + 'px';
+    fwkPtc.style.top = y + 'px';
+    
+    // Set time to live
+    fwkPtc.time = fwkPtcIniT;
+    
+    // Normalize angle
+    while(angle > 360) angle -= 360;
+    while(angle < 0) angle += 360;
+    
+    // Calculate velocity based on angle
+    fwkPtc.velocity = {};
+    fwkPtc.velocity.x = fwkPtcIniV * Math.sin(angle * Math.PI / 180) * (1 - Math.random() * v);
+    fwkPtc.velocity.y = fwkPtcIniV * Math.cos(angle * Math.PI / 180) * (1 - Math.random() * v);
+    
+    // Store position
+    fwkPtc.position = {};
+    fwkPtc.position.x = x;
+    fwkPtc.position.y = y;
+    
+    // Add to particles array
+    particles.push(fwkPtc);
+    
+    return fwkPtc;
+}
+
+// Create a new firework seed (rocket)
+function newFireworkSeed(x, y) {
+    const fwkSed = document.createElement('div');
+    fwkSed.setAttribute('class', 'firework-seed');
+    board.appendChild(fwkSed);
+    
+    // Set initial position
+    fwkSed.style.left = x + 'px';
+    fwkSed.style.top = y + 'px';
+    
+    // Set time to live
+    fwkSed.time = fwkSedIniT;
+    
+    // Set velocity (moving upward)
+    fwkSed.velocity = {};
+    fwkSed.velocity.x = 0;
+    fwkSed.velocity.y = fwkSedIniV;
+    
+    // Store position
+    fwkSed.position = {};
+    fwkSed.position.x = x;
+    fwkSed.position.y = y;
+    
+    // Add to seeds array
+    seeds.push(fwkSed);
+    
+    return fwkSed;
+}
+
+// Create a firework star (explosion)
+function newFireworkStar(x, y) {
+    // Create particles in a circular pattern
+    let angle = 0;
+    while(angle < 360) {
+        newFireworkParticle(x, y, angle);
+        angle += 5; // Adjust for density of particles
+    }
+}
+
+// Animation frame function
+let before = Date.now();
+let animationId = null;
+
+function frame() {
+    const current = Date.now();
+    const deltaTime = current - before;
+    before = current;
+    
+    // Update seeds (rockets)
+    for(let i in seeds) {
+        const fwkSed = seeds[i];
+        fwkSed.time -= deltaTime;
+        
+        if(fwkSed.time > 0) {
+            // Apply physics
+            fwkSed.velocity.x -= fwkSed.velocity.x * a * deltaTime;
+            fwkSed.velocity.y -= g * deltaTime + fwkSed.velocity.y * a * deltaTime;
+            
+            // Update position
+            fwkSed.position.x += fwkSed.velocity.x * deltaTime;
+            fwkSed.position.y -= fwkSed.velocity.y * deltaTime;
+            
+            // Update visual position
+            fwkSed.style.left = fwkSed.position.x + 'px';
+            fwkSed.style.top = fwkSed.position.y + 'px';
+        } else {
+            // Create explosion when seed expires
+            newFireworkStar(fwkSed.position.x, fwkSed.position.y);
+            fwkSed.parentNode.removeChild(fwkSed);
+            seeds.splice(i, 1);
+        }
+    }
+    
+    // Update particles
+    for(let i in particles) {
+        const fwkPtc = particles[i];
+        fwkPtc.time -= deltaTime;
+        
+        if(fwkPtc.time > 0) {
+            // Apply physics
+            fwkPtc.velocity.x -= fwkPtc.velocity.x * a * deltaTime;
+            fwkPtc.velocity.y -= g * deltaTime + fwkPtc.velocity.y * a * deltaTime;
+            
+            // Update position
+            fwkPtc.position.x += fwkPtc.velocity.x * deltaTime;
+            fwkPtc.position.y -= fwkPtc.velocity.y * deltaTime;
+            
+            // Update visual position
+            fwkPtc.style.left = fwkPtc.position.x + 'px';
+            fwkPtc.style.top = fwkPtc.position.y + 'px';
+        } else {
+            // Remove expired particles
+            fwkPtc.parentNode.removeChild(fwkPtc);
+            particles.splice(i, 1);
+        }
+    }
+    
+    // Continue animation if there are still elements
+    if(seeds.length > 0 || particles.length > 0) {
+        animationId = requestAnimationFrame(frame);
+    } else {
+        // Stop animation when all elements are gone
+        cancelAnimationFrame(animationId);
+        animationId = null;
+    }
+}
+
+// Launch a firework from a specific position
+function launchFirework(x, y) {
+    newFireworkSeed(x, y);
+    
+    // Start animation if not already running
+    if(animationId === null) {
+        before = Date.now();
+        animationId = requestAnimationFrame(frame);
+    }
+}
+
+// Show fireworks celebration
+function showFireworks() {
+    fireworksContainer.style.display = 'block';
+    
+    // Get the game container dimensions
+    const gameInfo = document.querySelector('.game-info');
+    const gameWidth = gameInfo.offsetWidth;
+    const gameHeight = gameInfo.offsetHeight;
+    
+    // Launch multiple fireworks
+    const interval = setInterval(() => {
+        // Random position for each firework within the game area
+        const x = Math.random() * gameWidth;
+        const y = gameHeight;
+        launchFirework(x, y);
+    }, 300);
+    
+    // Stop fireworks after 5 seconds
+    setTimeout(() => {
+        clearInterval(interval);
+        setTimeout(() => {
+            fireworksContainer.style.display = 'none';
+        }, 2000); // Wait for last fireworks to finish
+    }, 5000);
+}
+
+function initGame() {
+    currentWord = words[Math.floor(Math.random() * words.length)];
+    guessedLetters.clear();
+    wrongGuesses = 0;
+    gameOver = false;
+    updateWordDisplay();
+    updateHangmanDisplay();
+    updateKeyboard();
+    document.getElementById('game-status').textContent = '';
+}
+
+function updateWordDisplay() {
+    const display = document.getElementById('word-display');
+    display.textContent = currentWord
+        .split('')
+        .map(letter => guessedLetters.has(letter) ? letter : '_')
+        .join(' ');
+    
+    if (!display.textContent.includes('_')) {
+        gameOver = true;
+        document.getElementById('game-status').textContent = 'Congratulations! You won!';
+        showFireworks(); // Show fireworks when player wins
+    }
+}
+
+function updateHangmanDisplay() {
+    const parts = document.getElementsByClassName('hangman-part');
+    // Show parts up to the current number of wrong guesses
+    for (let i = 0; i < parts.length; i++) {
+        if (i < wrongGuesses) {
+            parts[i].style.display = 'block';
+            // Add slight swing animation to the hanging parts
+            if (i > 0) { // Don't animate the rope
+                parts[i].style.transform = `rotate(${Math.sin(Date.now() / 1000) * 2}deg)`;
+            }
+        } else {
+            parts[i].style.display = 'none';
+        }
+    }
+
+    if (wrongGuesses === 7) { // Game over after 7 wrong guesses
+        // Add sad face expression
+        const face = document.querySelector('#hangman g:nth-child(2)');
+        if (face) {
+            const mouth = face.querySelector('path');
+            mouth.setAttribute('d', 'M190 130 Q200 120 210 130');
+        }
+        
+        // Set game over state
+        gameOver = true;
+        document.getElementById('game-status').textContent = `Game Over! The word was: ${currentWord}`;
+        updateKeyboard(); // Disable all keyboard buttons
+    }
+}
+
+function showWinAnimation() {
+    const hangman = document.getElementById('hangman');
+    const parts = document.getElementsByClassName('hangman-part');
+    
+    // Hide all parts with a fade out effect
+    for (let part of parts) {
+        part.style.transition = 'opacity 0.5s ease';
+        part.style.opacity = '0';
+    }
+
+    // Add happy jumping animation to celebrate
+    hangman.style.animation = 'jump 0.5s ease infinite alternate';
+}
+
+// Add CSS animation for the jump
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes jump {
+        from { transform: translateY(0); }
+        to { transform: translateY(-20px); }
+    }
+`;
+document.head.appendChild(style);
+
+function updateKeyboard() {
+    const keyboard = document.getElementById('keyboard');
+    keyboard.innerHTML = '';
+    
+    for (let i = 65; i <= 90; i++) {
+        const letter = String.fromCharCode(i);
+        const button = document.createElement('button');
+        button.textContent = letter;
+        button.disabled = guessedLetters.has(letter) || gameOver;
+        button.classList.toggle('used', guessedLetters.has(letter));
+        
+        button.addEventListener('click', () => {
+            guessLetter(letter);
+        });
+        
+        keyboard.appendChild(button);
+    }
+}
+
+// Function to handle letter guessing
+function guessLetter(letter) {
+    if (!gameOver && !guessedLetters.has(letter)) {
+        guessedLetters.add(letter);
+        if (!currentWord.includes(letter)) {
+            wrongGuesses++;
+            updateHangmanDisplay();
+            
+            // Check if game is over after updating hangman
+            if (wrongGuesses === 7) { // Game over after 7 wrong guesses
+                gameOver = true;
+                document.getElementById('game-status').textContent = `Game Over! The word was: ${currentWord}`;
+                updateKeyboard(); // Disable all keyboard buttons
+            }
+        }
+        updateWordDisplay();
+        updateKeyboard();
+    }
+}
+
+// Add keyboard event listener for typing letters
+document.addEventListener('keydown', (event) => {
+    // Only process if it's a letter key (A-Z)
+    if (event.key.length === 1 && /[a-zA-Z]/.test(event.key)) {
+        const letter = event.key.toUpperCase();
+        guessLetter(letter);
+    }
+});
+
+document.getElementById('new-game').addEventListener('click', initGame);
+
+// Initialize the game
+initGame();
@@ -0,0 +1,306 @@
+import os
+import json
+import hashlib
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Bump when the manifest layout changes; older manifests are then ignored
+MANIFEST_VERSION = 1
+
+def hash_inputs(*parts: Any) -> str:
+    """
+    Hash JSON-serializable build inputs into a stable digest.
+
+    Args:
+        *parts: Strings, numbers, lists or dicts describing the inputs
+
+    Returns:
+        str: Hex digest of the inputs
+    """
+    data = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+def hash_file(file_path: str) -> str:
+    """
+    Hash the contents of a file.
+
+    Args:
+        file_path (str): Path to the file
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def write_output(output_path: str, content: Union[str, bytes],
+                 previous_hash: Optional[str] = None) -> Tuple[str, int, bool]:
+    """
+    Write an output file atomically unless it already has these contents.
+
+    Args:
+        output_path (str): Path of the output file
+        content (Union[str, bytes]): The rendered output; text is written as UTF-8
+        previous_hash (Optional[str]): Hash of the contents the previous build
+            recorded for this file
+
+    Returns:
+        Tuple[str, int, bool]: Hash and size of the contents, and whether the
+        file was written
+    """
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    output_hash = hashlib.sha256(data).hexdigest()
+    if previous_hash == output_hash:
+        try:
+            if os.path.getsize(output_path) == len(data):
+                return output_hash, len(data), False
+        except OSError:
+            pass
+
+    directory = os.path.dirname(output_path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return output_hash, len(data), True
+
+class BuildManifest:
+    """
+    Record of the outputs of a static build and the inputs they came from.
+
+    Every output is stored with a hash of its inputs (templates, source
+    files, context data), the templates it was rendered from and a hash of
+    its contents. A later build renders an output again only when its
+    input hash changed or the file went missing, skips the write when the
+    new contents are identical, and removes outputs that the build no
+    longer produces.
+    """
+
+    def __init__(self, manifest_path: str, salt: str = ''):
+        """
+        Load the manifest of the previous build.
+
+        Args:
+            manifest_path (str): Where the manifest is stored
+            salt (str): Hash of everything that affects every output, such as
+                the builder itself and the site configuration. A different
+                salt makes every recorded output stale; the outputs are still
+                known, so orphans are removed and identical writes skipped.
+        """
+        self.manifest_path = manifest_path
+        self.salt = salt
+        self._previous: Dict[str, Dict[str, Any]] = {}
+        self._current: Dict[str, Dict[str, Any]] = {}
+        self._template_hashes: Dict[str, str] = {}
+        self._invalidated = False
+        # Outputs carried over, written, and rendered again with identical contents
+        self.kept = self.written = self.unchanged = 0
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self._previous = data.get('outputs', {})
+                self._invalidated = data.get('salt') != salt
+        except (OSError, ValueError):
+            pass
+
+    def template_hash(self, env, name: str) -> str:
+        """
+        Hash a template together with every template it extends, includes or imports.
+
+        Args:
+            env: The Jinja environment the template is loaded from
+            name (str): The template name
+
+        Returns:
+            str: Hex digest covering the template's whole dependency chain
+        """
+        cached = self._template_hashes.get(name)
+        if cached is not None:
+            return cached
+
+        from jinja2 import meta
+
+        # Guard against templates that reference each other
+        self._template_hashes[name] = ''
+        source, _, _ = env.loader.get_source(env, name)
+        references = meta.find_referenced_templates(env.parse(source))
+        # References computed at render time come back as None and cannot be followed
+        dependencies = sorted(
+            (reference, self.template_hash(env, reference))
+            for reference in set(references)
+            if reference is not None
+        )
+        digest = hash_inputs(name, hashlib.sha256(source.encode('utf-8')).hexdigest(), dependencies)
+        self._template_hashes[name] = digest
+        return digest
+
+    def is_fresh(self, output_path: str, inputs: str) -> bool:
+        """
+        Check whether an output from the previous build can be kept as is.
+
+        Args:
+            output_path (str): Path of the output file
+            inputs (str): Hash of the output's current inputs
+
+        Returns:
+            bool: True if the inputs are unchanged and the file is still there
+        """
+        entry = self._previous.get(output_path)
+        if entry is None or self._invalidated or entry['inputs'] != inputs:
+            return False
+        try:
+            return os.path.getsize(output_path) == entry['size']
+        except OSError:
+            return False
+
+    def keep(self, output_path: str, stale: bool = False) -> None:
+        """
+        Carry an output of the previous build over unchanged.
+
+        Args:
+            output_path (str): Path of the output file
+            stale (bool): Keep the file but build it again next time, e.g.
+                because building it failed this time
+        """
+        entry = self._previous[output_path]
+        self._current[output_path] = dict(entry, inputs=None) if stale else entry
+        self.kept += 1
+
+    def previous_hash(self, output_path: str) -> Optional[str]:
+        """
+        Get the hash of the contents the previous build wrote to an output.
+
+        Args:
+            output_path (str): Path of the output file
+
+        Returns:
+            Optional[str]: Hex digest, or None if the output is new
+        """
+        entry = self._previous.get(output_path)
+        return entry['output'] if entry else None
+
+    def previous_templates(self, output_path: str) -> Optional[List[str]]:
+        """
+        Get the templates the previous build rendered an output from.
+
+        Args:
+            output_path (str): Path of the output file
+
+        Returns:
+            Optional[List[str]]: Template names, or None if the output is new
+        """
+        entry = self._previous.get(output_path)
+        return entry.get('templates', []) if entry else None
+
+    def previous_assets(self, output_path: str) -> List[str]:
+        """
+        Get the fingerprinted static files an output of the previous build linked to.
+
+        Args:
+            output_path (str): Path of the output file
+
+        Returns:
+            List[str]: Fingerprinted names, empty if the output is new
+        """
+        entry = self._previous.get(output_path)
+        return entry.get('assets', []) if entry else []
+
+    def assets(self) -> List[str]:
+        """
+        Get the fingerprinted static files the outputs of this build link to.
+
+        Returns:
+            List[str]: Fingerprinted names
+        """
+        return sorted({name for entry in self._current.values() for name in entry.get('assets', [])})
+
+    def record(self, output_path: str, inputs: str, output_hash: str, size: int, written: bool,
+               templates: Optional[List[str]] = None, assets: Optional[List[str]] = None) -> None:
+        """
+        Record an output that was rendered by this build.
+
+        Args:
+            output_path (str): Path of the output file
+            inputs (str): Hash of the output's inputs
+            output_hash (str): Hash of the output's contents
+            size (int): Size of the output in bytes
+            written (bool): Whether the file was written
+            templates (Optional[List[str]]): Templates the output was rendered from
+            assets (Optional[List[str]]): Fingerprinted static files the output links to
+        """
+        self._current[output_path] = {'inputs': inputs, 'output': output_hash, 'size': size,
+                                      'templates': templates or [], 'assets': assets or []}
+        if written:
+            self.written += 1
+        else:
+            self.unchanged += 1
+
+    def write(self, output_path: str, inputs: str, content: Union[str, bytes],
+              templates: Optional[List[str]] = None) -> bool:
+        """
+        Record an output and write it unless the file already has these contents.
+
+        Args:
+            output_path (str): Path of the output file
+            inputs (str): Hash of the output's inputs
+            content (Union[str, bytes]): The rendered output
+            templates (Optional[List[str]]): Templates the output was rendered from
+
+        Returns:
+            bool: True if the file was written
+        """
+        output_hash, size, written = write_output(output_path, content, self.previous_hash(output_path))
+        self.record(output_path, inputs, output_hash, size, written, templates)
+        return written
+
+    def orphans(self) -> List[str]:
+        """
+        Get the outputs of the previous build that this build did not produce.
+
+        Returns:
+            List[str]: Paths of the orphaned output files
+        """
+        return sorted(path for path in self._previous if path not in self._current)
+
+    def remove_orphans(self, root: Optional[str] = None) -> int:
+        """
+        Delete orphaned outputs and any directories they leave empty.
+
+        Args:
+            root (Optional[str]): Directories are never removed above this one
+
+        Returns:
+            int: The number of files removed
+        """
+        removed = 0
+        for path in self.orphans():
+            try:
+                os.unlink(path)
+                removed += 1
+            except OSError:
+                continue
+            directory = os.path.dirname(path)
+            while directory and directory != root:
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    break
+                directory = os.path.dirname(directory)
+        return removed
+
+    def save(self) -> None:
+        """Store the manifest of this build for the next one."""
+        os.makedirs(os.path.dirname(self.manifest_path) or '.', exist_ok=True)
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'salt': self.salt, 'outputs': self._current},
+                      f, indent=1, sort_keys=True)
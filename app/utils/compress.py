@@ -0,0 +1,170 @@
+import os
+import gzip
+import tempfile
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Precompressed files are made once, so they get the smallest output gzip has
+GZIP_LEVEL = 9
+
+# Smaller files gain less than the gzip header and a round of decoding cost
+MIN_SIZE = 256
+
+# Suffixes of files worth compressing, by the asset class they are reported under;
+# images, web fonts and archives other than these are compressed already
+COMPRESSIBLE_SUFFIXES = {
+    '.html': 'html',
+    '.css': 'css',
+    '.js': 'js',
+    '.json': 'json',
+    '.svg': 'images',
+    '.ico': 'images',
+    '.ttf': 'fonts',
+    '.otf': 'fonts',
+    '.eot': 'fonts',
+    '.xml': 'other',
+    '.txt': 'other',
+    '.map': 'other',
+}
+
+class CompressionStats(NamedTuple):
+    """
+    Sizes of the compressible files of one asset class.
+
+    Attributes:
+        files (int): Number of files
+        size (int): Bytes of the files
+        compressed (int): Bytes served to clients accepting gzip
+        written (int): Number of .gz files written by this run
+    """
+    files: int
+    size: int
+    compressed: int
+    written: int
+
+def gzip_bytes(data: bytes, level: int = GZIP_LEVEL) -> bytes:
+    """
+    Compress data with gzip, the same way every time.
+
+    Args:
+        data (bytes): The data to compress
+        level (int): The compression level
+
+    Returns:
+        bytes: The gzip stream, without a timestamp so equal data gives equal output
+    """
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """
+    Check whether an Accept-Encoding header allows a gzip response.
+
+    Args:
+        accept_encoding (Optional[str]): The header value
+
+    Returns:
+        bool: True if gzip (or any encoding) is accepted with a non-zero quality
+    """
+    for coding in (accept_encoding or '').split(','):
+        name, _, params = coding.partition(';')
+        if name.strip().lower() not in ('gzip', 'x-gzip', '*'):
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        return quality > 0
+    return False
+
+def is_compressible(path: str) -> bool:
+    """Check whether a file is worth serving gzip-compressed, by its suffix."""
+    return os.path.splitext(path)[1].lower() in COMPRESSIBLE_SUFFIXES
+
+def precompress_file(path: str) -> Tuple[int, int, bool]:
+    """
+    Write the .gz sibling of a file if it makes the file smaller.
+
+    The sibling gets the modification time of the file, which is how a
+    later run tells that it is up to date. A sibling that would not be
+    smaller is removed instead.
+
+    Args:
+        path (str): The file to compress
+
+    Returns:
+        Tuple[int, int, bool]: Size of the file, size served to clients
+        accepting gzip, and whether a .gz file was written
+    """
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    compressed = gzip_bytes(data) if len(data) >= MIN_SIZE else data
+    if len(compressed) >= len(data):
+        if os.path.exists(path + '.gz'):
+            os.unlink(path + '.gz')
+        return len(data), len(data), False
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(compressed)
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp_path, path + '.gz')
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(data), len(compressed), True
+
+def precompress_tree(root: str, workers: int = 1) -> Dict[str, CompressionStats]:
+    """
+    Keep a .gz sibling next to every compressible file of a directory tree.
+
+    Only files without an up-to-date sibling are compressed, in a pool of
+    processes when there are several workers. Siblings of files that are
+    gone are removed.
+
+    Args:
+        root (str): The directory, e.g. _site
+        workers (int): Number of processes compressing files
+
+    Returns:
+        Dict[str, CompressionStats]: Sizes by asset class, see COMPRESSIBLE_SUFFIXES
+    """
+    sizes: Dict[str, List[Tuple[int, int, bool]]] = {}
+    stale: List[str] = []
+    for directory, _, files in os.walk(root):
+        names = set(files)
+        for name in files:
+            path = os.path.join(directory, name)
+            if name.endswith('.gz'):
+                if name[:-3] not in names or not is_compressible(name[:-3]):
+                    os.unlink(path)
+                continue
+            if not is_compressible(name):
+                continue
+            stat = os.stat(path)
+            gz_stat = os.stat(path + '.gz') if name + '.gz' in names else None
+            if gz_stat is not None and gz_stat.st_mtime_ns == stat.st_mtime_ns:
+                asset_class = COMPRESSIBLE_SUFFIXES[os.path.splitext(name)[1].lower()]
+                sizes.setdefault(asset_class, []).append((stat.st_size, gz_stat.st_size, False))
+            else:
+                stale.append(path)
+
+    workers = min(workers, len(stale))
+    if workers <= 1:
+        results = [precompress_file(path) for path in stale]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(precompress_file, stale, chunksize=max(1, len(stale) // (workers * 4))))
+    for path, result in zip(stale, results):
+        sizes.setdefault(COMPRESSIBLE_SUFFIXES[os.path.splitext(path)[1].lower()], []).append(result)
+
+    return {
+        asset_class: CompressionStats(len(entries), sum(entry[0] for entry in entries),
+                                      sum(entry[1] for entry in entries), sum(entry[2] for entry in entries))
+        for asset_class, entries in sorted(sizes.items())
+    }
@@ -0,0 +1,244 @@
+import io
+import os
+import sys
+import logging
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import unquote, unquote_to_bytes
+from flask.templating import Environment
+
+logger = logging.getLogger(__name__)
+
+# Endpoints that are never frozen: static files are copied separately
+DEFAULT_SKIP_ENDPOINTS = frozenset({'static'})
+
+class _RecordingEnvironment(Environment):
+    """Jinja environment that remembers which templates the views rendered."""
+
+    def __init__(self, app, **options):
+        super().__init__(app, **options)
+        self.rendered: List[str] = []
+
+    def get_or_select_template(self, template_name_or_list, parent=None, globals=None):
+        template = super().get_or_select_template(template_name_or_list, parent, globals)
+        self.rendered.append(template.name)
+        return template
+
+class FrozenPage(NamedTuple):
+    """
+    A URL of the app and the file it is frozen to.
+
+    Attributes:
+        url (str): The URL path, e.g. /posts/hello-world/
+        output_path (str): The file the response is written to
+        data (Any): JSON-serializable description of everything besides the
+            templates that the page depends on, as given by its URL generator
+    """
+    url: str
+    output_path: str
+    data: Any
+
+class Response(NamedTuple):
+    """
+    A response of the app to a frozen URL.
+
+    Attributes:
+        status (int): HTTP status code
+        mimetype (str): Content type without parameters
+        body (bytes): Response body
+        location (Optional[str]): Target of a redirect
+        templates (List[str]): Templates rendered by the view, in order
+        static_files (List[str]): Files of the static endpoint the response
+            links to through url_for(), in order
+    """
+    status: int
+    mimetype: str
+    body: bytes
+    location: Optional[str]
+    templates: List[str]
+    static_files: List[str]
+
+class Freezer:
+    """
+    Turn the routes of a Flask app into static files.
+
+    The pages to freeze come from the app's url_map: every GET route
+    without URL arguments is frozen as is, and routes with arguments are
+    frozen for the values their URL generator yields. Adding a route
+    therefore adds its page to the static site without touching the
+    builder.
+
+    Every URL is dispatched through the app's WSGI callable in this
+    process, so each page costs one view call; templates are compiled on
+    first use and kept, since nothing reloads them during a build.
+    """
+
+    def __init__(self, app, output_dir: str = '_site', skip_endpoints: Iterable[str] = DEFAULT_SKIP_ENDPOINTS):
+        """
+        Set up freezing for an app.
+
+        Create the freezer before the app renders anything: it replaces
+        the app's Jinja environment with one that records which templates
+        each view renders.
+
+        Args:
+            app: The Flask app to freeze
+            output_dir (str): Directory the site is written to
+            skip_endpoints (Iterable[str]): Endpoints that are never frozen
+        """
+        if 'jinja_env' in app.__dict__:
+            raise RuntimeError("Freezer must be created before the app's Jinja environment is used")
+        app.jinja_environment = _RecordingEnvironment
+        app.config['TEMPLATES_AUTO_RELOAD'] = False
+
+        self.app = app
+        self.output_dir = output_dir
+        self.skip_endpoints: Set[str] = set(skip_endpoints)
+        self._generators: Dict[str, Callable[[], Iterable[Tuple[Dict[str, Any], Any]]]] = {}
+        self._static_files: List[str] = []
+        app.url_defaults(self._record_static_file)
+
+    def _record_static_file(self, endpoint: str, values: Dict[str, Any]) -> None:
+        """Remember the static files linked to while dispatching a URL."""
+        if endpoint == 'static' and 'filename' in values:
+            self._static_files.append(values['filename'])
+
+    def register_generator(self, endpoint: str):
+        """
+        Register the URL generator of an endpoint.
+
+        The generator takes no arguments and yields (values, data) pairs:
+        the URL arguments of one page and the data that page depends on.
+
+        Args:
+            endpoint (str): The endpoint, e.g. main.category
+
+        Returns:
+            callable: Decorator registering the generator
+        """
+        def decorator(generator):
+            self._generators[endpoint] = generator
+            return generator
+        return decorator
+
+    def url_for(self, endpoint: str, **values: Any) -> str:
+        """
+        Build the URL of an endpoint outside of a request.
+
+        Args:
+            endpoint (str): The endpoint, e.g. main.post
+            **values: The URL arguments
+
+        Returns:
+            str: The URL path
+        """
+        return self.app.url_map.bind('localhost').build(endpoint, values)
+
+    def output_path(self, url: str) -> str:
+        """
+        Get the file a URL is frozen to.
+
+        URLs of directories and of pages without a file extension become
+        an index.html, so the static server resolves them the same way.
+
+        Args:
+            url (str): The URL path
+
+        Returns:
+            str: Path of the output file
+        """
+        path = unquote(url).lstrip('/')
+        if not path or path.endswith('/'):
+            path += 'index.html'
+        elif '.' not in path.rsplit('/', 1)[-1]:
+            path += '/index.html'
+        return os.path.join(self.output_dir, *path.split('/'))
+
+    def pages(self) -> List[FrozenPage]:
+        """
+        List the pages to freeze.
+
+        Pages from URL generators come first, in the order of the url_map,
+        followed by the routes without arguments. URLs that would write
+        the same file, such as /writings and /writings/, are frozen once,
+        preferring the URL that ends with a slash.
+
+        Returns:
+            List[FrozenPage]: The pages to freeze
+        """
+        rules = [rule for rule in self.app.url_map.iter_rules()
+                 if 'GET' in rule.methods and rule.endpoint not in self.skip_endpoints]
+
+        candidates = []
+        generated = set()
+        for rule in rules:
+            generator = self._generators.get(rule.endpoint)
+            if generator is None or rule.endpoint in generated:
+                continue
+            generated.add(rule.endpoint)
+            for values, data in generator():
+                candidates.append((self.url_for(rule.endpoint, **values), data))
+
+        # Of /games and /games/, the URL with the slash is the one a static server answers
+        for rule in sorted(rules, key=lambda rule: not rule.rule.endswith('/')):
+            if not rule.arguments:
+                candidates.append((rule.rule, None))
+            elif rule.endpoint not in self._generators:
+                logger.warning(f"Not freezing {rule.rule}: no URL generator for {rule.endpoint}")
+
+        pages = []
+        seen = set()
+        for url, data in candidates:
+            output_path = self.output_path(url)
+            if output_path not in seen:
+                seen.add(output_path)
+                pages.append(FrozenPage(url, output_path, data))
+        return pages
+
+    def dispatch(self, url: str) -> Response:
+        """
+        Get the app's response to a GET request for a URL.
+
+        Args:
+            url (str): The URL path
+
+        Returns:
+            Response: The response, with the templates its view rendered
+        """
+        environ = {
+            'REQUEST_METHOD': 'GET',
+            'SCRIPT_NAME': '',
+            # WSGI passes the undecoded path bytes as latin-1
+            'PATH_INFO': unquote_to_bytes(url).decode('latin-1'),
+            'QUERY_STRING': '',
+            'SERVER_NAME': 'localhost',
+            'SERVER_PORT': '80',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'HTTP_HOST': 'localhost',
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': io.BytesIO(),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': False,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started['status'] = int(status.split(' ', 1)[0])
+            started['headers'] = dict(headers)
+
+        rendered = self.app.jinja_env.rendered
+        del rendered[:]
+        del self._static_files[:]
+        result = self.app.wsgi_app(environ, start_response)
+        try:
+            body = b''.join(result)
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+
+        headers = started['headers']
+        mimetype = headers.get('Content-Type', '').split(';', 1)[0].strip()
+        return Response(started['status'], mimetype, body, headers.get('Location'), list(rendered),
+                        list(self._static_files))
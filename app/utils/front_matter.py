@@ -0,0 +1,68 @@
+from typing import NamedTuple, Optional
+
+DELIMITER = '---'
+
+# Read buffer for header scans; front matter rarely exceeds a few hundred bytes
+HEADER_BUFFER_SIZE = 512
+
+class FrontMatter(NamedTuple):
+    """
+    The parts of a post file around its front matter.
+
+    Attributes:
+        preamble (str): Text before the opening delimiter
+        header (str): Text between the opening and closing delimiters
+        body (Optional[str]): Text after the closing delimiter, or None if
+            the body was not read
+    """
+    preamble: str
+    header: str
+    body: Optional[str]
+
+def _decode(data: bytes) -> str:
+    """Decode file bytes the way text-mode open() would, with universal newlines."""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+def read_front_matter(file_path: str, with_body: bool = False) -> Optional[FrontMatter]:
+    """
+    Read the front matter of a post file without reading its body.
+
+    The file is read line by line and reading stops as soon as the closing
+    delimiter has been seen, so metadata-only scans touch only the first
+    few hundred bytes of each file. Delimiters are lines holding only
+    ``---`` (trailing whitespace allowed), so a value such as
+    ``title: a---b`` stays in the header.
+
+    Args:
+        file_path (str): Path to the post file
+        with_body (bool): Also read and return the rest of the file
+
+    Returns:
+        Optional[FrontMatter]: The parts of the file, or None if the file
+        does not contain two delimiter lines
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(file_path, 'rb', buffering=HEADER_BUFFER_SIZE) as f:
+        preamble = []
+        header = None
+        for line in f:
+            line = _decode(line)
+            if line.rstrip() == DELIMITER:
+                if header is not None:
+                    break
+                header = []
+            elif header is None:
+                preamble.append(line)
+            else:
+                header.append(line)
+        else:
+            return None
+
+        body = _decode(f.read()) if with_body else None
+        return FrontMatter(
+            preamble=''.join(preamble),
+            header=''.join(header),
+            body=body
+        )
@@ -0,0 +1,228 @@
+import os
+import re
+import json
+import posixpath
+import tempfile
+from urllib.parse import urlsplit
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Formats resized images are made for, by file suffix
+IMAGE_FORMATS = {'.png': 'PNG', '.jpg': 'JPEG', '.jpeg': 'JPEG'}
+
+# Bump when the encoding changes, so cached derivatives are made again
+DERIVATIVE_VERSION = 1
+
+# <img> tags, and their src, srcset and width attributes
+IMG_TAG_PATTERN = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+IMG_SRC_PATTERN = re.compile(r'\ssrc="([^"]*)"', re.IGNORECASE)
+IMG_SRCSET_PATTERN = re.compile(r'\ssrcset=', re.IGNORECASE)
+IMG_WIDTH_PATTERN = re.compile(r'\swidth="?(\d+)', re.IGNORECASE)
+
+def is_resizable(path: str) -> bool:
+    """Check whether derivatives are made for an image, by its suffix."""
+    return os.path.splitext(path)[1].lower() in IMAGE_FORMATS
+
+def derivative_name(file_path: str, width: int, key: str) -> str:
+    """
+    Get the name a resized image is published under.
+
+    Args:
+        file_path (str): Path of the image in the static directory, e.g. img/a.png
+        width (int): Width of the derivative in pixels
+        key (str): Hex digest of the image and the encoding settings
+
+    Returns:
+        str: The path of the derivative next to the image, e.g. img/a-480w.1a2b3c4d5e.png
+    """
+    stem, suffix = posixpath.splitext(file_path)
+    return f"{stem}-{width}w.{key[:10]}{suffix}"
+
+def encode_derivatives(source_path: str, widths: Sequence[int], quality: int,
+                       output_dir: str, key: str) -> Dict[str, Any]:
+    """
+    Resize an image to the given widths and encode the copies in the cache.
+
+    Images are never enlarged. Each copy is re-encoded with the format's
+    best compression (optimized PNG, progressive optimized JPEG) and kept
+    only if it is smaller than the original file; a copy at the original
+    width is made too, so a plain re-encode that saves bytes is used.
+
+    Args:
+        source_path (str): The image
+        widths (Sequence[int]): Widths in pixels to resize to
+        quality (int): JPEG quality
+        output_dir (str): Directory the encoded copies are cached in
+        key (str): Cache key of the image and settings, used in file names
+
+    Returns:
+        Dict[str, Any]: The image's width and height and the widths of the
+        copies that were kept
+    """
+    from PIL import Image
+
+    image_format = IMAGE_FORMATS[os.path.splitext(source_path)[1].lower()]
+    source_size = os.path.getsize(source_path)
+    os.makedirs(output_dir, exist_ok=True)
+    kept = []
+    with Image.open(source_path) as image:
+        image.load()
+        width, height = image.size
+        if image_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        for target in sorted({w for w in widths if w < width} | {width}):
+            resized = image if target == width else image.resize(
+                (target, max(1, round(height * target / width))), Image.LANCZOS)
+            options = {'optimize': True}
+            if image_format == 'JPEG':
+                options.update(quality=quality, progressive=True)
+            fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix='.', suffix='.tmp')
+            os.close(fd)
+            try:
+                resized.save(tmp_path, image_format, **options)
+                if os.path.getsize(tmp_path) < source_size:
+                    os.replace(tmp_path, os.path.join(output_dir, f"{key}-{target}"))
+                    kept.append(target)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+    return {'width': width, 'height': height, 'widths': kept}
+
+class DerivativeCache:
+    """
+    Resized copies of images, stored by a hash of the image and the settings.
+
+    An image is only decoded and encoded again when its contents or the
+    encoding settings change; which copies exist is kept in an index, so
+    a build with nothing new to encode does not open a single image.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Load the index of the cache.
+
+        Args:
+            cache_dir (str): Directory of the cached copies and their index
+        """
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._changed = False
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == DERIVATIVE_VERSION:
+                self._index = data.get('images', {})
+        except (OSError, ValueError):
+            pass
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the copies made for a cache key, if they are all still there.
+
+        Args:
+            key (str): Cache key of the image and settings
+
+        Returns:
+            Optional[Dict[str, Any]]: Width, height and widths of the copies,
+            or None if the image has to be encoded
+        """
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        if not all(os.path.exists(self.path(key, width)) for width in entry['widths']):
+            return None
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Record the copies encode_derivatives() made for a cache key."""
+        self._index[key] = entry
+        self._changed = True
+
+    def path(self, key: str, width: int) -> str:
+        """Get the file a copy is cached in."""
+        return os.path.join(self.cache_dir, f"{key}-{width}")
+
+    def prune(self, keys: Sequence[str]) -> int:
+        """
+        Remove the copies of images that are gone or were encoded differently.
+
+        Args:
+            keys (Sequence[str]): Cache keys still in use
+
+        Returns:
+            int: The number of files removed
+        """
+        used = set(keys)
+        for key in [key for key in self._index if key not in used]:
+            del self._index[key]
+            self._changed = True
+        removed = 0
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return 0
+        for name in names:
+            if name != 'index.json' and name.rsplit('-', 1)[0] not in used:
+                os.unlink(os.path.join(self.cache_dir, name))
+                removed += 1
+        return removed
+
+    def save(self) -> None:
+        """Store the index if it changed."""
+        if not self._changed:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': DERIVATIVE_VERSION, 'images': self._index}, f, indent=1, sort_keys=True)
+        self._changed = False
+
+def add_srcset(html: str, derivatives: Dict[str, List[Tuple[int, str]]], sizes: str) -> str:
+    """
+    Let browsers pick a resized copy of the images of a page.
+
+    Every <img> whose src is a local path to an image of the static
+    directory with derivatives gets a srcset listing them, and a sizes attribute: the
+    image's own width attribute if it has one, the given default
+    otherwise. The src stays, for browsers without srcset. Copies live
+    next to the image, so their URLs are the src with another file name,
+    relative or not.
+
+    Args:
+        html (str): The page
+        derivatives (Dict[str, List[Tuple[int, str]]]): Widths and names of
+            the copies by image path in the static directory, including the
+            image itself if no copy has its full width
+        sizes (str): sizes attribute of images without a width
+
+    Returns:
+        str: The page with srcset attributes
+    """
+    if '<img' not in html and '<IMG' not in html:
+        return html
+
+    def rewrite(match):
+        tag = match.group(0)
+        src = IMG_SRC_PATTERN.search(tag)
+        if src is None or IMG_SRCSET_PATTERN.search(tag):
+            return tag
+        url = src.group(1)
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc:
+            # Images on other sites, such as post images linked on GitHub, have no copies
+            return tag
+        path = parts.path
+        index = path.rfind('static/')
+        if index < 0 or (index > 0 and path[index - 1] != '/'):
+            return tag
+        copies = derivatives.get(path[index + len('static/'):])
+        if not copies:
+            return tag
+
+        directory = path[:path.rfind('/') + 1]
+        srcset = ', '.join(f"{directory}{posixpath.basename(name)} {width}w" for width, name in copies)
+        width = IMG_WIDTH_PATTERN.search(tag)
+        image_sizes = f"(max-width: {width.group(1)}px) 100vw, {width.group(1)}px" if width else sizes
+        end = src.end()
+        return f'{tag[:end]} srcset="{srcset}" sizes="{image_sizes}"{tag[end:]}'
+
+    return IMG_TAG_PATTERN.sub(rewrite, html)
@@ -0,0 +1,146 @@
+import re
+from typing import List
+
+# Bump when minified output changes, so bundles get new fingerprints
+MINIFY_VERSION = 2
+
+# Comments that carry a license stay in minified output
+LICENSE_COMMENT = re.compile(r'^/\*!|licen[cs]e|copyright', re.IGNORECASE)
+
+# Strings, comments, whitespace and everything else in a stylesheet
+CSS_TOKEN_PATTERN = re.compile(
+    r'''("(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')'''
+    r'|(/\*.*?\*/)'
+    r'|(\s+)'
+    r'''|([^"'/\s]+|/)''',
+    re.DOTALL)
+
+# Characters around which whitespace means nothing in CSS. Not ':' before,
+# as in 'a :hover', nor '+' or '-', as in calc(1px + 2px). A license
+# comment ends with a line break
+CSS_NO_SPACE_AFTER = set('{};,:>(\n')
+CSS_NO_SPACE_BEFORE = set('{};,>)!')
+
+# Strings, template literals, comments, whitespace, words and single characters of a script
+JS_TOKEN_PATTERN = re.compile(
+    r'''("(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`)'''
+    r'|(/\*.*?\*/|//[^\n]*)'
+    r'|([ \t\r\f\v]*\n\s*)'
+    r'|([ \t\r\f\v]+)'
+    r'|([A-Za-z0-9_$]+)'
+    r'|(.)',
+    re.DOTALL)
+
+# A regular expression literal, with character classes that may hold a slash
+JS_REGEX_PATTERN = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+
+# After these, a slash starts a regular expression rather than a division
+JS_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+JS_REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+                     'throw', 'case', 'do', 'else', 'yield', 'await'}
+
+def _js_needs_space(before: str, after: str) -> bool:
+    """Check whether two tokens would run together without the space between them."""
+    def is_word(char):
+        return char.isalnum() or char in '_$\\' or ord(char) > 127
+    if is_word(before) and is_word(after):
+        return True
+    if before.isdigit() and after == '.':
+        # 1 .toString() is not 1.toString()
+        return True
+    # a + +b, a - -b and a / /re/ would read as ++, -- and a comment
+    return (before == after and before in '+-/') or (before == '/' and after == '*')
+
+def minify_css(css: str) -> str:
+    """
+    Remove the comments and the whitespace that does not matter from a stylesheet.
+
+    Strings are left alone, and so are comments that carry a license.
+
+    Args:
+        css (str): The stylesheet
+
+    Returns:
+        str: The minified stylesheet
+    """
+    out: List[str] = []
+    space = False
+    for match in CSS_TOKEN_PATTERN.finditer(css):
+        string, comment, whitespace, text = match.groups()
+        if whitespace is not None:
+            space = True
+            continue
+        if comment is not None:
+            if not LICENSE_COMMENT.search(comment):
+                space = True
+                continue
+            text = comment + '\n'
+        elif string is not None:
+            text = string
+        if space and out and out[-1][-1] not in CSS_NO_SPACE_AFTER and text[0] not in CSS_NO_SPACE_BEFORE:
+            out.append(' ')
+        if text[0] == '}' and out and out[-1][-1] == ';':
+            out[-1] = out[-1][:-1]
+        if string is None and comment is None:
+            text = text.replace(';}', '}')
+        out.append(text)
+        space = False
+    return ''.join(out).strip()
+
+def minify_js(js: str) -> str:
+    """
+    Remove the comments and the indentation from a script.
+
+    Line breaks are kept, so automatic semicolon insertion sees the same
+    script; spaces within a line are dropped where tokens do not run
+    together without them. Strings, template literals and regular
+    expressions are left alone, and so are comments that carry a license.
+
+    Args:
+        js (str): The script
+
+    Returns:
+        str: The minified script
+    """
+    out: List[str] = []
+    previous = ''
+    position = 0
+    length = len(js)
+    while position < length:
+        if js[position] == '/' and js[position + 1:position + 2] not in ('/', '*') and (
+                not previous or previous in JS_REGEX_PRECEDERS or previous in JS_REGEX_KEYWORDS):
+            regex = JS_REGEX_PATTERN.match(js, position)
+            if regex is not None:
+                out.append(regex.group(0))
+                previous = 'regex'
+                position = regex.end()
+                continue
+        match = JS_TOKEN_PATTERN.match(js, position)
+        position = match.end()
+        string, comment, newline, space, word, char = match.groups()
+        if comment is not None:
+            if LICENSE_COMMENT.search(comment):
+                out.append(comment + '\n')
+            elif comment.startswith('/*') and out and not out[-1].endswith('\n'):
+                # A comment spanning lines ends a line as far as semicolon insertion goes
+                separator = '\n' if '\n' in comment else ' '
+                if out[-1] == ' ':
+                    out[-1] = separator
+                else:
+                    out.append(separator)
+            continue
+        if newline is not None or space is not None:
+            separator = '\n' if newline is not None else ' '
+            if not out or out[-1] == '\n' or out[-1].endswith('\n'):
+                continue
+            if out[-1] == ' ':
+                out[-1] = separator
+            else:
+                out.append(separator)
+            continue
+        token = string if string is not None else word if word is not None else char
+        if out and out[-1] == ' ' and (len(out) < 2 or not _js_needs_space(out[-2][-1], token[0])):
+            out.pop()
+        out.append(token)
+        previous = word if word is not None else token if char is not None else 'string'
+    return ''.join(out).strip() + '\n'
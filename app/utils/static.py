@@ -1,34 +1,300 @@
 import os
+import re
+import errno
 import shutil
-import logging
+import posixpath
+import tempfile
+from typing import Callable, Dict, NamedTuple, Optional, Set, Tuple
+from app.utils.build_manifest import hash_file
 
-logger = logging.getLogger(__name__)
+# Errors of copy_file_range() meaning the kernel or filesystem cannot do it
+_COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
 
-def copy_static_assets():
+# Cleared after the first copy_file_range() the system does not support
+_copy_range_supported = hasattr(os, 'copy_file_range')
+
+# Hex digits of the content hash in fingerprinted file names
+FINGERPRINT_LENGTH = 10
+
+# css/style.1a2b3c4d5e.css -> css/style, 1a2b3c4d5e, .css
+FINGERPRINT_PATTERN = re.compile(
+    r'^(?P<stem>(?:.*/)?[^/]+)\.(?P<fingerprint>[0-9a-f]{%d})(?P<suffix>\.[^./]+)?$' % FINGERPRINT_LENGTH)
+
+# url(...) references in stylesheets, with or without quotes
+CSS_URL_PATTERN = re.compile(r'''url\(\s*(['"]?)([^'")\s]+)\1\s*\)''')
+
+class SyncStats(NamedTuple):
+    """
+    What a sync of a directory tree did.
+
+    Attributes:
+        copied (int): Files copied or rewritten
+        linked (int): Files hardlinked
+        unchanged (int): Files that were already up to date
+        removed (int): Files deleted because they are gone from the source
+        bytes_copied (int): Bytes written by copies
     """
-    Copy static assets to the _site directory.
-    
-    This function is used during site generation to copy static assets
-    from the app/static directory to the _site/static directory.
+    copied: int
+    linked: int
+    unchanged: int
+    removed: int
+    bytes_copied: int
+
+def _copy_range(source_fd: int, target_fd: int, size: int) -> bool:
+    """Copy a file with copy_file_range(), which can share blocks on copy-on-write filesystems."""
+    global _copy_range_supported
+    if not _copy_range_supported:
+        return False
+    copied = 0
+    try:
+        while copied < size:
+            count = os.copy_file_range(source_fd, target_fd, size - copied)
+            if count == 0:
+                break
+            copied += count
+    except OSError as e:
+        if copied or e.errno not in _COPY_RANGE_UNSUPPORTED:
+            raise
+        if e.errno in (errno.ENOSYS, errno.EOPNOTSUPP):
+            _copy_range_supported = False
+        return False
+    return True
+
+def _replace_with(target: str, fill: Callable[[str], None]) -> None:
+    """Create a file next to target with fill(), then move it over target atomically.
+
+    Replacing rather than overwriting keeps hardlinks from the previous
+    build pointing at the unchanged source file.
     """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.', suffix='.tmp')
+    os.close(fd)
     try:
-        # Create _site/static directory if it doesn't exist
-        site_static_dir = os.path.join('_site', 'static')
-        if not os.path.exists(site_static_dir):
-            os.makedirs(site_static_dir)
-        
-        # Copy static assets
-        app_static_dir = os.path.join('app', 'static')
-        if os.path.exists(app_static_dir):
-            for item in os.listdir(app_static_dir):
-                src = os.path.join(app_static_dir, item)
-                dst = os.path.join(site_static_dir, item)
-                if os.path.isdir(src):
-                    if os.path.exists(dst):
-                        shutil.rmtree(dst)
-                    shutil.copytree(src, dst)
-                else:
-                    shutil.copy2(src, dst)
-            logger.info(f"Static assets copied to {site_static_dir}")
-    except Exception as e:
-        logger.error(f"Error copying static assets: {e}") 
\ No newline at end of file
+        fill(tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def _copy_file(source: str, target: str, size: int) -> None:
+    """Copy a file with its modification time."""
+    def fill(tmp_path):
+        with open(source, 'rb') as src, open(tmp_path, 'wb') as dst:
+            copied = _copy_range(src.fileno(), dst.fileno(), size)
+        if not copied:
+            shutil.copyfile(source, tmp_path)
+        shutil.copystat(source, tmp_path)
+    _replace_with(target, fill)
+
+def _link_file(source: str, target: str) -> bool:
+    """Hardlink a file, returning False if the filesystem cannot."""
+    def fill(tmp_path):
+        os.unlink(tmp_path)
+        os.link(source, tmp_path)
+    try:
+        _replace_with(target, fill)
+    except OSError:
+        return False
+    return True
+
+def _is_up_to_date(source: str, target: str, source_stat: os.stat_result) -> bool:
+    """Compare a copied file with its source by size, identity, modification time and contents."""
+    try:
+        target_stat = os.stat(target)
+    except OSError:
+        return False
+    if target_stat.st_size != source_stat.st_size or not os.path.isfile(target):
+        return False
+    if os.path.samestat(source_stat, target_stat) or target_stat.st_mtime_ns == source_stat.st_mtime_ns:
+        return True
+    if hash_file(source) != hash_file(target):
+        return False
+    # Same contents, e.g. after a checkout touched the source; match the times for next time
+    os.utime(target, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    return True
+
+def sync_tree(source_dir: str, target_dir: str,
+              transforms: Optional[Dict[str, Callable[[str, bytes], bytes]]] = None,
+              link: bool = False, keep: Optional[Callable[[str], bool]] = None) -> SyncStats:
+    """
+    Make a directory tree a copy of another one, touching only what changed.
+
+    A file is copied only when its size, modification time or contents
+    differ from the copy; files and directories that are gone from the
+    source are removed. Copies use copy_file_range() where the kernel
+    supports it, or hardlinks if asked to, so syncing an unchanged tree
+    copies nothing.
+
+    Args:
+        source_dir (str): The directory to copy
+        target_dir (str): The directory to bring in line with it
+        transforms (Optional[Dict[str, Callable[[str, bytes], bytes]]]):
+            Functions rewriting the contents of files by file suffix, e.g.
+            {'.html': rewrite}. They get the target path and the source
+            contents; their output is written only if the copy differs.
+        link (bool): Hardlink files instead of copying them. Only use this
+            if nothing writes into the target files in place, as that
+            would change the sources too.
+        keep (Optional[Callable[[str], bool]]): Tells whether a file of the
+            target that is not in the source stays, given its path relative
+            to the target directory with forward slashes
+
+    Returns:
+        SyncStats: What was copied, linked, kept and removed
+    """
+    transforms = transforms or {}
+    copied = linked = unchanged = removed = bytes_copied = 0
+    source_files: Set[str] = set()
+    source_dirs: Set[str] = {'.'}
+
+    for root, dirs, files in os.walk(source_dir):
+        dirs.sort()
+        relative_root = os.path.relpath(root, source_dir)
+        target_root = os.path.normpath(os.path.join(target_dir, relative_root))
+        if os.path.isfile(target_root):
+            os.unlink(target_root)
+        os.makedirs(target_root, exist_ok=True)
+        source_dirs.update(os.path.normpath(os.path.join(relative_root, name)) for name in dirs)
+
+        for name in sorted(files):
+            source = os.path.join(root, name)
+            target = os.path.join(target_root, name)
+            source_files.add(os.path.normpath(os.path.join(relative_root, name)))
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+
+            transform = transforms.get(os.path.splitext(name)[1])
+            if transform is not None:
+                with open(source, 'rb') as f:
+                    data = transform(target, f.read())
+                try:
+                    with open(target, 'rb') as f:
+                        current = f.read()
+                except OSError:
+                    current = None
+                if current == data:
+                    unchanged += 1
+                    continue
+                def fill(tmp_path, data=data):
+                    with open(tmp_path, 'wb') as f:
+                        f.write(data)
+                _replace_with(target, fill)
+                copied += 1
+                bytes_copied += len(data)
+                continue
+
+            source_stat = os.stat(source)
+            if _is_up_to_date(source, target, source_stat):
+                unchanged += 1
+            elif link and _link_file(source, target):
+                linked += 1
+            else:
+                _copy_file(source, target, source_stat.st_size)
+                copied += 1
+                bytes_copied += source_stat.st_size
+
+    for root, dirs, files in os.walk(target_dir, topdown=False):
+        relative_root = os.path.relpath(root, target_dir)
+        for name in files:
+            relative_path = os.path.normpath(os.path.join(relative_root, name))
+            if relative_path in source_files or (keep and keep(relative_path.replace(os.sep, '/'))):
+                continue
+            os.unlink(os.path.join(root, name))
+            removed += 1
+        for name in dirs:
+            path = os.path.join(root, name)
+            if os.path.normpath(os.path.join(relative_root, name)) in source_dirs:
+                continue
+            if os.path.islink(path):
+                os.unlink(path)
+            elif keep is None:
+                shutil.rmtree(path)
+            elif not os.listdir(path):
+                # Files kept below it were visited first
+                os.rmdir(path)
+
+    return SyncStats(copied, linked, unchanged, removed, bytes_copied)
+
+def fingerprint_name(file_path: str, digest: str) -> str:
+    """
+    Get the name a static file is published under for given contents.
+
+    Args:
+        file_path (str): Path of the file in the static directory, e.g. css/style.css
+        digest (str): Hex digest of the contents
+
+    Returns:
+        str: The path with the digest before the suffix, e.g. css/style.1a2b3c4d5e.css
+    """
+    directory, name = posixpath.split(file_path)
+    stem, suffix = posixpath.splitext(name)
+    return posixpath.join(directory, f"{stem}.{digest[:FINGERPRINT_LENGTH]}{suffix}")
+
+def split_fingerprint(name: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a fingerprinted name into the file path and the fingerprint.
+
+    Args:
+        name (str): A name made by fingerprint_name()
+
+    Returns:
+        Optional[Tuple[str, str]]: The original path and the fingerprint, or
+        None if the name has no fingerprint
+    """
+    match = FINGERPRINT_PATTERN.match(name)
+    if match is None:
+        return None
+    return match.group('stem') + (match.group('suffix') or ''), match.group('fingerprint')
+
+def rewrite_css_urls(css: str, css_path: str, asset_name: Callable[[str], str],
+                     static_url_path: str = '/static', published_path: Optional[str] = None) -> str:
+    """
+    Point the url() references of a stylesheet at fingerprinted files.
+
+    References relative to the stylesheet and absolute ones below the
+    static URL path are rewritten; query strings and fragments are kept,
+    and references to other sites or to missing files are left alone.
+    A stylesheet published somewhere else, as part of a bundle, gets its
+    relative references rebased on the directory it is published in.
+
+    Args:
+        css (str): The stylesheet
+        css_path (str): Path of the stylesheet in the static directory
+        asset_name (Callable[[str], str]): Gives the fingerprinted name of a
+            file in the static directory, or the path itself if it is missing
+        static_url_path (str): URL path the static directory is served from
+        published_path (Optional[str]): Path the stylesheet is published
+            under, if not css_path
+
+    Returns:
+        str: The stylesheet with rewritten references
+    """
+    directory = posixpath.dirname(css_path)
+    published_directory = posixpath.dirname(published_path) if published_path else directory
+    prefix = static_url_path.rstrip('/') + '/'
+
+    def rewrite(match):
+        quote, reference = match.group(1), match.group(2)
+        end = min((i for i in (reference.find('?'), reference.find('#')) if i >= 0), default=len(reference))
+        path, rest = reference[:end], reference[end:]
+        if not path or ':' in path or path.startswith('//'):
+            return match.group(0)
+        if path.startswith('/'):
+            if not path.startswith(prefix):
+                return match.group(0)
+            file_path = path[len(prefix):]
+        else:
+            file_path = posixpath.normpath(posixpath.join(directory, path))
+            if file_path.startswith('../'):
+                return match.group(0)
+        name = asset_name(file_path)
+        if not path.startswith('/') and published_directory != directory:
+            path = posixpath.relpath(name, published_directory or '.')
+        elif name == file_path:
+            return match.group(0)
+        else:
+            # Fingerprinting only changes the file name, so the directory part stays valid
+            path = path[:len(path) - len(posixpath.basename(path))] + posixpath.basename(name)
+        return f"url({quote}{path}{rest}{quote})"
+
+    return CSS_URL_PATTERN.sub(rewrite, css)
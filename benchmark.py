@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the site's post pipeline.
+
+Usage:
+    python benchmark.py memory [--sizes 1000 10000 100000]
+    python benchmark.py render-threads [--threads 16] [--rounds 20]
+    python benchmark.py search [--sizes 1000 10000]
+    python benchmark.py search-index [--sizes 100 1000 10000] [--shard-bytes 16384]
+    python benchmark.py startup [--runs 5] [--max-ms 1000]
+"""
+
+import argparse
+import gc
+import gzip
+import json
+import math
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from app.models.post import Post
+from app.services.config_service import ConfigService
+from app.services.markdown_service import MarkdownService
+from app.services.search_service import SearchService, tokenize
+
+CATEGORIES = ['openstack', 'ux', 'ovirt', 'kubernetes', 'design']
+
+def make_synthetic_posts(count, body_size=512, keep_content=True):
+    """Build `count` rendered posts without touching the filesystem."""
+    start = datetime(2000, 1, 1)
+    body = ('lorem ipsum dolor sit amet ' * (body_size // 27 + 1))[:body_size]
+    posts = []
+    for i in range(count):
+        # Build the strings per post, as the loader would after reading a file
+        title = f"Synthetic post number {i}"
+        date = start + timedelta(days=i % 9000)
+        category = CATEGORIES[i % len(CATEGORIES)]
+        post = Post(
+            path=f"synthetic-post-{i}",
+            title=title,
+            date=date,
+            categories=[''.join(category)],
+            content=f"{body} {i}",
+            metadata={
+                'layout': 'post',
+                'title': title,
+                'date': date.strftime('%Y-%m-%d'),
+                'tags': [''.join(category), 'synthetic'],
+            },
+            source_path=f"/posts/synthetic-post-{i}.markdown",
+            keep_content=keep_content,
+        )
+        post.html_content = f"<p>{body} {i}</p>"
+        if not keep_content:
+            post.content = None
+        posts.append(post)
+    return posts
+
+def make_vocabulary(size, seed=0):
+    """Build a list of distinct pseudo-words."""
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choice(letters) for _ in range(rng.randint(3, 10))))
+    return sorted(words)
+
+def make_text_posts(count, words_per_post=300, vocabulary_size=20000, seed=0):
+    """Build posts whose bodies draw words from a Zipf-like distribution."""
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(vocabulary_size, seed)
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    start = datetime(2000, 1, 1)
+    posts = []
+    for i in range(count):
+        words = rng.choices(vocabulary, weights, k=words_per_post)
+        posts.append(Post(
+            path=f"synthetic-post-{i}",
+            title=' '.join(rng.choices(vocabulary, weights, k=6)),
+            date=start + timedelta(days=i % 9000),
+            categories=[],
+            content=' '.join(words),
+        ))
+    return posts, vocabulary
+
+def percentile(values, fraction):
+    """Get the value below which the given fraction of values fall."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def bench_search(args):
+    """Report index build, incremental update and query latency."""
+    print(f"{'posts':>8} {'build s':>8} {'update ms':>10} {'p50 ms':>8} {'p95 ms':>8}")
+    for count in args.sizes:
+        posts, vocabulary = make_text_posts(count)
+        search_service = SearchService()
+
+        start = time.perf_counter()
+        search_service.update(tuple(posts))
+        build_time = time.perf_counter() - start
+
+        # Replace one post, as a corpus reload after a single edit would
+        edited = list(posts)
+        edited[0] = make_text_posts(1, seed=count)[0][0]
+        start = time.perf_counter()
+        search_service.update(tuple(edited))
+        update_time = time.perf_counter() - start
+
+        rng = random.Random(1)
+        queries = []
+        for _ in range(args.queries):
+            words = rng.sample(vocabulary[:2000], 2)
+            # Last word typed halfway, to exercise prefix matching
+            queries.append(f"{words[0]} {words[1][:max(3, len(words[1]) // 2)]}")
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            search_service.search(query, limit=10)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        print(f"{count:>8} {build_time:>8.2f} {update_time * 1000:>10.1f} "
+              f"{percentile(latencies, 0.5):>8.3f} {percentile(latencies, 0.95):>8.3f}")
+
+def shards_for(manifest, token, prefix):
+    """Pick the shards a browser would fetch for a query token."""
+    best = None
+    files = []
+    for key, name in manifest['shards']:
+        if token.startswith(key):
+            if best is None or len(key) > len(best[0]):
+                best = (key, name)
+        elif prefix and key.startswith(token):
+            files.append(name)
+    if best is not None:
+        files.append(best[1])
+    return files
+
+def load_static_index(files):
+    """Parse the manifest and documents file, as the writings page does on first use."""
+    manifest = json.loads(files['manifest.json'])
+    docs = json.loads(files[manifest['documents']])
+    average_length = sum(doc[3] for doc in docs) / len(docs) or 1
+    return manifest, docs, average_length
+
+def query_static_index(files, index, query):
+    """Run a query the way the writings page does, returning (paths, bytes fetched)."""
+    manifest, docs, average_length = index
+    ranking = manifest['ranking']
+    tokens = list(dict.fromkeys(tokenize(query)))
+
+    names = set()
+    for i, token in enumerate(tokens):
+        names.update(shards_for(manifest, token, i == len(tokens) - 1))
+    fetched = sum(len(files[name]) for name in names)
+    terms = {}
+    for name in names:
+        terms.update(json.loads(files[name]))
+
+    scores = {}
+    def add_term(postings, weight, limit=None):
+        frequency = len(postings) / 2
+        idf = math.log(1 + (len(docs) - frequency + 0.5) / (frequency + 0.5))
+        factor = weight * idf * (ranking['k1'] + 1)
+        impacts = []
+        doc = 0
+        for gap, tf in zip(postings[::2], postings[1::2]):
+            doc += gap
+            norm = ranking['k1'] * (1 - ranking['b'] + ranking['b'] * docs[doc][3] / average_length)
+            impacts.append((doc, tf / (tf + norm)))
+        if limit and len(impacts) > limit:
+            impacts = sorted(impacts, key=lambda impact: impact[1], reverse=True)[:limit]
+        for doc, impact in impacts:
+            scores[doc] = scores.get(doc, 0.0) + factor * impact
+
+    for i, token in enumerate(tokens):
+        if token in terms:
+            add_term(terms[token], 1.0)
+        if i == len(tokens) - 1:
+            expansions = sorted(term for term in terms if term.startswith(token))
+            for term in expansions[:ranking['max_prefix_expansions'] + 1]:
+                if term != token:
+                    add_term(terms[term], ranking['prefix_weight'], ranking.get('max_prefix_postings'))
+    ranked = sorted(scores, key=scores.get, reverse=True)
+    return [docs[doc][0] for doc in ranked], fetched
+
+def bench_search_index(args):
+    """Report static index size, bytes fetched per query and client-side query cost."""
+    print(f"{'posts':>8} {'files':>6} {'total KB':>9} {'gzip KB':>8} {'max shard KB':>13} "
+          f"{'fetched KB':>11} {'p50 ms':>8} {'changed':>8}")
+    for count in args.sizes:
+        posts, vocabulary = make_text_posts(count, words_per_post=args.words)
+        search_service = SearchService()
+        search_service.update(tuple(posts))
+        files = search_service.export_index(args.shard_bytes)
+
+        # Publish one new post and count the files whose contents changed
+        newest = make_text_posts(1, words_per_post=args.words, seed=count)[0][0]
+        newest.path = 'synthetic-post-new'
+        newest.date = max(post.date for post in posts) + timedelta(days=1)
+        search_service.update(tuple(posts) + (newest,))
+        changed = len(set(search_service.export_index(args.shard_bytes)) - set(files))
+
+        total = sum(len(data) for data in files.values())
+        compressed = sum(len(gzip.compress(data, mtime=0)) for data in files.values())
+        largest = max(len(data) for name, data in files.items() if name.startswith('terms-'))
+
+        index = load_static_index(files)
+        rng = random.Random(1)
+        fetched = []
+        latencies = []
+        for _ in range(args.queries):
+            words = rng.sample(vocabulary[:2000], 2)
+            query = f"{words[0]} {words[1][:max(3, len(words[1]) // 2)]}"
+            start = time.perf_counter()
+            _, fetched_bytes = query_static_index(files, index, query)
+            latencies.append((time.perf_counter() - start) * 1000)
+            fetched.append(fetched_bytes)
+
+        print(f"{count:>8} {len(files):>6} {total / 1024:>9.1f} {compressed / 1024:>8.1f} "
+              f"{largest / 1024:>13.1f} {percentile(fetched, 0.5) / 1024:>11.1f} "
+              f"{percentile(latencies, 0.5):>8.2f} {changed:>8}")
+
+# Timed in a fresh interpreter; prints one JSON line with the phase timings
+STARTUP_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+status = app.test_client().get('/').status_code
+responded = time.perf_counter()
+print(json.dumps({'import': imported - start, 'create_app': created - imported,
+                  'first_response': responded - created, 'total': responded - start,
+                  'status': status}))
+"""
+
+def parse_importtime(stderr):
+    """Parse `python -X importtime` output into (module, depth, self us, cumulative us) rows."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows
+
+def bench_startup(args):
+    """Report import cost and time to first response of a fresh create_app()."""
+    root = Path(__file__).resolve().parent
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_SCRIPT],
+        cwd=root, capture_output=True, text=True, check=True
+    )
+    rows = parse_importtime(result.stderr)
+    top_level = sorted((row for row in rows if row[1] == 0), key=lambda row: row[3], reverse=True)
+    print(f"imports until first response: {sum(row[3] for row in top_level) / 1000:.1f} ms "
+          f"across {len(rows)} modules")
+    print(f"{'module':<40} {'cumulative ms':>14}")
+    for name, _, _, cumulative_us in top_level[:args.top]:
+        print(f"{name:<40} {cumulative_us / 1000:>14.1f}")
+
+    runs = []
+    for _ in range(args.runs):
+        result = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT],
+                                cwd=root, capture_output=True, text=True, check=True)
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    print()
+    print(f"{'phase':<16} {'median ms':>10} {'max ms':>8}")
+    for phase in ('import', 'create_app', 'first_response', 'total'):
+        values = [run[phase] * 1000 for run in runs]
+        print(f"{phase:<16} {statistics.median(values):>10.1f} {max(values):>8.1f}")
+
+    total = statistics.median(run['total'] * 1000 for run in runs)
+    if any(run['status'] != 200 for run in runs):
+        print("FAILED: the first request did not return 200")
+        sys.exit(1)
+    if args.max_ms and total > args.max_ms:
+        print(f"FAILED: median time to first response {total:.1f} ms exceeds {args.max_ms} ms")
+        sys.exit(1)
+
+def bench_memory(args):
+    """Report bytes held per post for synthetic corpora of several sizes."""
+    print(f"{'posts':>8} {'keep_content':>13} {'bytes/post':>11}")
+    for count in args.sizes:
+        for keep_content in (True, False):
+            gc.collect()
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            posts = make_synthetic_posts(count, args.body_size, keep_content)
+            after = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            print(f"{count:>8} {str(keep_content):>13} {(after - before) / len(posts):>11.0f}")
+            del posts
+
+def load_post_sources(posts_dir='app/posts'):
+    """Read the markdown body of every post in the posts directory."""
+    sources = []
+    for file_path in sorted(Path(posts_dir).glob('*.markdown')):
+        sources.append(Post.from_file(str(file_path)).content)
+    return sources
+
+def bench_render_threads(args):
+    """Render concurrently from many threads and compare with serial output."""
+    config_service = ConfigService()
+    # Bypass the render cache so every call really runs the converter
+    config_service.set('markdown.cache.enabled', False)
+    markdown_service = MarkdownService(config_service)
+
+    sources = load_post_sources()
+    start = time.perf_counter()
+    expected = [markdown_service._render_markdown(source) for source in sources]
+    serial_time = time.perf_counter() - start
+
+    mismatches = []
+    barrier = threading.Barrier(args.threads)
+
+    def worker(seed):
+        order = list(range(len(sources)))
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(args.rounds):
+            rng.shuffle(order)
+            for i in order:
+                if markdown_service._render_markdown(sources[i]) != expected[i]:
+                    mismatches.append(i)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    threaded_time = time.perf_counter() - start
+
+    renders = args.threads * args.rounds * len(sources)
+    print(f"serial:   {len(sources)} documents in {serial_time * 1000:.1f} ms")
+    print(f"threaded: {renders} renders on {args.threads} threads in {threaded_time * 1000:.1f} ms")
+    if mismatches:
+        print(f"FAILED: {len(mismatches)} renders differed from the serial output")
+        sys.exit(1)
+    print("OK: every concurrent render matched the serial output byte for byte")
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Benchmark the post pipeline.")
+    subparsers = parser.add_subparsers(dest='command')
+
+    memory = subparsers.add_parser('memory', help="Bytes held per post in memory")
+    memory.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    memory.add_argument('--body-size', type=int, default=512,
+                        help="Length of each synthetic markdown body")
+    memory.set_defaults(func=bench_memory)
+
+    render_threads = subparsers.add_parser(
+        'render-threads', help="Stress-test concurrent markdown rendering")
+    render_threads.add_argument('--threads', type=int, default=16)
+    render_threads.add_argument('--rounds', type=int, default=20)
+    render_threads.set_defaults(func=bench_render_threads)
+
+    search = subparsers.add_parser('search', help="Full-text search index latency")
+    search.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    search.add_argument('--queries', type=int, default=200)
+    search.set_defaults(func=bench_search)
+
+    search_index = subparsers.add_parser(
+        'search-index', help="Static search index size and client-side query cost")
+    search_index.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    search_index.add_argument('--shard-bytes', type=int, default=16 * 1024)
+    search_index.add_argument('--words', type=int, default=300, help="Words per synthetic post")
+    search_index.add_argument('--queries', type=int, default=200)
+    search_index.set_defaults(func=bench_search_index)
+
+    startup = subparsers.add_parser(
+        'startup', help="Import time and time to first response of create_app()")
+    startup.add_argument('--runs', type=int, default=5, help="Fresh interpreters to time")
+    startup.add_argument('--top', type=int, default=10, help="Slowest top-level imports to list")
+    startup.add_argument('--max-ms', type=float, default=0,
+                         help="Fail if the median time to first response exceeds this")
+    startup.set_defaults(func=bench_startup)
+
+    args = parser.parse_args()
+    if not hasattr(args, 'func'):
+        parser.print_help()
+        return
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,471 @@
 import os
 import sys
+import json
+import glob
 import shutil
+import hashlib
+import time
+import argparse
 import logging
 import re
-from flask import render_template, url_for
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from flask import url_for
 from app import create_app
-from app.services.post_service import PostService
-from app.services.markdown_service import MarkdownService
-from app.services.config_service import ConfigService
+from app.services.service_factory import ServiceFactory
+from app.services.static_service import PROJECT_ROOT
 from app.models.post import Post
+from app.repositories.post_index import normalize_term
+from app.utils.build_manifest import BuildManifest, hash_file, hash_inputs, write_output
+from app.utils.freezer import DEFAULT_SKIP_ENDPOINTS, Freezer
+from app.utils.compress import precompress_tree
+from app.utils.images import (DERIVATIVE_VERSION, DerivativeCache, add_srcset, derivative_name,
+                              encode_derivatives, is_resizable)
+from app.utils.static import split_fingerprint
+
+# Outputs of the previous build and the inputs they were rendered from
+BUILD_MANIFEST_PATH = os.path.join('.cache', 'build-manifest.json')
+
+# Search results depend on the query string, which a static site cannot serve
+SKIP_ENDPOINTS = DEFAULT_SKIP_ENDPOINTS | {'main.search'}
+
+# Post images linked on GitHub instead of the site
+GITHUB_POST_IMAGES = 'https://github.com/lizsurette/lizsurette.github.io/raw/main/static/img/_posts/'
+
+# What follows the href of the active home link
+ACTIVE_HOME_LINK = ' class="active">About Me</a>'
+
+# href and src attributes that need rewriting: absolute paths, post images
+# linked on GitHub, values with a trailing slash and the active home link.
+# data-index holds the URL of the writings page's search index. The
+# closing quote is optional so that an unterminated value still has its
+# prefix rewritten.
+LINK_PATTERN = re.compile(
+    r'(href|src|data-index)="('
+    r'(?:/|' + re.escape(GITHUB_POST_IMAGES) + r')[^"]*'
+    r'|[^"]*/(?=")'
+    r'|[^"]*(?=' + re.escape('"' + ACTIVE_HOME_LINK) + r')'
+    r')("?)'
+)
+
+# Absolute href and src attributes, rewritten in the root index.html
+INDEX_LINK_PATTERN = re.compile(r'(href|src)="(/[^"]*)("?)')
+
+# Navigation links of the root index.html and their relative form
+INDEX_SECTION_LINKS = {
+    '/': './',
+    '/writings/': 'writings/',
+    '/games/': 'games/',
+    '/projects/': 'projects/',
+    '/apps/': 'apps/'
+}
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def get_post_service():
+    """Get the PostService shared by the build and the Flask app.
+    
+    Only front matter is loaded here; the HTML of the posts whose pages are
+    stale is rendered in one batch by render_posts(). Call this before
+    create_app() so the app picks up the same, already loaded corpus.
+    """
+    return ServiceFactory.get_post_service()
+
 def get_posts():
     """Get all posts using PostService."""
-    config_service = ConfigService()
-    markdown_service = MarkdownService(config_service)
-    post_service = PostService(config_service, markdown_service)
-    return post_service.get_all_posts()
+    return get_post_service().get_all_posts()
+
+def render_posts(post_service, posts=None):
+    """Render posts in one batch and log where time went.
+    
+    Args:
+        post_service: The PostService holding the corpus
+        posts: The posts to render, every post of the corpus by default
+    """
+    timings = post_service.render_all(posts)
+    if timings:
+        slowest = max(timings, key=timings.get)
+        logger.info(f"Rendered {len(timings)} posts in {sum(timings.values()) * 1000:.1f} ms "
+                    f"(slowest: {slowest}, {timings[slowest] * 1000:.1f} ms)")
+
+def get_build_manifest(relative_links, images=None):
+    """Load the manifest of the previous build.
+    
+    The builder, the app's views, the site configuration, the link style
+    and the resized copies of the images affect every page, so a change
+    to any of them makes all recorded outputs stale.
+    """
+    sources = [os.path.abspath(__file__), os.path.join('app', '__init__.py')]
+    sources += sorted(glob.glob(os.path.join('app', 'routes', '*.py')))
+    config = ServiceFactory.get_config_service().config
+    copies = images.copies if images else {}
+    return BuildManifest(BUILD_MANIFEST_PATH,
+                         hash_inputs([hash_file(source) for source in sources], config, relative_links, copies))
+
+class ImageDerivatives(NamedTuple):
+    """The resized copies of the images of the static directory.
+    
+    Attributes:
+        copies: Widths and published names of the copies by image path in
+            the static directory, narrowest first; the image itself is
+            listed when no copy has its full width
+        files: The cached file of every copy by published name
+        sizes: sizes attribute of images without a width
+    """
+    copies: Dict[str, List[Tuple[int, str]]]
+    files: Dict[str, str]
+    sizes: str
+
+def _encode_image(task):
+    """Encode the copies of one image, returning its cache key and entry or error."""
+    source_path, widths, quality, cache_dir, key = task
+    try:
+        return key, encode_derivatives(source_path, widths, quality, cache_dir, key), None
+    except Exception as e:
+        return key, None, f"{source_path}: {e}"
+
+def build_image_derivatives(workers=1):
+    """Resize the images of the static directory for srcset.
+    
+    Every PNG and JPEG below images.dir gets copies at images.widths that
+    are smaller than it, re-encoded with the best compression of their
+    format. Copies are cached by a hash of the image and the settings, so
+    an image is only encoded again when it changes; the images that need
+    encoding are spread over a pool of processes. Without Pillow, images
+    that are not cached yet get no copies.
+    
+    Args:
+        workers: Number of processes encoding images
+        
+    Returns:
+        ImageDerivatives
+    """
+    config = ServiceFactory.get_config_service()
+    static_service = ServiceFactory.get_static_service()
+    cache_dir = config.image_cache_dir
+    if not os.path.isabs(cache_dir):
+        # Relative to the project root, like the static and posts directories
+        cache_dir = str(PROJECT_ROOT / cache_dir)
+    cache = DerivativeCache(cache_dir)
+    widths, quality = sorted(config.image_widths), config.image_quality
+    static_dir = str(static_service.static_dir)
+    
+    keys = {}
+    for directory, dirs, files in os.walk(os.path.join(static_dir, config.image_dir)):
+        dirs.sort()
+        for name in sorted(files):
+            if is_resizable(name):
+                file_path = os.path.relpath(os.path.join(directory, name), static_dir).replace(os.sep, '/')
+                fingerprint = split_fingerprint(static_service.asset_name(file_path))[1]
+                keys[file_path] = hash_inputs(fingerprint, widths, quality, DERIVATIVE_VERSION)
+    
+    tasks = [(os.path.join(static_dir, *file_path.split('/')), widths, quality, cache.cache_dir, key)
+             for file_path, key in keys.items() if cache.get(key) is None]
+    if tasks:
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            logger.warning(f"Pillow is not installed (pip install -r requirements-images.txt); "
+                           f"{len(tasks)} images get no resized copies")
+            tasks = []
+    
+    start = time.perf_counter()
+    workers = min(workers, len(tasks))
+    if workers <= 1:
+        results = [_encode_image(task) for task in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_encode_image, tasks))
+    for key, entry, error in results:
+        if error is not None:
+            logger.error(f"Error resizing {error}")
+        else:
+            cache.put(key, entry)
+    cache.prune(list(keys.values()))
+    cache.save()
+    
+    copies = {}
+    files = {}
+    original_bytes = smallest_bytes = 0
+    for file_path, key in keys.items():
+        entry = cache.get(key)
+        if not entry or not entry['widths']:
+            continue
+        image_copies = []
+        for width in entry['widths']:
+            name = derivative_name(file_path, width, key)
+            image_copies.append((width, name))
+            files[name] = cache.path(key, width)
+        if entry['width'] not in entry['widths']:
+            image_copies.append((entry['width'], file_path))
+        copies[file_path] = image_copies
+        original_bytes += os.path.getsize(os.path.join(static_dir, *file_path.split('/')))
+        smallest_bytes += os.path.getsize(cache.path(key, entry['widths'][0]))
+    
+    logger.info(f"Images: {len(copies)} of {len(keys)} resized, {len(results)} encoded in "
+                f"{(time.perf_counter() - start) * 1000:.1f} ms with {max(workers, 1)} worker(s); "
+                f"the narrowest copies are {smallest_bytes * 100 / original_bytes if original_bytes else 0:.1f}% "
+                f"of the originals' bytes")
+    return ImageDerivatives(copies, files, config.image_sizes)
+
+def get_freezer(app):
+    """Get the Freezer turning the app's routes into the files of _site."""
+    return Freezer(app, '_site', SKIP_ENDPOINTS)
+
+def register_url_generators(freezer, post_service):
+    """Tell the freezer which pages the routes with URL arguments have.
+    
+    Every page comes with the data it is rendered from besides its
+    templates, so the build manifest notices when it goes stale: a post
+    page depends on the post file and on the titles and paths of the
+    neighbours it links to, a listing page on its position and the posts
+    it lists.
+    
+    Args:
+        freezer: The Freezer of this build
+        post_service: The PostService holding the corpus
+    """
+    per_page = post_service.config.posts_per_page
+    
+    def listing_data(pagination, context):
+        return {
+            'context': context,
+            'page': pagination.page,
+            'pages': pagination.pages,
+            'posts': [(post.path, post.title, post.date.isoformat()) for post in pagination.items]
+        }
+    
+    @freezer.register_generator('main.writings')
+    def writings_pages():
+        page = 1
+        pagination = post_service.get_page(page, per_page)
+        while pagination is not None:
+            # The first page lives at /writings/, /writings/page/1/ redirects there
+            yield ({'page': page} if page > 1 else {}), listing_data(pagination, {'title': 'Writings'})
+            page += 1
+            pagination = post_service.get_page(page, per_page)
+    
+    @freezer.register_generator('main.category')
+    def category_pages():
+        for category in post_service.get_categories():
+            slug = normalize_term(category)
+            page = 1
+            pagination = post_service.get_category_page(slug, page, per_page)
+            while pagination is not None:
+                values = {'name': slug, 'page': page} if page > 1 else {'name': slug}
+                yield values, listing_data(pagination, {'category': slug})
+                page += 1
+                pagination = post_service.get_category_page(slug, page, per_page)
+    
+    repository = post_service.repository
+    posts = []
+    for post in post_service.get_all_posts():
+        neighbours = (repository.get_prev_post(post.path), repository.get_next_post(post.path))
+        posts.append((post.path, {
+            'path': post.path,
+            'source': hash_file(post.source_path) if post.source_path else post.load_content(),
+            'neighbours': [(neighbour.path, neighbour.title) if neighbour else None for neighbour in neighbours]
+        }))
+    
+    # Both blueprints serve posts at the same URLs; the freezer writes each once
+    freezer.register_generator('main.post')(lambda: (({'post_path': path}, data) for path, data in posts))
+    freezer.register_generator('post.view')(lambda: (({'path': path}, data) for path, data in posts))
+    
+    @freezer.register_generator('main.search_index_file')
+    def search_index_files():
+        search_service = ServiceFactory.get_search_service()
+        search_service.update(repository.get_index())
+        files = search_service.export_index()
+        shard_sizes = [len(data) for name, data in files.items() if name.startswith('terms-')]
+        logger.info(f"Search index: {len(shard_sizes)} shards, {sum(len(data) for data in files.values())} bytes "
+                    f"(largest shard {max(shard_sizes, default=0)} bytes)")
+        for name, data in sorted(files.items()):
+            yield {'filename': name}, hashlib.sha256(data).hexdigest()
+
+class PageResult(NamedTuple):
+    """The outcome of freezing one page.
+    
+    Attributes:
+        url: The URL frozen
+        output_path: The file written
+        templates: Templates the view rendered
+        output_hash: Hash of the page's contents, None unless it was written
+        size: Size of the page in bytes
+        written: Whether the file was written
+        seconds: Time spent dispatching and writing the page
+        worker: Process ID of the process that built the page
+        error: Error message if the build failed
+        location: Target of the redirect the URL answered with, if any
+        assets: Fingerprinted static files the page links to
+    """
+    url: str
+    output_path: str
+    templates: List[str]
+    output_hash: Optional[str]
+    size: int
+    written: bool
+    seconds: float
+    worker: int
+    error: Optional[str] = None
+    location: Optional[str] = None
+    assets: Tuple[str, ...] = ()
+
+def page_inputs(manifest, env, templates, data, assets=()):
+    """Hash the templates a page was rendered from together with its data.
+    
+    The fingerprinted static files the page links to are part of its
+    inputs too: when one of them changes, the page has to link to the new
+    name.
+    """
+    static_service = ServiceFactory.get_static_service()
+    current = [static_service.asset_name(split_fingerprint(name)[0]) for name in assets]
+    return hash_inputs([(name, manifest.template_hash(env, name)) for name in templates], data, current)
+
+def build_page(freezer, page, previous_hash=None, relative_links=False, images=None):
+    """Freeze one page and write it unless the file already has the same contents.
+    
+    Args:
+        freezer: The Freezer of this process
+        page: The FrozenPage to build
+        previous_hash: Hash of the contents the previous build wrote
+        relative_links: Rewrite links in HTML relative to the output file
+        images: ImageDerivatives whose copies are offered through srcset
+        
+    Returns:
+        PageResult
+    """
+    start = time.perf_counter()
+    try:
+        response = freezer.dispatch(page.url)
+        if 300 <= response.status < 400:
+            return PageResult(page.url, page.output_path, response.templates, None, 0, False,
+                              time.perf_counter() - start, os.getpid(), location=response.location)
+        if response.status != 200:
+            raise ValueError(f"status {response.status}")
+        body = response.body
+        if response.mimetype == 'text/html' and (relative_links or images and images.copies):
+            body = body.decode('utf-8')
+            if relative_links:
+                body = rewrite_paths(body, page.output_path)
+            if images and images.copies:
+                body = add_srcset(body, images.copies, images.sizes)
+        output_hash, size, written = write_output(page.output_path, body, previous_hash)
+    except Exception as e:
+        return PageResult(page.url, page.output_path, [], None, 0, False,
+                          time.perf_counter() - start, os.getpid(), str(e))
+    assets = tuple(dict.fromkeys(name for name in response.static_files if split_fingerprint(name)))
+    return PageResult(page.url, page.output_path, response.templates, output_hash, size, written,
+                      time.perf_counter() - start, os.getpid(), assets=assets)
+
+# Freezer of a parallel build worker, set up once by _init_build_worker
+_worker_freezer = None
+_worker_relative_links = False
+_worker_images = None
+
+def _init_build_worker(relative_links, images):
+    """Set up the Flask app used by a parallel build worker.
+    
+    Forked workers inherit the corpus snapshot the parent already loaded,
+    read only; other start methods load the same files again.
+    """
+    global _worker_freezer, _worker_relative_links, _worker_images
+    get_post_service()
+    _worker_freezer = get_freezer(create_app())
+    _worker_relative_links = relative_links
+    _worker_images = images
+
+def _build_in_worker(task):
+    """Build one page inside a parallel build worker."""
+    page, previous_hash = task
+    return build_page(_worker_freezer, page, previous_hash, _worker_relative_links, _worker_images)
+
+def find_stale_pages(freezer, manifest, pages):
+    """Keep the pages whose inputs are unchanged and return the others.
+    
+    A page's inputs are the templates its view rendered in the previous
+    build, the static files it linked to and the data its URL generator
+    describes it with. Pages that
+    were not written by the previous build, such as redirects, are always
+    stale.
+    
+    Returns:
+        List of FrozenPage to build
+    """
+    stale = []
+    for page in pages:
+        templates = manifest.previous_templates(page.output_path)
+        if templates is not None:
+            inputs = page_inputs(manifest, freezer.app.jinja_env, templates, page.data,
+                                 manifest.previous_assets(page.output_path))
+            if manifest.is_fresh(page.output_path, inputs):
+                manifest.keep(page.output_path)
+                continue
+        stale.append(page)
+    return stale
+
+def build_pages(freezer, manifest, pages, relative_links=False, workers=1, images=None):
+    """Build pages and record them in the manifest.
+    
+    With more than one worker the pages are split into chunks and built
+    by a pool of processes, each dispatching through its own Flask app,
+    which write their pages themselves. Pages come out the same either way.
+    
+    Args:
+        freezer: The Freezer of this process
+        manifest: The BuildManifest of this build
+        pages: The FrozenPage of every page to build
+        relative_links: Rewrite links relative to each output file
+        workers: Number of worker processes; 1 builds in this process
+        images: ImageDerivatives whose copies are offered through srcset
+        
+    Returns:
+        List of URLs that failed to build
+    """
+    tasks = [(page, manifest.previous_hash(page.output_path)) for page in pages]
+    workers = min(workers, len(tasks))
+    start = time.perf_counter()
+    if workers <= 1:
+        results = [build_page(freezer, page, previous_hash, relative_links, images)
+                   for page, previous_hash in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_build_worker,
+                                 initargs=(relative_links, images)) as executor:
+            chunk_size = max(1, len(tasks) // (workers * 4))
+            results = list(executor.map(_build_in_worker, tasks, chunksize=chunk_size))
+    elapsed = time.perf_counter() - start
+    
+    failed = []
+    redirects = 0
+    per_worker = {}
+    env = freezer.app.jinja_env
+    data = {page.output_path: page.data for page in pages}
+    for result in results:
+        if result.error is not None:
+            logger.error(f"Error building {result.url}: {result.error}")
+            failed.append(result.url)
+            if manifest.previous_hash(result.output_path):
+                # Leave the last good page in place and try again next time
+                manifest.keep(result.output_path, stale=True)
+            continue
+        if result.location is not None:
+            logger.debug(f"Not freezing {result.url}: redirects to {result.location}")
+            redirects += 1
+            continue
+        inputs = page_inputs(manifest, env, result.templates, data[result.output_path], result.assets)
+        manifest.record(result.output_path, inputs, result.output_hash, result.size, result.written,
+                        result.templates, list(result.assets))
+        count, seconds = per_worker.get(result.worker, (0, 0.0))
+        per_worker[result.worker] = (count + 1, seconds + result.seconds)
+    
+    logger.info(f"Built {len(tasks) - redirects} pages in {elapsed * 1000:.1f} ms "
+                f"with {max(workers, 1)} worker(s), skipped {redirects} redirects")
+    for worker, (count, seconds) in sorted(per_worker.items()):
+        logger.info(f"  worker {worker}: {count} pages in {seconds * 1000:.1f} ms "
+                    f"({count / seconds if seconds else 0:.1f} pages/s)")
+    return failed
 
 def clean_site_directory():
     """Clean the _site directory before generating static files."""
@@ -32,226 +478,266 @@ def clean_site_directory():
     os.makedirs(site_dir)
     logger.info(f"Cleaned and created {site_dir} directory")
 
-def copy_static_assets():
-    """Copy static assets to the _site directory."""
-    static_dir = os.path.join('app', 'static')
-    site_static_dir = os.path.join('_site', 'static')
+def copy_static_assets(relative_links=False):
+    """Sync static assets to the _site directory.
+    
+    Only assets that changed since the previous build are copied, and
+    assets deleted from app/static are removed from _site/static. The
+    copies written by publish_assets() are left to the build manifest,
+    and the .gz files of precompress_site() stay next to their files.
     
-    if os.path.exists(site_static_dir):
-        shutil.rmtree(site_static_dir)
+    Args:
+        relative_links: Rewrite links in the HTML files among the assets
+            relative to their location while copying them
+            
+    Returns:
+        SyncStats of the sync
+    """
+    transforms = None
+    if relative_links:
+        def rewrite_asset(target, data):
+            return rewrite_paths(data.decode('utf-8'), target).encode('utf-8')
+        transforms = {'.html': rewrite_asset}
     
-    shutil.copytree(static_dir, site_static_dir)
-    logger.info(f"Copied static assets to {site_static_dir}")
+    static_service = ServiceFactory.get_static_service()
+    previous_build = BuildManifest(BUILD_MANIFEST_PATH)
+    
+    def keep(name):
+        if name.endswith('.gz'):
+            name = name[:-3]
+            if os.path.isfile(os.path.join(str(static_service.static_dir), *name.split('/'))):
+                return True
+        return previous_build.previous_hash(os.path.join('_site', 'static', *name.split('/'))) is not None
+    
+    stats = static_service.copy_static_files('_site', transforms=transforms, keep=keep)
+    logger.info(f"Static assets: {stats.copied} copied ({stats.bytes_copied} bytes), {stats.linked} linked, "
+                f"{stats.unchanged} unchanged, {stats.removed} removed")
+    return stats
 
-def generate_static_files():
-    """Generate static files for the site."""
-    logger.info("Generating static files...")
+def publish_assets(manifest, images=None):
+    """Write the fingerprinted static files the pages of this build link to.
     
-    app = create_app()
-    
-    # Generate index page
-    with app.test_request_context():
-        index_html = render_template('index.html')
-        with open(os.path.join('_site', 'index.html'), 'w', encoding='utf-8') as f:
-            f.write(index_html)
-    
-    # Generate writings page
-    with app.test_request_context():
-        # Get all posts and ensure they have valid paths
-        posts = get_posts()
-        for post in posts:
-            if not post.path or not post.path.strip():
-                post.path = slugify(post.meta.title)
+    Stylesheets bring along the files their url() references point at,
+    and the resized copies of images are written too. The files are
+    recorded in the build manifest like pages, so each is written once
+    and removed when no page links to it any more.
+    
+    Args:
+        manifest: The BuildManifest of this build
+        images: ImageDerivatives to write
         
-        writings_html = render_template('writings.html', posts=posts)
-        os.makedirs(os.path.join('_site', 'writings'), exist_ok=True)
-        with open(os.path.join('_site', 'writings', 'index.html'), 'w', encoding='utf-8') as f:
-            f.write(writings_html)
-    
-    # Generate post pages
-    for post in posts:
-        post_path = post.path
-        post_dir = os.path.join('_site', 'posts', post_path)
-        os.makedirs(post_dir, exist_ok=True)
+    Returns:
+        Number of files written
+    """
+    static_service = ServiceFactory.get_static_service()
+    pending = [split_fingerprint(name)[0] for name in manifest.assets()]
+    seen = set()
+    written = 0
+    while pending:
+        file_path = pending.pop()
+        if file_path in seen:
+            continue
+        seen.add(file_path)
+        pending.extend(static_service.asset_dependencies(file_path))
         
-        with app.test_request_context():
-            post_html = render_template('post.html', post=post)
-            with open(os.path.join(post_dir, 'index.html'), 'w', encoding='utf-8') as f:
-                f.write(post_html)
-    
-    # Generate games, apps, and projects pages
-    pages = [
-        ('games', 'Games'),
-        ('apps', 'Apps'),
-        ('projects', 'Projects')
-    ]
-    
-    for page_name, title in pages:
-        page_dir = os.path.join('_site', page_name)
-        os.makedirs(page_dir, exist_ok=True)
+        name = static_service.asset_name(file_path)
+        output_path = os.path.join('_site', 'static', *name.split('/'))
+        if name == file_path:
+            continue
+        if manifest.is_fresh(output_path, name):
+            manifest.keep(output_path)
+            continue
+        content = static_service.asset_content(file_path)
+        if content is None:
+            with open(os.path.join(str(static_service.static_dir), *file_path.split('/')), 'rb') as f:
+                content = f.read()
+        written += manifest.write(output_path, name, content)
+    
+    for name, cache_path in sorted((images.files if images else {}).items()):
+        output_path = os.path.join('_site', 'static', *name.split('/'))
+        if manifest.is_fresh(output_path, name):
+            manifest.keep(output_path)
+            continue
+        with open(cache_path, 'rb') as f:
+            written += manifest.write(output_path, name, f.read())
+    return written
+
+def generate_static_files(relative_links=False, workers=1):
+    """Generate static files for the site.
+    
+    Every route of the app is frozen, see register_url_generators() for
+    the routes with URL arguments. Pages whose inputs are unchanged since
+    the previous build are left alone, and pages the build no longer
+    produces are removed.
+    
+    Args:
+        relative_links: Rewrite links in every page relative to its location,
+            so the site can be browsed without a web server
+        workers: Number of processes rendering pages in parallel
         
-        with app.test_request_context():
-            page_html = render_template(f'{page_name}.html', title=title)
-            with open(os.path.join(page_dir, 'index.html'), 'w', encoding='utf-8') as f:
-                f.write(page_html)
-    
-    # Generate game pages
-    games = ['snake', 'strands', 'sudoku', 'maze', 'gem-miner', 'hangman', 'bubble-shooter', 'survival']
-    for game in games:
-        try:
-            # Create the game directory structure directly in _site
-            game_dir = os.path.join('_site', game)
-            os.makedirs(game_dir, exist_ok=True)
-            
-            # Map game names to their template names
-            template_map = {
-                'snake': 'snake.html',
-                'strands': 'strands.html',
-                'sudoku': 'sudoku.html',
-                'maze': 'maze.html',
-                'gem-miner': 'gem-miner.html',
-                'hangman': 'hangman.html',
-                'bubble-shooter': 'bubble-shooter.html',
-                'survival': 'survival.html'
-            }
-            
-            # For games that should be copied directly from static directory
-            static_only_games = set()
-            
-            if game in static_only_games:
-                # Copy directly from static directory
-                static_game_dir = os.path.join('app', 'static', 'games', game)
-                if os.path.exists(static_game_dir):
-                    shutil.copytree(static_game_dir, game_dir, dirs_exist_ok=True)
-                    logger.info(f"Copied static files for {game} game")
-                else:
-                    logger.error(f"Static directory not found for {game} game")
-            else:
-                # Use template rendering for other games
-                template_name = template_map.get(game, f'{game}.html')
-                with app.test_request_context():
-                    game_html = render_template(template_name)
-                    with open(os.path.join(game_dir, 'index.html'), 'w', encoding='utf-8') as f:
-                        f.write(game_html)
-                    logger.info(f"Generated {game} game page")
-        except Exception as e:
-            logger.error(f"Error generating {game} game page: {e}")
-            # If template generation fails, try to copy from static directory
-            try:
-                static_game_dir = os.path.join('app', 'static', 'games', game)
-                if os.path.exists(static_game_dir):
-                    shutil.copytree(static_game_dir, game_dir, dirs_exist_ok=True)
-                    logger.info(f"Copied static files for {game} game")
-            except Exception as copy_error:
-                logger.error(f"Error copying static files for {game} game: {copy_error}")
-    
-    logger.info("Static files generated successfully")
-
-def update_static_paths(html_file):
-    """Update static file paths in HTML files to be relative."""
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Update image paths from GitHub URLs to local paths
-    content = re.sub(
-        r'src="https://github\.com/lizsurette/lizsurette\.github\.io/raw/main/static/img/_posts/([^"]+)"',
-        r'src="../../static/img/_posts/\1"',
-        content
-    )
-    
-    # Update image paths from absolute paths to relative paths
-    content = re.sub(
-        r'src="/static/img/_posts/([^"]+)"',
-        r'src="../../static/img/_posts/\1"',
-        content
-    )
-    
-    # Update navigation links to be relative
-    content = re.sub(r'href="/', 'href="../../', content)
-    
-    # Update home link to be relative
-    content = re.sub(r'href="([^"]*)" class="active">About Me</a>', r'href="../../" class="active">About Me</a>', content)
-    
-    # Update game links to point to the root directory
-    content = re.sub(r'href="/games/([^"]+)"', r'href="/\1"', content)
-    
-    # Remove any remaining absolute paths that start with /
-    content = re.sub(r'(href|src)="/', r'\1="../../', content)
+    Returns:
+        List of URLs that failed to build
+    """
+    logger.info("Generating static files...")
     
-    # Remove trailing slashes from URLs
-    content = re.sub(r'(href|src)="([^"]+)/"', r'\1="\2"', content)
-    
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    logger.info(f"Updated static paths in {html_file}")
-
-def slugify(text):
-    """Convert text to a URL-friendly slug."""
-    # Convert to lowercase
-    text = text.lower()
-    # Replace spaces with hyphens
-    text = re.sub(r'[\s]+', '-', text)
-    # Remove special characters
-    text = re.sub(r'[^\w\-]', '', text)
-    # Remove consecutive hyphens
-    text = re.sub(r'-+', '-', text)
-    # Remove leading/trailing hyphens
-    text = text.strip('-')
-    return text
-
-def update_index_paths(file_path):
-    """Update paths in index.html to be relative to root."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Update static file paths
-    content = content.replace('href="/static/', 'href="static/')
-    content = content.replace('src="/static/', 'src="static/')
-
-    # Update navigation links
-    content = content.replace('href="/"', 'href="./"')
-    content = content.replace('href="/writings/"', 'href="writings/"')
-    content = content.replace('href="/games/"', 'href="games/"')
-    content = content.replace('href="/projects/"', 'href="projects/"')
-    content = content.replace('href="/apps/"', 'href="apps/"')
-
-    # Update game links to point to the root directory
-    content = re.sub(r'href="/games/([^"]+)"', r'href="\1"', content)
-
-    # Update post links to use directory structure
-    content = re.sub(
-        r'href="/posts/([^"]+)\.html"',
-        lambda m: f'href="posts/{m.group(1)}"',
-        content
-    )
+    post_service = get_post_service()
+    freezer = get_freezer(create_app())
+    images = build_image_derivatives(workers)
+    manifest = get_build_manifest(relative_links, images)
     
-    # Remove trailing slashes from URLs
-    content = content.replace('/">', '">')
+    posts = post_service.get_all_posts()
+    register_url_generators(freezer, post_service)
+    pages = freezer.pages()
+    stale = find_stale_pages(freezer, manifest, pages)
+    if workers <= 1:
+        # Render the markdown of the stale posts in one batch before building their pages
+        stale_paths = {page.output_path for page in stale}
+        render_posts(post_service, [
+            post for post in posts
+            if freezer.output_path(freezer.url_for('main.post', post_path=post.path)) in stale_paths
+        ])
+    failed = build_pages(freezer, manifest, stale, relative_links, workers, images)
+    pages_written, pages_unchanged, pages_kept = manifest.written, manifest.unchanged, manifest.kept
+    assets_written = publish_assets(manifest, images)
+    
+    removed = manifest.remove_orphans('_site')
+    manifest.save()
+    
+    logger.info(f"Pages: {pages_written} written, {pages_unchanged} rendered without changes, "
+                f"{pages_kept} kept from the previous build; {assets_written} assets written; "
+                f"{removed} files removed")
+    if failed:
+        logger.error(f"{len(failed)} pages failed to build")
+    else:
+        logger.info("Static files generated successfully")
+    return failed
 
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+def precompress_site(workers=1):
+    """Write a gzip-compressed copy next to every compressible file of _site.
+    
+    Servers that look for precompressed files, like dev_server.py, send
+    the .gz file to clients accepting gzip. Only files that changed since
+    the previous build are compressed, with several processes if there
+    are several workers.
+    
+    Args:
+        workers: Number of processes compressing files
+        
+    Returns:
+        CompressionStats per asset class
+    """
+    start = time.perf_counter()
+    report = precompress_tree('_site', workers)
+    size = sum(stats.size for stats in report.values())
+    compressed = sum(stats.compressed for stats in report.values())
+    written = sum(stats.written for stats in report.values())
+    logger.info(f"Compressed {written} files in {(time.perf_counter() - start) * 1000:.1f} ms; "
+                f"gzip saves {size - compressed} of {size} bytes "
+                f"({(size - compressed) / size * 100 if size else 0:.1f}%)")
+    for asset_class, stats in report.items():
+        logger.info(f"  {asset_class}: {stats.files} files, {stats.size} -> {stats.compressed} bytes "
+                    f"({(stats.size - stats.compressed) / stats.size * 100 if stats.size else 0:.1f}% saved)")
+    return report
 
-    logging.info(f"Updated static paths in {file_path}")
+def rewrite_paths(content, output_path):
+    """Rewrite the links of a page relative to where it is written.
+    
+    Args:
+        content: The page's HTML
+        output_path: The file the page is written to, inside _site
+        
+    Returns:
+        The HTML with relative links
+    """
+    directory = os.path.dirname(output_path)
+    if directory == '_site':
+        return rewrite_index_paths(content)
+    # Pages nested deeper than posts/<name>/ need a longer way back to the root
+    depth = len(os.path.relpath(directory, '_site').split(os.sep))
+    return rewrite_static_paths(content, '../' * max(2, depth))
+
+def rewrite_static_paths(content, root='../../'):
+    """Update static file paths in a page to be relative.
+    
+    Every href, src and data-index attribute is rewritten in a single
+    pass over the page: post images linked on GitHub are served locally,
+    the active home link and absolute paths are made relative to the root,
+    and trailing slashes are removed.
+    
+    Args:
+        content: The page's HTML
+        root: Relative path from the page's directory to the site root
+        
+    Returns:
+        The HTML with relative paths
+    """
+    def rewrite(match):
+        attribute, value, close = match.groups()
+        if close:
+            if attribute == 'href' and content.startswith(ACTIVE_HOME_LINK, match.end()):
+                # Update home link to be relative
+                value = root
+            elif (attribute == 'src' and value.startswith(GITHUB_POST_IMAGES)
+                    and len(value) > len(GITHUB_POST_IMAGES)):
+                # Update image paths from GitHub URLs to local paths
+                value = root + 'static/img/_posts/' + value[len(GITHUB_POST_IMAGES):]
+        if value.startswith('/'):
+            # Make absolute paths relative to the root
+            value = root + value[1:]
+        if close and len(value) > 1 and value.endswith('/'):
+            # Remove trailing slashes from URLs
+            value = value[:-1]
+        return f'{attribute}="{value}{close}'
+    
+    return LINK_PATTERN.sub(rewrite, content)
+
+def rewrite_index_paths(content):
+    """Update paths in the root index.html to be relative to root.
+    
+    Absolute href and src values are rewritten in a single pass over the
+    page.
+    """
+    def rewrite(match):
+        attribute, value, close = match.groups()
+        if value.startswith('/static/'):
+            # Update static file paths
+            value = value[1:]
+        elif attribute == 'href' and close:
+            if value in INDEX_SECTION_LINKS:
+                # Update navigation links
+                value = INDEX_SECTION_LINKS[value]
+            elif value.startswith('/games/'):
+                # Update game links to point to the root directory
+                value = value[len('/games/'):]
+            elif value.startswith('/posts/') and value.endswith('.html') and len(value) > len('/posts/.html'):
+                # Update post links to use directory structure
+                value = value[1:-len('.html')]
+        return f'{attribute}="{value}{close}'
+    
+    content = INDEX_LINK_PATTERN.sub(rewrite, content)
+    
+    # Remove trailing slashes from URLs
+    return content.replace('/">', '">')
 
 if __name__ == '__main__':
-    logger.info("Starting static site generation...")
+    parser = argparse.ArgumentParser(description='Build the static site into _site.')
+    parser.add_argument('--clean', action='store_true',
+                        help='remove _site first and render every page again')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='render pages in this many processes (0: one per CPU)')
+    args = parser.parse_args()
     
-    # Clean and prepare _site directory
-    clean_site_directory()
-    copy_static_assets()
+    logger.info("Starting static site generation...")
     
-    # Generate static files
-    generate_static_files()
+    # Prepare the _site directory; pages from the previous build are reused unless --clean
+    if args.clean or not os.path.exists('_site'):
+        clean_site_directory()
+    copy_static_assets(relative_links=True)
     
-    # Update paths in generated files
-    for root, dirs, files in os.walk('_site'):
-        for file in files:
-            if file.endswith('.html'):
-                file_path = os.path.join(root, file)
-                if file == 'index.html' and root == '_site':
-                    update_index_paths(file_path)
-                else:
-                    update_static_paths(file_path)
+    # Generate static files with links relative to each page
+    workers = args.jobs or os.cpu_count() or 1
+    if generate_static_files(relative_links=True, workers=workers):
+        sys.exit(1)
+    precompress_site(workers)
     
-    logger.info("Static site generation completed successfully!") 
\ No newline at end of file
+    logger.info("Static site generation completed successfully!")
@@ -2,13 +2,20 @@
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 import sys
 import os
+from app.utils.compress import accepts_gzip, is_compressible
 
 class NoCacheHandler(SimpleHTTPRequestHandler):
+    # Set for files that have a precompressed copy, plain or not
+    vary_encoding = False
+    
     def end_headers(self):
         # Add cache-control headers to prevent caching
         self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate, max-age=0')
         self.send_header('Pragma', 'no-cache')
         self.send_header('Expires', '0')
+        if self.vary_encoding:
+            # Caches must not hand the gzip copy to clients that did not ask for it
+            self.send_header('Vary', 'Accept-Encoding')
         super().end_headers()
     
     def do_GET(self):
@@ -18,12 +25,26 @@ class NoCacheHandler(SimpleHTTPRequestHandler):
         # Check if the file exists
         file_path = self.translate_path(self.path)
         if os.path.exists(file_path) and os.path.isfile(file_path):
+            # Serve the precompressed copy written by build_static.py if the client takes gzip
+            self.vary_encoding = is_compressible(file_path) and os.path.isfile(file_path + '.gz')
+            if self.vary_encoding and accepts_gzip(self.headers.get('Accept-Encoding')):
+                return self.send_gzip(file_path)
             # File exists, serve it
             return SimpleHTTPRequestHandler.do_GET(self)
         else:
             # File doesn't exist, return 404
             self.send_error(404, "File not found")
             return
+    
+    def send_gzip(self, file_path):
+        with open(file_path + '.gz', 'rb') as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(file_path))
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
 if __name__ == '__main__':
     port = 8000
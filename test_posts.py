@@ -1,19 +1,12 @@
-from flask import Flask
-from flask_flatpages import FlatPages
-import os
+from app.services.service_factory import ServiceFactory
 
-# Get the absolute path to the app directory
-app_dir = os.path.abspath(os.path.dirname(__file__))
-
-app = Flask(__name__)
-app.config['FLATPAGES_AUTO_RELOAD'] = True
-app.config['FLATPAGES_EXTENSION'] = '.md'
-app.config['FLATPAGES_ROOT'] = os.path.join(app_dir, 'app', 'posts')
-pages = FlatPages(app)
+# The shared corpus loader, used like a FlatPages instance
+post_service = ServiceFactory.get_post_service()
+pages = post_service.repository
 
 # Print the posts directory path
-print(f"Posts directory: {app.config['FLATPAGES_ROOT']}")
-print(f"Directory exists: {os.path.exists(app.config['FLATPAGES_ROOT'])}")
+print(f"Posts directory: {post_service.posts_dir}")
+print(f"Directory exists: {post_service.posts_dir.exists()}")
 
 # Get all posts
 posts = [p for p in pages]
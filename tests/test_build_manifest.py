@@ -0,0 +1,93 @@
+import json
+
+from jinja2 import DictLoader, Environment
+
+from app.utils.build_manifest import BuildManifest, hash_inputs, write_output
+
+def build(tmp_path, outputs, salt=''):
+    """Run one build that writes the given {name: (inputs, content)} outputs."""
+    manifest = BuildManifest(str(tmp_path / 'manifest.json'), salt)
+    rendered = []
+    for name, (inputs, content) in outputs.items():
+        path = str(tmp_path / 'site' / name)
+        if manifest.is_fresh(path, inputs):
+            manifest.keep(path)
+        else:
+            rendered.append(name)
+            manifest.write(path, inputs, content)
+    manifest.remove_orphans(str(tmp_path / 'site'))
+    manifest.save()
+    return manifest, rendered
+
+def test_hash_inputs_is_stable():
+    assert hash_inputs({'b': 1, 'a': 2}, 'x') == hash_inputs({'a': 2, 'b': 1}, 'x')
+    assert hash_inputs('x', 1) != hash_inputs('x', 2)
+
+def test_unchanged_outputs_are_kept(tmp_path):
+    outputs = {'index.html': ('i1', 'Home'), 'posts/a/index.html': ('a1', 'A')}
+    _, rendered = build(tmp_path, outputs)
+    assert rendered == ['index.html', 'posts/a/index.html']
+
+    manifest, rendered = build(tmp_path, outputs)
+    assert rendered == []
+    assert manifest.kept == 2
+
+def test_changed_inputs_and_missing_files_are_rebuilt(tmp_path):
+    build(tmp_path, {'index.html': ('i1', 'Home'), 'about.html': ('b1', 'About')})
+    (tmp_path / 'site' / 'about.html').unlink()
+    manifest, rendered = build(tmp_path, {'index.html': ('i2', 'Home'), 'about.html': ('b1', 'About')})
+    assert rendered == ['index.html', 'about.html']
+    # The index came out the same, so its file was not written again
+    assert (manifest.written, manifest.unchanged) == (1, 1)
+
+def test_edited_output_files_are_rebuilt(tmp_path):
+    build(tmp_path, {'index.html': ('i1', 'Home')})
+    (tmp_path / 'site' / 'index.html').write_text('Edited by hand')
+    _, rendered = build(tmp_path, {'index.html': ('i1', 'Home')})
+    assert rendered == ['index.html']
+    assert (tmp_path / 'site' / 'index.html').read_text() == 'Home'
+
+def test_a_new_salt_rebuilds_everything(tmp_path):
+    outputs = {'index.html': ('i1', 'Home')}
+    build(tmp_path, outputs, salt='v1')
+    manifest, rendered = build(tmp_path, outputs, salt='v2')
+    assert rendered == ['index.html']
+    assert manifest.unchanged == 1
+
+def test_other_manifest_versions_are_ignored(tmp_path):
+    build(tmp_path, {'index.html': ('i1', 'Home')})
+    manifest_path = tmp_path / 'manifest.json'
+    data = json.loads(manifest_path.read_text())
+    manifest_path.write_text(json.dumps(dict(data, version=0)))
+    _, rendered = build(tmp_path, {'index.html': ('i1', 'Home')})
+    assert rendered == ['index.html']
+
+def test_kept_stale_outputs_are_rebuilt_next_time(tmp_path):
+    build(tmp_path, {'index.html': ('i1', 'Home')})
+    manifest = BuildManifest(str(tmp_path / 'manifest.json'))
+    manifest.keep(str(tmp_path / 'site' / 'index.html'), stale=True)
+    manifest.save()
+    _, rendered = build(tmp_path, {'index.html': ('i1', 'Home')})
+    assert rendered == ['index.html']
+
+def test_orphans_are_removed_with_empty_directories(tmp_path):
+    build(tmp_path, {'index.html': ('i1', 'Home'), 'posts/old/index.html': ('o1', 'Old')})
+    build(tmp_path, {'index.html': ('i1', 'Home')})
+    assert not (tmp_path / 'site' / 'posts').exists()
+    assert (tmp_path / 'site' / 'index.html').exists()
+
+def test_write_output_skips_identical_contents(tmp_path):
+    path = str(tmp_path / 'out' / 'page.html')
+    digest, size, written = write_output(path, 'Hello')
+    assert (size, written) == (5, True)
+    assert write_output(path, 'Hello', digest)[2] is False
+    assert write_output(path, b'Bye', digest)[2] is True
+
+def test_template_hash_follows_dependencies():
+    templates = {'base.html': 'base {% block body %}{% endblock %}',
+                 'page.html': '{% extends "base.html" %}{% block body %}{% include "part.html" %}{% endblock %}',
+                 'part.html': 'part'}
+    before = BuildManifest('does-not-exist.json').template_hash(Environment(loader=DictLoader(templates)), 'page.html')
+    templates['part.html'] = 'changed part'
+    after = BuildManifest('does-not-exist.json').template_hash(Environment(loader=DictLoader(templates)), 'page.html')
+    assert before != after
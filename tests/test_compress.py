@@ -0,0 +1,124 @@
+import functools
+import gzip
+import http.client
+import os
+import threading
+from http.server import HTTPServer
+
+import pytest
+
+from app.services.config_service import ConfigService
+from app.services.static_service import StaticService
+from app.utils.compress import MIN_SIZE, accepts_gzip, precompress_tree
+from dev_server import NoCacheHandler
+
+CSS = b'body { margin: 0; padding: 0; }\n' * 40
+
+def test_accepts_gzip():
+    assert accepts_gzip('gzip, deflate, br')
+    assert accepts_gzip('br;q=1.0, GZIP;q=0.5')
+    assert accepts_gzip('*')
+    assert accepts_gzip('x-gzip')
+    assert not accepts_gzip(None)
+    assert not accepts_gzip('')
+    assert not accepts_gzip('deflate, br')
+    assert not accepts_gzip('gzip;q=0')
+    assert not accepts_gzip('gzip;q=nonsense')
+
+@pytest.fixture
+def site(tmp_path):
+    (tmp_path / 'css').mkdir()
+    (tmp_path / 'css' / 'style.css').write_bytes(CSS)
+    (tmp_path / 'tiny.js').write_bytes(b'x()')
+    (tmp_path / 'logo.png').write_bytes(b'\x89PNG' * 200)
+    return tmp_path
+
+def test_precompress_tree_writes_siblings_for_files_that_shrink(site):
+    report = precompress_tree(str(site))
+    assert gzip.decompress((site / 'css' / 'style.css.gz').read_bytes()) == CSS
+    # Below MIN_SIZE a file gains nothing, and images are compressed already
+    assert not (site / 'tiny.js.gz').exists()
+    assert not (site / 'logo.png.gz').exists()
+    assert report['css'].written == 1
+    assert report['css'].compressed < report['css'].size
+    assert report['js'].compressed == report['js'].size == 3
+
+def test_precompress_tree_only_compresses_changed_files(site):
+    precompress_tree(str(site))
+    assert precompress_tree(str(site))['css'].written == 0
+
+    style = site / 'css' / 'style.css'
+    style.write_bytes(CSS + b'a { color: red; }\n')
+    st = style.stat()
+    os.utime(style, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert precompress_tree(str(site))['css'].written == 1
+    assert gzip.decompress((site / 'css' / 'style.css.gz').read_bytes()).endswith(b'red; }\n')
+
+def test_precompress_tree_removes_stale_siblings(site):
+    precompress_tree(str(site))
+    (site / 'css' / 'style.css').unlink()
+    # Random bytes do not shrink, so an old sibling goes
+    (site / 'data.json').write_bytes(os.urandom(MIN_SIZE * 4))
+    (site / 'data.json.gz').write_bytes(b'old')
+    precompress_tree(str(site))
+    assert not (site / 'css' / 'style.css.gz').exists()
+    assert not (site / 'data.json.gz').exists()
+
+@pytest.fixture
+def server(site):
+    precompress_tree(str(site))
+    httpd = HTTPServer(('127.0.0.1', 0), functools.partial(NoCacheHandler, directory=str(site)))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address
+    httpd.shutdown()
+    httpd.server_close()
+
+def get(address, path, accept_encoding=None):
+    connection = http.client.HTTPConnection(*address)
+    headers = {'Accept-Encoding': accept_encoding} if accept_encoding else {}
+    connection.request('GET', path, headers=headers)
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+def test_dev_server_serves_the_gzip_copy_to_clients_that_accept_it(server):
+    response, body = get(server, '/css/style.css', 'gzip, deflate')
+    assert response.getheader('Content-Encoding') == 'gzip'
+    assert response.getheader('Vary') == 'Accept-Encoding'
+    assert response.getheader('Content-Type') == 'text/css'
+    assert gzip.decompress(body) == CSS
+
+def test_dev_server_serves_the_plain_file_otherwise(server):
+    for accept_encoding in (None, 'gzip;q=0', 'br'):
+        response, body = get(server, '/css/style.css', accept_encoding)
+        assert response.getheader('Content-Encoding') is None
+        assert response.getheader('Vary') == 'Accept-Encoding'
+        assert body == CSS
+
+def test_dev_server_does_not_vary_files_without_a_gzip_copy(server):
+    response, body = get(server, '/tiny.js', 'gzip')
+    assert response.getheader('Content-Encoding') is None
+    assert response.getheader('Vary') is None
+    assert body == b'x()'
+
+def make_static_service(static_dir):
+    config = ConfigService('does-not-exist.yml')
+    config.config['static'].update(dir=str(static_dir), bundles={})
+    return StaticService(config)
+
+def test_compressed_asset_keeps_only_the_current_fingerprint(site):
+    service = make_static_service(site)
+    first = service.compressed_asset('css/style.css')
+    assert gzip.decompress(first) == CSS
+    assert service.compressed_asset('css/style.css') is first
+    assert service.compressed_asset('tiny.js') is None
+
+    style = site / 'css' / 'style.css'
+    style.write_bytes(CSS * 2)
+    st = style.stat()
+    os.utime(style, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert gzip.decompress(service.compressed_asset('css/style.css')) == CSS * 2
+    assert list(service._compressed) == ['css/style.css', 'tiny.js']
+    assert service._compressed['css/style.css'][0] == service.asset_name('css/style.css')
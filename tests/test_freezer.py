@@ -0,0 +1,116 @@
+import os
+
+import pytest
+from flask import Flask, redirect, render_template, url_for
+from jinja2 import DictLoader
+
+from app.utils.freezer import Freezer
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.jinja_loader = DictLoader({
+        'base.html': '<link href="{{ url_for(\'static\', filename=\'css/site.css\') }}">{% block body %}{% endblock %}',
+        'page.html': '{% extends "base.html" %}{% block body %}{{ name }}{% endblock %}',
+    })
+
+    @app.route('/')
+    def index():
+        return render_template('page.html', name='home')
+
+    @app.route('/games')
+    @app.route('/games/')
+    def games():
+        return 'games'
+
+    @app.route('/feed.xml')
+    def feed():
+        return app.response_class('<feed/>', mimetype='application/xml')
+
+    @app.route('/posts/<name>/')
+    def post(name):
+        return render_template('page.html', name=name)
+
+    @app.route('/tags/<tag>/')
+    def tag(tag):
+        return tag
+
+    @app.route('/old/')
+    def old():
+        return redirect(url_for('games'), code=301)
+
+    @app.route('/contact', methods=['POST'])
+    def contact():
+        return 'sent'
+
+    @app.route('/search/')
+    def search():
+        return 'search'
+
+    return app
+
+@pytest.fixture
+def freezer(app, tmp_path):
+    freezer = Freezer(app, str(tmp_path), skip_endpoints={'static', 'search'})
+    freezer.register_generator('post')(lambda: [({'name': 'b'}, {'v': 2}), ({'name': 'a'}, {'v': 1})])
+    return freezer
+
+def relative(freezer, page):
+    return os.path.relpath(page.output_path, freezer.output_dir).replace(os.sep, '/')
+
+def test_pages_come_from_the_url_map(freezer):
+    pages = [(page.url, relative(freezer, page), page.data) for page in freezer.pages()]
+    # Generated pages come first, in the order their generator yields them
+    assert pages[:2] == [('/posts/b/', 'posts/b/index.html', {'v': 2}),
+                         ('/posts/a/', 'posts/a/index.html', {'v': 1})]
+    assert sorted(pages[2:]) == [
+        ('/', 'index.html', None),
+        ('/feed.xml', 'feed.xml', None),
+        ('/games/', 'games/index.html', None),
+        ('/old/', 'old/index.html', None),
+    ]
+
+def test_routes_with_arguments_need_a_generator(freezer, caplog):
+    urls = [page.url for page in freezer.pages()]
+    assert not any(url.startswith('/tags/') for url in urls)
+    assert 'no URL generator for tag' in caplog.text
+
+def test_skipped_and_non_get_endpoints_are_not_frozen(freezer):
+    urls = [page.url for page in freezer.pages()]
+    assert '/search/' not in urls
+    assert '/contact' not in urls
+
+def test_urls_with_and_without_a_slash_are_frozen_once(freezer):
+    outputs = [relative(freezer, page) for page in freezer.pages()]
+    assert outputs.count('games/index.html') == 1
+    assert freezer.output_path('/games') == freezer.output_path('/games/')
+
+def test_output_paths(freezer):
+    assert relative(freezer, freezer.pages()[0]) == 'posts/b/index.html'
+    assert freezer.output_path('/') == os.path.join(freezer.output_dir, 'index.html')
+    assert freezer.output_path('/a%20b/') == os.path.join(freezer.output_dir, 'a b', 'index.html')
+    assert freezer.output_path('/search/index/manifest.json') == \
+        os.path.join(freezer.output_dir, 'search', 'index', 'manifest.json')
+
+def test_dispatch_records_templates_and_static_files(freezer):
+    response = freezer.dispatch('/posts/a/')
+    assert response.status == 200
+    assert response.mimetype == 'text/html'
+    assert response.body == b'<link href="/static/css/site.css">a'
+    # Templates pulled in by extends are followed by BuildManifest.template_hash
+    assert response.templates == ['page.html']
+    assert response.static_files == ['css/site.css']
+
+    feed = freezer.dispatch('/feed.xml')
+    assert (feed.mimetype, feed.templates, feed.static_files) == ('application/xml', [], [])
+
+def test_dispatch_reports_redirects(freezer):
+    response = freezer.dispatch('/old/')
+    assert response.status == 301
+    assert response.location.endswith('/games/')
+    assert response.body != b'games'
+
+def test_freezer_must_come_before_the_jinja_environment(app):
+    app.jinja_env
+    with pytest.raises(RuntimeError):
+        Freezer(app)
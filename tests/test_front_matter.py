@@ -0,0 +1,45 @@
+from app.services.config_service import ConfigService
+from app.services.markdown_service import MarkdownService
+from app.utils.front_matter import read_front_matter
+
+def write(tmp_path, text):
+    path = tmp_path / 'post.md'
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+def test_splits_header_and_body(tmp_path):
+    path = write(tmp_path, '---\ntitle: Hello\n---\n\nBody\n')
+    parts = read_front_matter(path, with_body=True)
+    assert parts.preamble == ''
+    assert parts.header == 'title: Hello\n'
+    assert parts.body == '\nBody\n'
+
+def test_body_is_not_read_by_default(tmp_path):
+    path = write(tmp_path, '---\ntitle: Hello\n---\nBody\n')
+    assert read_front_matter(path).body is None
+
+def test_dashes_inside_a_value_stay_in_the_header(tmp_path):
+    path = write(tmp_path, '---\ntitle: a---b\ndate: 2024-01-02\n---\nBody with --- dashes\n')
+    parts = read_front_matter(path, with_body=True)
+    assert parts.header == 'title: a---b\ndate: 2024-01-02\n'
+    assert parts.body == 'Body with --- dashes\n'
+
+def test_delimiters_may_have_trailing_whitespace_and_crlf(tmp_path):
+    path = tmp_path / 'post.md'
+    path.write_bytes(b'---  \r\ntitle: Hello\r\n--- \r\nBody\r\n')
+    parts = read_front_matter(str(path), with_body=True)
+    assert parts.header == 'title: Hello\n'
+    assert parts.body == 'Body\n'
+
+def test_missing_closing_delimiter(tmp_path):
+    assert read_front_matter(write(tmp_path, '---\ntitle: Hello\nBody\n')) is None
+    assert read_front_matter(write(tmp_path, 'title: a---b\n')) is None
+
+def test_get_metadata_keeps_values_with_dashes(tmp_path):
+    markdown = MarkdownService(ConfigService('does-not-exist.yml'))
+    path = write(tmp_path, '---\ntitle: a---b\ntags: [x, y]\n---\nBody\n')
+    assert markdown.get_metadata(path) == {'title': 'a---b', 'tags': ['x', 'y']}
+
+def test_get_metadata_requires_front_matter_first(tmp_path):
+    markdown = MarkdownService(ConfigService('does-not-exist.yml'))
+    assert markdown.get_metadata(write(tmp_path, 'Intro\n---\ntitle: Hello\n---\n')) == {}
@@ -0,0 +1,103 @@
+import os
+
+import pytest
+
+from app.utils.images import DerivativeCache, add_srcset, derivative_name, encode_derivatives
+
+COPIES = {'img/photo.png': [(480, 'img/photo-480w.1a2b3c4d5e.png'), (960, 'img/photo.png')]}
+
+SIZES = '100vw'
+
+def test_add_srcset_lists_the_copies_next_to_the_image():
+    html = '<p><img src="../../static/img/photo.png" alt="A photo"></p>'
+    assert add_srcset(html, COPIES, SIZES) == (
+        '<p><img src="../../static/img/photo.png" srcset="../../static/img/photo-480w.1a2b3c4d5e.png 480w, '
+        '../../static/img/photo.png 960w" sizes="100vw" alt="A photo"></p>')
+
+def test_add_srcset_takes_sizes_from_the_width_attribute():
+    html = '<img width="300" src="/static/img/photo.png?v=1">'
+    assert add_srcset(html, COPIES, SIZES) == (
+        '<img width="300" src="/static/img/photo.png?v=1" srcset="/static/img/photo-480w.1a2b3c4d5e.png 480w, '
+        '/static/img/photo.png 960w" sizes="(max-width: 300px) 100vw, 300px">')
+
+def test_add_srcset_leaves_other_images_alone():
+    untouched = [
+        '<img src="/static/img/other.png">',
+        '<img src="/static/img/photo.png" srcset="mine.png 1x">',
+        '<img src="/mystatic/img/photo.png">',
+        '<img alt="no src">',
+        # Only local files have copies
+        '<img src="https://github.com/owner/repo/raw/main/static/img/photo.png">',
+        '<img src="//cdn.example.com/static/img/photo.png">',
+    ]
+    for html in untouched:
+        assert add_srcset(html, COPIES, SIZES) == html
+    assert add_srcset('<p>No images</p>', COPIES, SIZES) == '<p>No images</p>'
+
+def test_derivative_name():
+    assert derivative_name('img/a.b.png', 480, 'f' * 64) == 'img/a.b-480w.ffffffffff.png'
+
+def fake_copies(cache, key, widths):
+    os.makedirs(cache.cache_dir, exist_ok=True)
+    for width in widths:
+        with open(cache.path(key, width), 'wb') as f:
+            f.write(b'copy')
+    cache.put(key, {'width': 800, 'height': 600, 'widths': list(widths)})
+
+def test_cache_entries_are_reused_across_builds(tmp_path):
+    cache = DerivativeCache(str(tmp_path))
+    assert cache.get('key1') is None
+    fake_copies(cache, 'key1', [200, 400])
+    cache.save()
+
+    reloaded = DerivativeCache(str(tmp_path))
+    assert reloaded.get('key1') == {'width': 800, 'height': 600, 'widths': [200, 400]}
+    # A missing copy means the image is encoded again
+    os.unlink(reloaded.path('key1', 400))
+    assert reloaded.get('key1') is None
+
+def test_prune_removes_unused_keys_and_their_files(tmp_path):
+    cache = DerivativeCache(str(tmp_path))
+    fake_copies(cache, 'keep', [200])
+    fake_copies(cache, 'drop', [200, 400])
+    cache.save()
+
+    assert cache.prune(['keep']) == 2
+    cache.save()
+    assert sorted(os.listdir(tmp_path)) == ['index.json', 'keep-200']
+    reloaded = DerivativeCache(str(tmp_path))
+    assert reloaded.get('drop') is None
+    assert reloaded.get('keep') is not None
+
+def make_image(path, size, image_format):
+    Image = pytest.importorskip('PIL.Image')
+    image = Image.new('RGB', size)
+    # A gradient with noise compresses like a photo rather than a flat colour
+    pixels = image.load()
+    for x in range(size[0]):
+        for y in range(size[1]):
+            pixels[x, y] = (x % 256, y % 256, (x * y) % 256)
+    image.save(path, image_format, quality=100)
+    return path
+
+def test_encode_derivatives_resizes_without_enlarging(tmp_path):
+    Image = pytest.importorskip('PIL.Image')
+    source = make_image(str(tmp_path / 'photo.jpg'), (400, 200), 'JPEG')
+    output = tmp_path / 'cache'
+    entry = encode_derivatives(source, [100, 200, 800], 80, str(output), 'key')
+    assert (entry['width'], entry['height']) == (400, 200)
+    # No 800 copy; the 400 one is a re-encode at the original width
+    assert entry['widths'] == [100, 200, 400]
+    for width in entry['widths']:
+        with Image.open(output / f'key-{width}') as copy:
+            assert copy.size == (width, width // 2)
+        assert os.path.getsize(output / f'key-{width}') < os.path.getsize(source)
+
+def test_encode_derivatives_drops_copies_that_do_not_shrink(tmp_path):
+    Image = pytest.importorskip('PIL.Image')
+    source = str(tmp_path / 'noise.png')
+    Image.frombytes('RGB', (64, 64), os.urandom(64 * 64 * 3)).save(source, 'PNG', optimize=True)
+    # Only a re-encode at the original width is tried, and it saves nothing
+    entry = encode_derivatives(source, [128], 80, str(tmp_path / 'cache'), 'key')
+    assert entry == {'width': 64, 'height': 64, 'widths': []}
+    assert os.listdir(tmp_path / 'cache') == []
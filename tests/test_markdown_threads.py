@@ -0,0 +1,56 @@
+import random
+import threading
+from pathlib import Path
+
+from app.models.post import Post
+from app.services.config_service import ConfigService
+from app.services.markdown_service import MarkdownService
+
+POSTS_DIR = Path(__file__).resolve().parents[1] / 'app' / 'posts'
+THREADS = 16
+ROUNDS = 2
+
+def make_service():
+    config = ConfigService('does-not-exist.yml')
+    # Bypass the render cache so every call really runs the converter
+    config.config['markdown']['cache']['enabled'] = False
+    return MarkdownService(config)
+
+def corpus():
+    sources = [Post.from_file(str(path)).content for path in sorted(POSTS_DIR.glob('*.markdown'))]
+    assert sources
+    return sources
+
+def test_threaded_renders_match_serial_output():
+    sources = corpus()
+    expected = [make_service()._render_markdown(source) for source in sources]
+
+    service = make_service()
+    barrier = threading.Barrier(THREADS)
+    mismatches = []
+
+    def worker(seed):
+        order = list(range(len(sources)))
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(ROUNDS):
+            rng.shuffle(order)
+            for i in order:
+                if service._render_markdown(sources[i]) != expected[i]:
+                    mismatches.append(i)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert mismatches == []
+
+def test_render_many_threads_match_serial_output():
+    sources = corpus() * 4
+    service = make_service()
+    serial = [result.html for result in service.render_many(sources, mode='serial')]
+    threaded = list(service.render_many(sources, mode='thread', workers=8))
+    assert [result.index for result in threaded] == list(range(len(sources)))
+    assert all(result.error is None for result in threaded)
+    assert [result.html for result in threaded] == serial
@@ -0,0 +1,38 @@
+from app.utils.minify import minify_css, minify_js
+
+def test_css_drops_comments_and_whitespace():
+    css = '/* layout */\nbody {\n  margin: 0 ;\n  color: red;\n}\n\na > b ,  c { top: 1px }\n'
+    assert minify_css(css) == 'body{margin:0;color:red}a>b,c{top:1px}'
+
+def test_css_keeps_significant_spaces():
+    assert minify_css('a :hover { width: calc(1px + 2px); }') == 'a :hover{width:calc(1px + 2px)}'
+    assert minify_css('div  p { margin: 0  auto !important; }') == 'div p{margin:0 auto!important}'
+
+def test_css_keeps_strings_and_license_comments():
+    css = '/*! keep me */\n/* Copyright 2024 */\na::before { content: "a  ;}  /* b */"; }'
+    assert minify_css(css) == '/*! keep me */\n/* Copyright 2024 */\na::before{content:"a  ;}  /* b */"}'
+
+def test_js_drops_comments_and_indentation_but_keeps_lines():
+    js = 'function f(a, b) {\n    // add them\n    return a + b; /* done */\n}\n\n\nf(1, 2)\n'
+    assert minify_js(js) == 'function f(a,b){\nreturn a+b;\n}\nf(1,2)\n'
+
+def test_js_keeps_tokens_apart():
+    assert minify_js('a + +b') == 'a+ +b\n'
+    assert minify_js('a - -b') == 'a- -b\n'
+    assert minify_js('x = 1 .toString()') == 'x=1 .toString()\n'
+    assert minify_js('var  x = typeof  y') == 'var x=typeof y\n'
+
+def test_js_keeps_strings_templates_and_regexes():
+    js = "s = 'a  // b' + \"c /* d */\" + `e  ${f}\n  g`\nr = s.replace(/[/\\]]+  x/g, '')\n"
+    assert minify_js(js) == "s='a  // b'+\"c /* d */\"+`e  ${f}\n  g`\nr=s.replace(/[/\\]]+  x/g,'')\n"
+
+def test_js_tells_division_from_regexes():
+    assert minify_js('x = a / b / c') == 'x=a/b/c\n'
+    assert minify_js('return /a b/.test(s)') == 'return /a b/.test(s)\n'
+
+def test_js_block_comments_across_lines_still_end_the_line():
+    assert minify_js('a = 1 /* one\n two */ b = 2') == 'a=1\nb=2\n'
+
+def test_js_keeps_license_comments():
+    js = '/*! lib v1 | MIT License */\nvar a = 1\n'
+    assert minify_js(js) == '/*! lib v1 | MIT License */\nvar a=1\n'
@@ -0,0 +1,74 @@
+from datetime import datetime
+
+from app.models.post import Post
+from app.repositories.post_index import PostIndex, normalize_term
+
+def make_post(path, day, categories=(), tags=()):
+    return Post(path=path, title=path.title(), date=datetime(2024, 1, day),
+                categories=list(categories), tags=list(tags))
+
+def make_index():
+    return PostIndex([
+        make_post('second', 2, ['Open Hybrid Cloud']),
+        make_post('fourth', 4, ['open-hybrid-cloud', 'UX'], ['design']),
+        make_post('first', 1, ['UX', 'ux']),
+        make_post('third', 3, [], ['Design']),
+    ])
+
+def test_posts_are_sorted_newest_first():
+    index = make_index()
+    assert [post.path for post in index] == ['fourth', 'third', 'second', 'first']
+    assert len(index) == 4
+    assert len(PostIndex()) == 0
+
+def test_lookup_and_neighbours():
+    index = make_index()
+    assert index.get('third').title == 'Third'
+    assert index.get('missing') is None
+    assert index.next_post('third').path == 'fourth'
+    assert index.prev_post('third').path == 'second'
+    assert index.next_post('fourth') is None
+    assert index.prev_post('first') is None
+    assert index.next_post('missing') is None
+
+def test_duplicate_paths_keep_the_newest_post():
+    index = PostIndex([make_post('same', 1), make_post('same', 5), make_post('other', 3)])
+    assert index.get('same').date == datetime(2024, 1, 5)
+    assert index.prev_post('same').path == 'other'
+
+def test_taxonomies_normalize_names():
+    index = make_index()
+    assert normalize_term(' Open Hybrid Cloud ') == 'open-hybrid-cloud'
+    assert [post.path for post in index.categories.posts('open hybrid cloud')] == ['fourth', 'second']
+    assert [post.path for post in index.categories.posts('ux')] == ['fourth', 'first']
+    assert 'Open-Hybrid-Cloud' in index.categories
+    assert 'Missing' not in index.categories
+    assert index.categories.posts('missing') == ()
+    # The first spelling in date order becomes the display name
+    assert index.categories.counts() == {'open-hybrid-cloud': 2, 'UX': 2}
+    assert index.categories.names() == ['UX', 'open-hybrid-cloud']
+    assert index.tags.count('DESIGN') == 2
+
+def test_pages_slice_the_sorted_posts():
+    index = PostIndex(make_post(f'post-{day}', day) for day in range(1, 8))
+    first = index.page(1, 3)
+    assert [post.path for post in first.items] == ['post-7', 'post-6', 'post-5']
+    assert (first.pages, first.total, first.has_prev, first.next_num) == (3, 7, False, 2)
+    last = index.page(3, 3)
+    assert [post.path for post in last.items] == ['post-1']
+    assert (last.prev_num, last.has_next, last.next_num) == (2, False, None)
+    assert index.page(4, 3) is None
+    assert index.page(0, 3) is None
+
+def test_page_one_always_exists():
+    empty = PostIndex().page(1, 10)
+    assert empty.items == () and empty.pages == 1 and not empty.has_next
+    assert PostIndex().page(2, 10) is None
+
+def test_category_pages_follow_the_postings():
+    index = make_index()
+    page = index.categories.page('UX', 2, 1)
+    assert [post.path for post in page.items] == ['first']
+    assert page.pages == 2
+    assert index.categories.page('UX', 3, 1) is None
+    assert index.categories.page('missing', 1, 5).items == ()
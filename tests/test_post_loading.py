@@ -0,0 +1,60 @@
+import pytest
+
+from app.models.exceptions import PostError
+from app.services.config_service import ConfigService
+from app.services.markdown_service import MarkdownService
+from app.services.post_service import PostService
+
+POSTS = 20
+
+def make_config(posts_dir, workers):
+    config = ConfigService('does-not-exist.yml')
+    config.config['posts'].update(dir=str(posts_dir), load_workers=workers, load_chunk_size=3,
+                                  auto_reload=False)
+    config.config['markdown']['cache']['enabled'] = False
+    return config
+
+@pytest.fixture
+def posts_dir(tmp_path):
+    for i in range(POSTS):
+        (tmp_path / f'2024-01-{i + 1:02d}-post-{i}.markdown').write_text(
+            f'---\ntitle: Post {i}\ndate: 2024-01-{i + 1:02d}\ncategories: [c{i % 3}]\n---\n\n'
+            f'# Heading {i}\n\nSome *text* for post {i}.\n', encoding='utf-8')
+    (tmp_path / '2024-02-01-broken.markdown').write_text('---\ntitle: Broken\n---\nNo date\n',
+                                                          encoding='utf-8')
+    return tmp_path
+
+def load(posts_dir, workers, metadata_only=False):
+    config = make_config(posts_dir, workers)
+    return PostService(config, MarkdownService(config), metadata_only=metadata_only)
+
+def test_pool_loads_the_same_posts_as_serial(posts_dir):
+    serial = load(posts_dir, 0)
+    pooled = load(posts_dir, 2)
+    serial_posts = serial.get_all_posts()
+    pooled_posts = pooled.get_all_posts()
+    assert len(pooled_posts) == POSTS
+    assert [p.path for p in pooled_posts] == [p.path for p in serial_posts]
+    assert all(p.rendered for p in pooled_posts)
+    assert [p.html_content for p in pooled_posts] == [p.html_content for p in serial_posts]
+    assert [p.categories for p in pooled_posts] == [p.categories for p in serial_posts]
+
+def test_pool_reports_errors_per_file(posts_dir):
+    results = load(posts_dir, 2)._load_files(sorted(str(p) for p in posts_dir.iterdir()))
+    errors = [r for r in results if isinstance(r, PostError)]
+    assert len(results) == POSTS + 1
+    assert len(errors) == 1
+    assert 'Missing required fields' in str(errors[0])
+
+def test_metadata_only_pool_does_not_render(posts_dir):
+    service = load(posts_dir, 2, metadata_only=True)
+    posts = service.get_all_posts()
+    assert len(posts) == POSTS
+    assert not any(p.rendered for p in posts)
+    assert '<h1>Heading' in posts[0].html_content
+
+def test_load_workers_from_environment(monkeypatch):
+    monkeypatch.setenv('POST_LOAD_WORKERS', '4')
+    config = ConfigService('does-not-exist.yml')
+    config.load_from_env()
+    assert config.post_load_workers == 4
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from app.repositories.post_repository import PostRepository
+
+def write_post(posts_dir, name, title, day, body='Body'):
+    path = posts_dir / f'2024-01-{day:02d}-{name}.markdown'
+    path.write_text(f'---\ntitle: {title}\ndate: 2024-01-{day:02d}\n---\n\n{body}\n', encoding='utf-8')
+    return path
+
+def bump_mtime(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+@pytest.fixture
+def posts_dir(tmp_path):
+    write_post(tmp_path, 'one', 'One', 1)
+    write_post(tmp_path, 'two', 'Two', 2)
+    return tmp_path
+
+@pytest.fixture
+def repository(posts_dir):
+    loaded = []
+
+    def loader(file_paths):
+        loaded.append([os.path.basename(path) for path in file_paths])
+        return repository._load_files(file_paths)
+
+    repository = PostRepository(str(posts_dir), loader=loader)
+    repository.loaded = loaded
+    return repository
+
+def test_first_access_loads_every_file(repository):
+    assert [post.path for post in repository] == ['two', 'one']
+    assert repository.loaded == [['2024-01-01-one.markdown', '2024-01-02-two.markdown']]
+
+def test_refresh_without_changes_keeps_the_index(repository):
+    index = repository.get_index()
+    assert repository.refresh() is False
+    assert repository.get_index() is index
+    assert len(repository.loaded) == 1
+
+def test_refresh_reloads_only_changed_files(posts_dir, repository):
+    untouched = repository.get('one')
+    path = write_post(posts_dir, 'two', 'Two edited', 2, body='Longer body')
+    bump_mtime(path)
+    write_post(posts_dir, 'three', 'Three', 3)
+
+    assert repository.refresh() is True
+    assert repository.loaded[-1] == ['2024-01-02-two.markdown', '2024-01-03-three.markdown']
+    assert repository.get('two').title == 'Two edited'
+    assert repository.get('one') is untouched
+    assert [post.path for post in repository] == ['three', 'two', 'one']
+
+def test_refresh_drops_deleted_and_invalid_files(posts_dir, repository):
+    repository.get_index()
+    (posts_dir / '2024-01-01-one.markdown').unlink()
+    broken = posts_dir / '2024-01-02-two.markdown'
+    broken.write_text('---\ntitle: No date\n---\n', encoding='utf-8')
+    bump_mtime(broken)
+
+    assert repository.refresh() is True
+    assert len(repository) == 0
+    assert repository.get('one') is None
+
+    # An invalid file is not parsed again until it changes
+    assert repository.refresh() is False
+
+def test_auto_reload_checks_at_most_once_per_interval(posts_dir):
+    repository = PostRepository(str(posts_dir), auto_reload=True, check_interval=3600)
+    index = repository.get_index()
+    write_post(posts_dir, 'three', 'Three', 3)
+    assert repository.get_index() is index
+
+    repository.check_interval = 0
+    assert repository.get('three') is not None
+
+def test_reload_reads_every_file_again(repository):
+    repository.get_index()
+    repository.reload()
+    repository.get_index()
+    assert repository.loaded[-1] == ['2024-01-01-one.markdown', '2024-01-02-two.markdown']
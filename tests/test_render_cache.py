@@ -0,0 +1,93 @@
+import os
+import threading
+import time
+
+from app.services.config_service import ConfigService
+from app.services.markdown_service import PROJECT_ROOT, MarkdownService
+from app.services.render_cache import RenderCache
+
+def age(cache, source, seconds):
+    """Make an entry look as if it was last used the given number of seconds ago."""
+    path = cache._path(cache.key(source))
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+    return path
+
+def test_round_trip_and_fingerprint(tmp_path):
+    cache = RenderCache(str(tmp_path), fingerprint='a')
+    assert cache.get('# x') is None
+    cache.put('# x', '<h1>x</h1>')
+    assert cache.get('# x') == '<h1>x</h1>'
+    assert RenderCache(str(tmp_path), fingerprint='b').get('# x') is None
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=3000)
+    for i in range(3):
+        cache.put(f'source {i}', str(i) * 900)
+    age(cache, 'source 0', 7200)
+    age(cache, 'source 1', 9000)
+    age(cache, 'source 2', 8000)
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get('source 1') == '1' * 900
+    # Over budget: the oldest entries go until 90% of it is left
+    cache.put('source 3', '3' * 900)
+    assert cache.get('source 2') is None
+    assert cache.get('source 0') is not None
+    assert cache.get('source 1') is not None
+    assert cache.get('source 3') is not None
+
+def test_rewriting_an_entry_replaces_its_size(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=3000)
+    cache.put('a', 'a' * 900)
+    cache.put('b', 'b' * 900)
+    for _ in range(3):
+        cache.put('a', 'A' * 900)
+    assert cache._size == 1800
+    assert cache.get('b') is not None
+
+def test_recent_hits_do_not_touch_the_entry(tmp_path):
+    cache = RenderCache(str(tmp_path))
+    cache.put('recent', 'html')
+    path = age(cache, 'recent', 60)
+    mtime = os.stat(path).st_mtime
+    assert cache.get('recent') == 'html'
+    assert os.stat(path).st_mtime == mtime
+
+def test_stale_hits_touch_the_entry(tmp_path):
+    cache = RenderCache(str(tmp_path))
+    cache.put('old', 'html')
+    path = age(cache, 'old', RenderCache.TOUCH_INTERVAL * 2)
+    cache.get('old')
+    assert time.time() - os.stat(path).st_mtime < 60
+
+def test_clear(tmp_path):
+    cache = RenderCache(str(tmp_path))
+    cache.put('a', 'b')
+    cache.clear()
+    assert cache.get('a') is None
+
+def test_lazy_cache_is_created_once_across_threads(tmp_path):
+    config = ConfigService('does-not-exist.yml')
+    config.config['markdown']['cache']['dir'] = str(tmp_path)
+    service = MarkdownService(config)
+    barrier = threading.Barrier(16)
+    seen = []
+
+    def worker():
+        barrier.wait()
+        seen.append(service.cache)
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(seen) == 16
+    assert len({id(cache) for cache in seen}) == 1
+
+def test_relative_cache_dir_is_resolved_against_the_project_root(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = ConfigService('does-not-exist.yml')
+    assert not config.markdown_cache_dir.startswith('/')
+    cache = MarkdownService(config).cache
+    assert cache.cache_dir == PROJECT_ROOT / config.markdown_cache_dir
@@ -0,0 +1,87 @@
+import os
+import re
+
+import pytest
+
+from build_static import rewrite_paths
+
+GITHUB = 'https://github.com/lizsurette/lizsurette.github.io/raw/main/static/img/_posts/'
+
+PAGE = (
+    '<link href="/static/css/site.bundle.1a2b3c4d5e.css" rel="stylesheet">'
+    '<script src="/static/js/site.bundle.0f9e8d7c6b.js"></script>'
+    '<a href="/" class="active">About Me</a>'
+    '<a href="/writings/">Writings</a><a href="/games/snake/">Snake</a>'
+    '<a href="/posts/hello-world/">Hello</a><a href="page/2/">Older</a>'
+    '<a href="https://example.com/a/">Elsewhere</a><a href="#top">Top</a>'
+    f'<img src="{GITHUB}diagram.png"><img src="/static/img/_posts/photo.jpg">'
+    '<img src="/static/img/logo.5e4d3c2b1a.png" alt="Logo">'
+)
+
+INDEX = (
+    '<link href="/static/css/site.bundle.1a2b3c4d5e.css" rel="stylesheet">'
+    '<a href="/">Home</a><a href="/writings/">Writings</a><a href="/games/">Games</a>'
+    '<a href="/projects/">Projects</a><a href="/apps/">Apps</a>'
+    '<a href="/games/snake/">Snake</a><a href="/posts/hello-world.html">Hello</a>'
+    '<img src="/static/img/logo.5e4d3c2b1a.png">'
+)
+
+def baseline_static_paths(content, root):
+    """The regular expression chain the single-pass rewriter replaced."""
+    content = re.sub(r'src="https://github\.com/lizsurette/lizsurette\.github\.io/raw/main/static/img/_posts/([^"]+)"',
+                     r'src="' + root + r'static/img/_posts/\1"', content)
+    content = re.sub(r'src="/static/img/_posts/([^"]+)"', r'src="' + root + r'static/img/_posts/\1"', content)
+    content = re.sub(r'href="/', 'href="' + root, content)
+    content = re.sub(r'href="([^"]*)" class="active">About Me</a>',
+                     r'href="' + root + r'" class="active">About Me</a>', content)
+    content = re.sub(r'href="/games/([^"]+)"', r'href="/\1"', content)
+    content = re.sub(r'(href|src)="/', r'\1="' + root, content)
+    return re.sub(r'(href|src)="([^"]+)/"', r'\1="\2"', content)
+
+def baseline_index_paths(content):
+    """The replacements the single-pass index rewriter replaced."""
+    content = content.replace('href="/static/', 'href="static/').replace('src="/static/', 'src="static/')
+    for old, new in (('/', './'), ('/writings/', 'writings/'), ('/games/', 'games/'),
+                     ('/projects/', 'projects/'), ('/apps/', 'apps/')):
+        content = content.replace(f'href="{old}"', f'href="{new}"')
+    content = re.sub(r'href="/games/([^"]+)"', r'href="\1"', content)
+    content = re.sub(r'href="/posts/([^"]+)\.html"', lambda m: f'href="posts/{m.group(1)}"', content)
+    return content.replace('/">', '">')
+
+def page(depth):
+    """Path of a page's index.html the given number of directories below _site."""
+    return os.path.join('_site', *['dir'] * depth, 'index.html')
+
+@pytest.mark.parametrize('depth, root', [(1, '../../'), (2, '../../'), (3, '../../../')])
+def test_pages_match_the_baseline_rewrite(depth, root):
+    assert rewrite_paths(PAGE, page(depth)) == baseline_static_paths(PAGE, root)
+
+def test_depth_three_page():
+    html = rewrite_paths(PAGE, page(3))
+    assert '<a href="../../.." class="active">About Me</a>' in html
+    assert '<a href="../../../writings">' in html
+    assert '<a href="../../../games/snake">' in html
+    assert '<a href="page/2">' in html
+    assert '<a href="https://example.com/a">' in html
+    assert '<a href="#top">' in html
+    assert '<img src="../../../static/img/_posts/diagram.png">' in html
+    assert '<img src="../../../static/img/_posts/photo.jpg">' in html
+
+def test_fingerprinted_asset_urls_keep_their_names():
+    html = rewrite_paths(PAGE, page(2))
+    assert 'href="../../static/css/site.bundle.1a2b3c4d5e.css"' in html
+    assert 'src="../../static/js/site.bundle.0f9e8d7c6b.js"' in html
+    assert 'src="../../static/img/logo.5e4d3c2b1a.png"' in html
+
+def test_root_index_matches_the_baseline_rewrite():
+    html = rewrite_paths(INDEX, os.path.join('_site', 'index.html'))
+    assert html == baseline_index_paths(INDEX)
+    assert 'href="static/css/site.bundle.1a2b3c4d5e.css"' in html
+    assert '<a href=".">Home</a><a href="writings">' in html
+    assert '<a href="snake">Snake</a><a href="posts/hello-world">' in html
+
+def test_search_index_url_is_relative():
+    html = '<div class="search" data-index="/search/index/manifest.json">'
+    assert rewrite_paths(html, os.path.join('_site', 'writings', 'index.html')) == \
+        '<div class="search" data-index="../../search/index/manifest.json">'
+    assert rewrite_paths(html, page(3)) == '<div class="search" data-index="../../../search/index/manifest.json">'
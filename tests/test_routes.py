@@ -0,0 +1,27 @@
+import pytest
+
+from app import create_app
+
+@pytest.fixture(scope='module')
+def app():
+    return create_app()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+def test_writings_pages(app, client):
+    pages = app.post_repository.get_page(1, app.config['POSTS_PER_PAGE']).pages
+    assert client.get('/writings/').status_code == 200
+    assert client.get(f'/writings/page/{pages}/').status_code == (200 if pages > 1 else 301)
+    assert client.get(f'/writings/page/{pages + 1}/').status_code == 404
+
+def test_page_one_redirects_to_the_listing(client):
+    response = client.get('/writings/page/1/')
+    assert response.status_code == 301
+    assert response.headers['Location'].endswith('/writings/')
+
+def test_category_pages_past_the_end_are_not_found(client):
+    # Page 1 exists even for a category without posts
+    assert client.get('/category/no-such-category/').status_code == 200
+    assert client.get('/category/no-such-category/page/2/').status_code == 404
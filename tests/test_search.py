@@ -0,0 +1,93 @@
+from datetime import datetime
+
+from app.models.post import Post
+from app.services.search_service import SearchService
+
+def make_post(path, title, content, day=1):
+    return Post(path=path, title=title, date=datetime(2024, 1, day), categories=[], content=content)
+
+def paths(hits):
+    return [hit.post.path for hit in hits]
+
+def test_ranks_by_term_frequency_and_title():
+    service = SearchService()
+    service.update((
+        make_post('once', 'Other', 'kubernetes appears once among many other words here'),
+        make_post('often', 'Other', 'kubernetes kubernetes kubernetes cluster'),
+        make_post('title', 'Kubernetes notes', 'cluster setup'),
+        make_post('none', 'Unrelated', 'nothing to see'),
+    ))
+    hits = service.search('kubernetes', prefix=False)
+    assert set(paths(hits)) == {'once', 'often', 'title'}
+    assert paths(hits)[-1] == 'once'
+    assert hits[0].score >= hits[1].score >= hits[2].score
+
+def test_rarer_terms_weigh_more():
+    service = SearchService()
+    service.update((
+        make_post('common', 'A', 'openstack openstack'),
+        make_post('both', 'B', 'openstack horizon'),
+        make_post('other', 'C', 'openstack'),
+    ))
+    assert paths(service.search('openstack horizon', prefix=False))[0] == 'both'
+
+def test_last_word_matches_as_prefix():
+    service = SearchService()
+    service.update((make_post('a', 'A', 'dashboard design'), make_post('b', 'B', 'dash')))
+    assert set(paths(service.search('dash'))) == {'a', 'b'}
+    assert paths(service.search('dash'))[0] == 'b'
+    assert paths(service.search('dash', prefix=False)) == ['b']
+
+def test_prefix_matches_walk_only_the_best_postings():
+    service = SearchService()
+    posts = [make_post(f'p{i}', 'T', 'filler ' * i + 'prefixterm') for i in range(1, 11)]
+    service.update(tuple(posts))
+    service.MAX_PREFIX_POSTINGS = 3
+    # Shorter posts score higher for the same term frequency
+    assert paths(service.search('prefixt')) == ['p1', 'p2', 'p3']
+    assert len(service.search('prefixterm', prefix=False)) == 10
+
+def test_update_follows_snapshots():
+    service = SearchService()
+    first = make_post('a', 'A', 'alpha')
+    second = make_post('b', 'B', 'beta')
+    service.update((first, second))
+    assert paths(service.search('alpha')) == ['a']
+
+    edited = make_post('a', 'A', 'gamma')
+    service.update((edited, second))
+    assert service.search('alpha') == []
+    assert paths(service.search('gamma')) == ['a']
+
+    service.update((edited,))
+    assert len(service) == 1
+    assert service.search('beta') == []
+
+def test_update_with_the_same_snapshot_is_a_no_op():
+    service = SearchService()
+    snapshot = (make_post('a', 'A', 'alpha'),)
+    service.update(snapshot)
+    documents = dict(service._documents)
+    service.update(snapshot)
+    assert service._documents == documents
+
+def test_snippet_highlights_whole_words_and_escapes():
+    text = 'Some <b> markup & the search term, Search again, researcher not.'
+    snippet = SearchService.snippet(text, ['search'])
+    assert snippet.count('<mark>') == 2
+    assert '<mark>search</mark>' in snippet
+    assert '<mark>Search</mark>' in snippet
+    assert 'researcher' in snippet
+    assert '&lt;b&gt;' in snippet and '&amp;' in snippet
+
+def test_snippet_starts_near_the_first_match():
+    text = ' '.join(['word'] * 100) + ' needle ' + ' '.join(['word'] * 100)
+    snippet = SearchService.snippet(text, ['needle'], width=60)
+    assert snippet.startswith('&hellip;') and snippet.endswith('&hellip;')
+    assert '<mark>needle</mark>' in snippet
+
+def test_search_results_carry_snippets():
+    service = SearchService()
+    service.update((make_post('a', 'A', 'A post about **Horizon** panels'),))
+    hit = service.search('horizon')[0]
+    assert '<mark>Horizon</mark>' in hit.snippet
@@ -0,0 +1,112 @@
+import json
+import os
+from datetime import datetime
+
+from app.models.post import Post
+from app.services.search_index import FORMAT_VERSION, MANIFEST_NAME, build_search_index, write_search_index
+from app.services.search_service import SearchService
+
+RANKING = {'k1': 1.2, 'b': 0.75}
+
+DOCUMENTS = [('old', 'Old', '2024-01-01', 3), ('mid', 'Mid', '2024-01-02', 2), ('new', 'New', '2024-01-03', 4)]
+
+POSTINGS = {
+    'apple': {'old': 1, 'new': 2},
+    'apricot': {'mid': 1},
+    'banana': {'new': 1, 'mid': 3, 'old': 1},
+    'cherry': {'new': 1},
+}
+
+def load(files, name):
+    return json.loads(files[name].decode('utf-8'))
+
+def decode(flat):
+    """Turn (document number gap, frequency) pairs back into (number, frequency)."""
+    pairs, number = [], 0
+    for gap, frequency in zip(flat[::2], flat[1::2]):
+        number += gap
+        pairs.append((number, frequency))
+    return pairs
+
+def shard_of(manifest, term):
+    """Pick the shard with the longest prefix of a term, as the client does."""
+    return max((prefix for prefix, _ in manifest['shards'] if term.startswith(prefix)), key=len)
+
+def terms_by_shard(files):
+    manifest = load(files, MANIFEST_NAME)
+    return {prefix: load(files, name) for prefix, name in manifest['shards']}
+
+def test_manifest_points_at_documents_and_shards():
+    files = build_search_index(DOCUMENTS, POSTINGS, RANKING)
+    manifest = load(files, MANIFEST_NAME)
+    assert manifest['version'] == FORMAT_VERSION
+    assert manifest['ranking'] == RANKING
+    assert load(files, manifest['documents']) == [list(document) for document in DOCUMENTS]
+    assert set(files) == {MANIFEST_NAME, manifest['documents']} | {name for _, name in manifest['shards']}
+    # Everything fits the default budget
+    assert [prefix for prefix, _ in manifest['shards']] == ['']
+
+def test_postings_are_gap_encoded_in_document_order():
+    shard = terms_by_shard(build_search_index(DOCUMENTS, POSTINGS, RANKING))['']
+    assert decode(shard['banana']) == [(0, 1), (1, 3), (2, 1)]
+    assert decode(shard['apple']) == [(0, 1), (2, 2)]
+
+def test_terms_are_split_into_shards_by_prefix():
+    files = build_search_index(DOCUMENTS, POSTINGS, RANKING, shard_bytes=30)
+    manifest = load(files, MANIFEST_NAME)
+    shards = terms_by_shard(files)
+    # 'a' holds too much for one shard and 'ap' too, so it is split at the third character
+    assert [prefix for prefix, _ in manifest['shards']] == ['app', 'apr', 'b', 'c']
+    for term in POSTINGS:
+        assert term in shards[shard_of(manifest, term)]
+    assert sum(len(terms) for terms in shards.values()) == len(POSTINGS)
+
+def test_a_new_posting_only_changes_its_shard():
+    before = load(build_search_index(DOCUMENTS, POSTINGS, RANKING, shard_bytes=30), MANIFEST_NAME)
+    postings = dict(POSTINGS, cherry={'new': 1, 'mid': 1})
+    after = load(build_search_index(DOCUMENTS, postings, RANKING, shard_bytes=30), MANIFEST_NAME)
+    before_shards, after_shards = dict(before['shards']), dict(after['shards'])
+    assert {prefix for prefix in after_shards if after_shards[prefix] != before_shards.get(prefix)} == {'c'}
+    assert after['documents'] == before['documents']
+
+def test_output_is_byte_identical_across_runs():
+    reordered = {term: dict(reversed(list(POSTINGS[term].items()))) for term in reversed(list(POSTINGS))}
+    assert build_search_index(DOCUMENTS, POSTINGS, RANKING, 30) == build_search_index(DOCUMENTS, reordered, RANKING, 30)
+
+def make_posts():
+    return tuple(Post(path=f'post-{i}', title=f'Post {i}', date=datetime(2024, 1, i + 1), categories=[],
+                      content=f'word{i} shared text {"extra " * i}') for i in range(6))
+
+def test_export_is_byte_identical_across_services():
+    first, second = SearchService(), SearchService()
+    posts = make_posts()
+    first.update(posts)
+    second.update(tuple(reversed(posts)))
+    assert first.export_index(64) == second.export_index(64)
+
+def test_export_is_cached_until_the_next_snapshot():
+    service = SearchService()
+    posts = make_posts()
+    service.update(posts)
+    files = service.export_index(64)
+    assert service.export_index(64) is files
+    service.update(posts[:-1])
+    assert service.export_index(64) is not files
+
+def test_write_only_touches_changed_files(tmp_path):
+    output = tmp_path / 'index'
+    files = build_search_index(DOCUMENTS, POSTINGS, RANKING, shard_bytes=30)
+    assert write_search_index(files, str(output)) == (len(files), 0, 0)
+    assert {name: (output / name).read_bytes() for name in os.listdir(output)} == files
+
+    stamp = 1_000_000_000
+    for name in files:
+        os.utime(output / name, (stamp, stamp))
+    updated = build_search_index(DOCUMENTS, dict(POSTINGS, cherry={'new': 2}), RANKING, shard_bytes=30)
+    written, unchanged, removed = write_search_index(updated, str(output))
+    # The manifest and the new shard are written, and the old shard removed
+    assert (written, removed) == (2, 1)
+    assert unchanged == len(updated) - 2
+    assert sorted(os.listdir(output)) == sorted(updated)
+    kept = {name for name in files if updated.get(name) == files[name]}
+    assert all((output / name).stat().st_mtime == stamp for name in kept)
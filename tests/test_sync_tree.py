@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from app.utils.static import SyncStats, sync_tree
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / 'static'
+    write(root / 'css' / 'style.css', b'body {}')
+    write(root / 'js' / 'main.js', b'run()')
+    write(root / 'img' / 'logo.png', b'\x89PNG')
+    return root
+
+def test_first_sync_copies_everything(source, tmp_path):
+    target = tmp_path / 'site'
+    stats = sync_tree(str(source), str(target))
+    assert stats == SyncStats(copied=3, linked=0, unchanged=0, removed=0, bytes_copied=16)
+    assert (target / 'js' / 'main.js').read_bytes() == b'run()'
+    assert (target / 'css' / 'style.css').stat().st_mtime_ns == (source / 'css' / 'style.css').stat().st_mtime_ns
+
+def test_unchanged_tree_copies_nothing(source, tmp_path):
+    target = tmp_path / 'site'
+    sync_tree(str(source), str(target))
+    assert sync_tree(str(source), str(target)) == SyncStats(0, 0, 3, 0, 0)
+
+def test_only_changed_files_are_copied(source, tmp_path):
+    target = tmp_path / 'site'
+    sync_tree(str(source), str(target))
+    write(source / 'js' / 'main.js', b'run(1)')
+    stats = sync_tree(str(source), str(target))
+    assert (stats.copied, stats.unchanged, stats.bytes_copied) == (1, 2, 6)
+    assert (target / 'js' / 'main.js').read_bytes() == b'run(1)'
+
+def test_same_size_edits_are_caught_by_mtime(source, tmp_path):
+    target = tmp_path / 'site'
+    sync_tree(str(source), str(target))
+    path = write(source / 'js' / 'main.js', b'stop!')
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert sync_tree(str(source), str(target)).copied == 1
+    assert (target / 'js' / 'main.js').read_bytes() == b'stop!'
+
+def test_touched_files_with_the_same_contents_are_not_copied(source, tmp_path):
+    target = tmp_path / 'site'
+    sync_tree(str(source), str(target))
+    path = source / 'css' / 'style.css'
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert sync_tree(str(source), str(target)).unchanged == 3
+    assert (target / 'css' / 'style.css').stat().st_mtime_ns == path.stat().st_mtime_ns
+
+def test_deleted_files_and_directories_are_removed(source, tmp_path):
+    target = tmp_path / 'site'
+    sync_tree(str(source), str(target))
+    write(target / 'stray.txt', b'x')
+    (source / 'img' / 'logo.png').unlink()
+    (source / 'img').rmdir()
+    stats = sync_tree(str(source), str(target))
+    assert stats.removed == 2
+    assert not (target / 'img').exists()
+    assert not (target / 'stray.txt').exists()
+
+def test_keep_spares_files_missing_from_the_source(source, tmp_path):
+    target = tmp_path / 'site'
+    write(target / 'css' / 'style.1a2b3c4d5e.css', b'old')
+    write(target / 'gen' / 'bundle.js', b'old')
+    stats = sync_tree(str(source), str(target), keep=lambda path: path.startswith(('gen/', 'css/style.')))
+    assert stats.removed == 0
+    assert (target / 'css' / 'style.1a2b3c4d5e.css').exists()
+    assert (target / 'gen' / 'bundle.js').exists()
+
+def test_transforms_rewrite_contents(source, tmp_path):
+    target = tmp_path / 'site'
+    transforms = {'.css': lambda path, data: data.upper()}
+    assert sync_tree(str(source), str(target), transforms).copied == 3
+    assert (target / 'css' / 'style.css').read_bytes() == b'BODY {}'
+    assert sync_tree(str(source), str(target), transforms).unchanged == 3
+
+def test_links_share_the_source_files(source, tmp_path):
+    target = tmp_path / 'site'
+    stats = sync_tree(str(source), str(target), link=True)
+    assert stats.linked == 3
+    assert os.path.samefile(source / 'js' / 'main.js', target / 'js' / 'main.js')
+    assert sync_tree(str(source), str(target), link=True).unchanged == 3
+
+def test_files_replace_directories_and_the_reverse(source, tmp_path):
+    target = tmp_path / 'site'
+    write(target / 'js' / 'main.js' / 'inner', b'x')
+    write(target / 'css', b'not a directory')
+    sync_tree(str(source), str(target))
+    assert (target / 'js' / 'main.js').read_bytes() == b'run()'
+    assert (target / 'css' / 'style.css').read_bytes() == b'body {}'